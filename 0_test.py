@@ -1,14 +1,40 @@
-import subprocess
-import time
-from concurrent.futures import ThreadPoolExecutor
+from cmd_pool import CommandPool
+from vpn_load import STAND_IN_CLIENT_COMMAND, VpnLoadGenerator, VpnStandInServer, linear_ramp, summarize_sessions
 
 VPN_SERVER = "vpn.example.com"
 USERNAME = "testuser"
 PASSWORD = "testpass"
 NUM_CLIENTS = 50
+RAMP_SECONDS = 10
+HOLD_SECONDS = 10
+STARTUP_COMMANDS = ["ipconfig /all", "dir"]
+DIAGNOSTIC_COMMANDS = ["ipconfig /all", "netstat -an", "route print"]
 
-def run_cmd(cmd):
-    subprocess.run(cmd, shell=True, check=True)
+# Against the real headend, e.g.:
+#   VpnLoadGenerator(["openconnect", "--user={username}", "--passwd-on-stdin", "{server}"], VPN_SERVER,
+#                    USERNAME, PASSWORD, stdin_template="{password}\n", connected_regex=r"Established DTLS")
 
-run_cmd("ipconfig /all")
-run_cmd("dir")
+
+def run_cmd(*cmds, timeout=120):
+    """Run commands concurrently through the shell (like subprocess.run(shell=True), so built-ins such as
+    "dir" work), saving their output under cmd_output/; raise if any did not succeed."""
+    results = CommandPool(max_parallel=16, timeout=timeout, output_dir="cmd_output", shell=True).run(cmds)
+    failed = [f"{result['command']}: {result['error'] or result['status']}" for result in results
+              if result["status"] != "ok"]
+    if failed:
+        raise RuntimeError("; ".join(failed))
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        run_cmd(*STARTUP_COMMANDS)
+        headend = VpnStandInServer()
+        with headend.running() as port:
+            generator = VpnLoadGenerator(STAND_IN_CLIENT_COMMAND, "127.0.0.1", USERNAME + "{session}", PASSWORD,
+                                         port=port, hold_seconds=HOLD_SECONDS)
+            sessions = generator.run(linear_ramp(NUM_CLIENTS, RAMP_SECONDS))
+        print(summarize_sessions(sessions), f"peak sessions {headend.peak}")
+        run_cmd(*DIAGNOSTIC_COMMANDS)
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -1,8 +1,6 @@
-import telnetlib
-import time
-import datetime
+from console import ConsoleSession
 
-# Note :  Keep the below print commands to avoid errors due to timing issue
+# Every step waits for the device prompt instead of sleeping, so no timing prints are needed.
 
 
 HOST = "10.105.206.154"
@@ -16,78 +14,35 @@ PASSWORD = "lab"
 
 log_file = "asa_log_file.log"
 PORT_NUMBER = 2010
+LINE_NUMBER = PORT_NUMBER - 2000
 
-try:
-    print("[+] Connecting to Cisco ASA via Telnet...")
-    tn = telnetlib.Telnet(HOST, timeout=10)
-    tn.read_until(b"Username: ")
-    tn.write(USERNAME.encode("utf-8") + b"\n")
-
-    tn.read_until(b"Password: ")
-    tn.write(PASSWORD.encode("utf-8") + b"\n")
-    time.sleep(1)
-    # tn.write(b"enable\n")  # Enter enable mode
-    # time.sleep(1)
-    
-    # # If an enable password is required
-    # tn.read_until(b"Password: ")
-    # tn.write(ENABLE_PASSWORD.encode("utf-8") + b"\n")
-    
-    print("[+] Running 'clear line' command...")
-    tn.write(b"clear line 10\n")
-    tn.read_until("confirm".encode("utf-8"))
-    tn.write('y'.encode("utf-8"))
-    time.sleep(2)  
-    tn.write(b"exit\n")
-    tn.close()
-    print("[+] Connection closed.")
 
-    print("[+] Cleared line 10 successfully!!!!! ")
-    print("[+] Starting Login 2010 device ")
+def clear_line():
+    with ConsoleSession(HOST, timeout=10) as tn:
+        tn.login(USERNAME, PASSWORD)
+        print("[+] Running 'clear line' command...")
+        tn.clear_line(LINE_NUMBER)
+        tn.write_line("exit")
 
-    tn_asa = telnetlib.Telnet(HOST, PORT_NUMBER, timeout=10)
-    tn_asa.write('show version\n\t\t\n'.encode("utf-8"))
-    time.sleep(5)
-    
 
-    output = ""
-    chunk =""
-    chunk = tn_asa.read_until(b"<--- More --->", timeout=10).decode("utf-8")
-    output += chunk
-    while True:
-        chunk = tn_asa.read_until(b"<--- More --->", timeout=10).decode("utf-8")
-        if "<--- More --->" in chunk:
-            tn_asa.write(' '.encode("utf-8"))
-            time.sleep(2)
-        print("------------------------")
-        print(chunk)
-        output += chunk
-        if '#' in chunk:
-            break
+try:
+    print("[+] Connecting to Cisco ASA via Telnet...")
+    clear_line()
+    print("[+] Connection closed.")
 
-    print(output)
-    print(time.sleep(5))
+    print(f"[+] Cleared line {LINE_NUMBER} successfully!!!!! ")
+    print(f"[+] Starting Login {PORT_NUMBER} device ")
 
+    with ConsoleSession(HOST, PORT_NUMBER, timeout=10) as tn_asa:
+        tn_asa.wake()
+        # "terminal pager 0" when the ASA accepts it; otherwise pages are answered without waiting
+        tn_asa.disable_paging()
+        size = tn_asa.stream_command("show version", log_file)
 
-    with open(log_file, "w") as file:
-        file.write(output)
+    print(f"[+] Saved {size} bytes to {log_file}")
     
 
     print("[+] Clear AGAIn .....")
-    tn = telnetlib.Telnet(HOST, timeout=10)
-    tn.read_until(b"Username: ")
-    tn.write(USERNAME.encode("utf-8") + b"\n")
-
-    tn.read_until(b"Password: ")
-    tn.write(PASSWORD.encode("utf-8") + b"\n")
-    time.sleep(1)
-    print("[+] Running 'clear line' command...")
-    tn.write(b"clear line 10\n")
-    tn.read_until("confirm".encode("utf-8"))
-    tn.write('y'.encode("utf-8"))
-    time.sleep(2)  
-
-    tn.write(b"exit\n")
-    tn.close()
+    clear_line()
 except Exception as e:
     print(f"[-] Error: {e}")
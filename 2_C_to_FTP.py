@@ -1,9 +1,10 @@
-from ftplib import FTP
-import os 
+import os
+import posixpath
 
-FTP_HOST = "10.126.211.161"  
-FTP_USER = "admin"       
-FTP_PASS = "roZes123"       
+from ftp_sync import FtpSync
+from ftp_transfer import FtpConnectionPool, FtpTransferManager, load_ftp_credentials
+
+# Server and credentials come from FTP_HOST / FTP_USER / FTP_PASS (or ftp_config.json).
 
 # File to upload
 local_file_path = r"C:\Users\glenka\OneDrive - Cisco\Documents\Notepad++ Files\GTP.txt"
@@ -13,21 +14,20 @@ new_directory = "/test_data/glenka/GTP"
 
 
 # Connect to FTP Server
-ftp = FTP(FTP_HOST)
-ftp.login(FTP_USER, FTP_PASS)
 #--------------------
 try:
-    ftp.mkd(new_directory)
-    print(f"Directory '{new_directory}' created successfully.")
-
-    ftp.cwd(new_directory)
-
-    # Upload the file
-    with open(local_file_path, "rb") as file:
-        ftp.storbinary(f"STOR " + os.path.basename(local_file_path), file)
-
-    ftp.quit()
-
-    print("File uploaded successfully!")
+    with FtpConnectionPool(**load_ftp_credentials(), max_connections=1) as pool:
+        # The directory is created if missing (an existing one is fine); the file is
+        # only sent when it changed since the last run, resuming a partial upload.
+        sync = FtpSync(FtpTransferManager(pool), "ftp_manifest.json")
+        remote_path = posixpath.join(new_directory, os.path.basename(local_file_path))
+        result = sync.sync_files([(local_file_path, remote_path)])[0]
+
+    if result["status"] == "skipped":
+        print("File unchanged, nothing uploaded.")
+    elif result["status"] == "ok":
+        print("File uploaded successfully!")
+    else:
+        print(f"Error : {result['error']}")
 except Exception as e:
     print(f"Error : {e}")
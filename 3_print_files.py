@@ -1,30 +1,24 @@
-from ftplib import FTP
+from ftp_index import FtpTreeIndex
+from ftp_transfer import FtpConnectionPool, load_ftp_credentials
 
-# FTP Server details
-FTP_HOST = "10.126.211.161"  # Replace with your FTP server address
-FTP_USER = "admin"       # Replace with your FTP username
-FTP_PASS = "roZes123"      # Replace with your FTP password
+# FTP Server details: set FTP_HOST, FTP_USER and FTP_PASS (or put them in ftp_config.json)
 
 # Directory to list files from
 remote_directory = "/test_data/rajsamue"  # Use forward slashes for FTP paths
 
 try:
-    # Connect to FTP server
-    ftp = FTP(FTP_HOST)
-    ftp.login(FTP_USER, FTP_PASS)
+    with FtpConnectionPool(**load_ftp_credentials(), max_connections=8) as pool:
+        # Served from the local index; the tree is only re-walked once the cached walk is an hour old.
+        index = FtpTreeIndex(pool, "ftp_index.sqlite", ttl=3600)
+        index.refresh(remote_directory)
 
-    # Change to the specified directory
-    ftp.cwd(remote_directory)
-
-    # List files in the directory
-    files = ftp.nlst()  # Retrieves a list of filenames
-    # print("line 21")
-    print("Files in directory:", remote_directory)
-    for file in files:
-        print(file)
-
-    # Close FTP connection
-    ftp.quit()
+        print("Files in directory:", remote_directory)
+        for entry in index.listdir(remote_directory):
+            print(entry["name"])
+        # Subdirectories that could not be listed (a bad root raises from refresh instead).
+        for directory, error in index.errors:
+            print(f"Error: cannot list {directory}: {error}")
+        index.close()
 
 except Exception as e:
     print(f"Error: {e}")
@@ -45,20 +45,26 @@
 
 
 
-import os
+from fs_inventory import DIRECTORY, FILE, FilesystemInventory
 
 # Directory to list
 local_path = r"C:\Users\glenka\OneDrive - Cisco\Documents\Notepad++ Files"  # Change this to your folder path
 
-# List folders and files separately
-folders = [f for f in os.listdir(local_path) if os.path.isdir(os.path.join(local_path, f))]
-files = [f for f in os.listdir(local_path) if os.path.isfile(os.path.join(local_path, f))]
-
-print(f"📂 Folders in {local_path}:")
-# for folder in folders:
-#     print(f"  📁 {folder}")
-
-print(f"\n📄 Files in {local_path}:")
-for file in files:
-    print(f"  📄 {file}")
-
+# List folders and files separately, from a single scandir pass
+inventory = FilesystemInventory(with_stat=False)
+entries = inventory.scan(local_path, recursive=False)
+folders = [entry.name for entry in entries if entry.kind == DIRECTORY]
+files = [entry.name for entry in entries if entry.kind == FILE]
+
+# scan() does not raise for a missing or unreadable folder; it records it in errors.
+if inventory.errors:
+    for path, error in inventory.errors:
+        print(f"❌ Cannot read {path}: {error}")
+else:
+    print(f"📂 Folders in {local_path}:")
+    # for folder in folders:
+    #     print(f"  📁 {folder}")
+
+    print(f"\n📄 Files in {local_path}:")
+    for file in files:
+        print(f"  📄 {file}")
@@ -1,14 +1,14 @@
-from pathlib import Path
+from fs_inventory import DIRECTORY, FilesystemInventory
 
 # Path to Documents folder
-documents_path = Path(r"C:\Users\glenka\OneDrive - Cisco\Documents")  # Change to your username
+documents_path = r"C:\Users\glenka\OneDrive - Cisco\Documents"  # Change to your username
 
-# Get only folders
-folders = [f for f in documents_path.iterdir() if f.is_dir()]
+# Get only folders (type and mtime come from the directory listing; no per-folder stat call on Windows)
+entries = FilesystemInventory().scan(documents_path, recursive=False)
 
 # Get the most recently modified folder
-if folders:
-    last_folder = max(folders, key=lambda f: f.stat().st_mtime)  # Sort by modification time
+last_folder = FilesystemInventory.newest(entries, kind=DIRECTORY)
+if last_folder:
     print("Last modified folder:", last_folder.name)
 else:
     print("No folders found.")
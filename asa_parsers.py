@@ -0,0 +1,309 @@
+import functools
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from main import CsvFileWriter
+from showtech import CONN_COUNT_REGEX, ShowTechParser
+
+# FleetRunner output files are named "<inventory index>_<name>_<date>_<time>.log".
+FLEET_FILE_PREFIX_REGEX = re.compile(r"^\d{4}_")
+
+
+class Record:
+    """
+    Base class of the typed records produced by the ASA output parsers.
+
+    Subclasses declare their fields in ``__slots__``; records carry no
+    per-instance ``__dict__``, which keeps thousands of them cheap.
+    """
+
+    __slots__ = ("device",)
+    FIELDS: Tuple[str, ...] = ("device",)
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # Resolved once per class: base class fields first, then the subclass's own.
+        cls.FIELDS = tuple(field for klass in reversed(cls.__mro__) for field in getattr(klass, "__slots__", ()))
+
+    def __init__(self, **values: Any):
+        for field in self.FIELDS:
+            setattr(self, field, values.get(field))
+
+    @classmethod
+    def fieldnames(cls) -> List[str]:
+        """Return the record fields in declaration order, base class fields first."""
+        return list(cls.FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a dictionary, e.g. for CsvFileWriter."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS)
+        return f"{type(self).__name__}({values})"
+
+
+class VersionRecord(Record):
+    """Parsed "show version"."""
+
+    __slots__ = ("hostname", "software_version", "platform_version", "image", "uptime",
+                 "hardware", "ram_mb", "serial_number", "config_last_modified")
+
+
+class InterfaceRecord(Record):
+    """One interface of "show interface"."""
+
+    __slots__ = ("interface", "nameif", "status", "protocol", "mac_address", "mtu", "ip_address", "netmask",
+                 "packets_input", "bytes_input", "no_buffer", "packets_output", "bytes_output",
+                 "input_errors", "output_errors")
+
+
+class ConnCountRecord(Record):
+    """Parsed "show conn count"."""
+
+    __slots__ = ("in_use", "most_used")
+
+
+class FailoverRecord(Record):
+    """Parsed "show failover"."""
+
+    __slots__ = ("enabled", "unit", "lan_interface", "this_host_state", "other_host_state",
+                 "last_failover", "monitored_interfaces", "version_ours", "version_mate")
+
+
+# "show version"
+VERSION_REGEXES = {
+    "software_version": re.compile(r"Adaptive Security Appliance Software Version (\S+)"),
+    "platform_version": re.compile(r"(?:SSP|Firepower Extensible) Operating System Version (\S+)"),
+    "image": re.compile(r'System image file is "([^"]+)"'),
+    "uptime": re.compile(r"^(\S+) up (.+?)\s*$", re.M),
+    "hardware": re.compile(r"^Hardware:\s+([^,\n]+)", re.M),
+    "ram_mb": re.compile(r"^Hardware:.*?(\d+) MB RAM", re.M),
+    "serial_number": re.compile(r"^Serial Number: (\S+)", re.M),
+    "config_last_modified": re.compile(r"^Configuration last modified by .+? at (.+?)\s*$", re.M),
+}
+
+# "show interface"
+INTERFACE_HEADER_REGEX = re.compile(r'^Interface (\S+) "([^"]*)", is (.+?), line protocol is (\S+)', re.M)
+INTERFACE_FIELD_REGEXES = {
+    "mac_address": re.compile(r"MAC address ([\w.]+)"),
+    "mtu": re.compile(r"MTU (\d+)"),
+    "ip_address": re.compile(r"IP address ([\d.]+)"),
+    "netmask": re.compile(r"subnet mask ([\d.]+)"),
+    "packets_input": re.compile(r"(\d+) packets input"),
+    "bytes_input": re.compile(r"packets input, (\d+) bytes"),
+    "no_buffer": re.compile(r"(\d+) no buffer"),
+    "packets_output": re.compile(r"(\d+) packets output"),
+    "bytes_output": re.compile(r"packets output, (\d+) bytes"),
+    "input_errors": re.compile(r"(\d+) input errors"),
+    "output_errors": re.compile(r"(\d+) output errors"),
+}
+INTERFACE_INTEGER_FIELDS = frozenset(("mtu", "packets_input", "bytes_input", "no_buffer", "packets_output",
+                                      "bytes_output", "input_errors", "output_errors"))
+
+# "show failover"
+FAILOVER_REGEXES = {
+    "enabled": re.compile(r"^Failover (On|Off)", re.M),
+    "unit": re.compile(r"^Failover unit (\S+)", re.M),
+    "lan_interface": re.compile(r"^Failover LAN Interface: (.+?)\s*$", re.M),
+    "this_host_state": re.compile(r"This host: \S+ - (.+?)\s*$", re.M),
+    "other_host_state": re.compile(r"Other host: \S+ - (.+?)\s*$", re.M),
+    "last_failover": re.compile(r"^Last Failover at: (.+?)\s*$", re.M),
+    "monitored_interfaces": re.compile(r"^Monitored Interfaces (\d+) of", re.M),
+    "version_ours": re.compile(r"^Version: Ours (\S+?),", re.M),
+    "version_mate": re.compile(r"^Version: Ours \S+, Mate (\S+)", re.M),
+}
+
+
+def _search(regex: "re.Pattern[str]", text: str, group: int = 1) -> Optional[str]:
+    match = regex.search(text)
+    return match.group(group) if match else None
+
+
+def parse_version(text: str) -> List[VersionRecord]:
+    """Parse "show version" into a single VersionRecord."""
+    values: Dict[str, Any] = {field: _search(regex, text) for field, regex in VERSION_REGEXES.items()}
+    uptime = VERSION_REGEXES["uptime"].search(text)
+    if uptime:
+        values["hostname"], values["uptime"] = uptime.group(1), uptime.group(2)
+    if values["ram_mb"] is not None:
+        values["ram_mb"] = int(values["ram_mb"])
+    return [VersionRecord(**values)]
+
+
+def parse_interfaces(text: str) -> List[InterfaceRecord]:
+    """Parse "show interface" into one InterfaceRecord per interface."""
+    records = []
+    headers = list(INTERFACE_HEADER_REGEX.finditer(text))
+    for index, header in enumerate(headers):
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+        # Hardware counters only; "Traffic Statistics" repeats the same counter names per nameif.
+        body = text[header.end():end].split("Traffic Statistics", 1)[0]
+        values: Dict[str, Any] = {
+            "interface": header.group(1),
+            "nameif": header.group(2),
+            "status": header.group(3),
+            "protocol": header.group(4),
+        }
+        for field, regex in INTERFACE_FIELD_REGEXES.items():
+            value = _search(regex, body)
+            values[field] = int(value) if value is not None and field in INTERFACE_INTEGER_FIELDS else value
+        records.append(InterfaceRecord(**values))
+    return records
+
+
+def parse_conn_count(text: str) -> List[ConnCountRecord]:
+    """Parse "show conn count"."""
+    match = CONN_COUNT_REGEX.search(text)
+    if not match:
+        return []
+    return [ConnCountRecord(in_use=int(match.group(1)), most_used=int(match.group(2)))]
+
+
+def parse_failover(text: str) -> List[FailoverRecord]:
+    """Parse "show failover"."""
+    values: Dict[str, Any] = {field: _search(regex, text) for field, regex in FAILOVER_REGEXES.items()}
+    if values["enabled"] is None:
+        return []
+    values["enabled"] = values["enabled"] == "On"
+    if values["monitored_interfaces"] is not None:
+        values["monitored_interfaces"] = int(values["monitored_interfaces"])
+    return [FailoverRecord(**values)]
+
+
+Parser = Callable[[str], List[Record]]
+
+# Normalised command -> (parser, record type). Filled by register_parser().
+PARSERS: Dict[str, Tuple[Parser, Type[Record]]] = {}
+
+
+def register_parser(record_type: Type[Record], *commands: str) -> Callable[[Parser], Parser]:
+    """
+    Register a parser for one or more command spellings.
+
+    Example:
+        >>> @register_parser(ConnCountRecord, "show xlate count")
+        ... def parse_xlate_count(text): ...
+    """
+    def decorator(parser: Parser) -> Parser:
+        for command in commands:
+            PARSERS[normalize_command(command)] = (parser, record_type)
+        resolve_parser.cache_clear()
+        return parser
+    return decorator
+
+
+def normalize_command(command: str) -> str:
+    """Lower-case a command, collapse whitespace and drop any "| include ..." filter."""
+    return " ".join(command.split("|", 1)[0].lower().split())
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_parser(command: str) -> Optional[Tuple[Parser, Type[Record]]]:
+    """
+    Find the parser for a command.
+
+    Exact (normalised) names are a single dictionary lookup; abbreviations such
+    as "sh int" are matched word by word against the registered names. Results
+    are memoised, so dispatching thousands of outputs costs one lookup each.
+    """
+    normalized = normalize_command(command)
+    entry = PARSERS.get(normalized)
+    if entry is not None:
+        return entry
+    words = normalized.split()
+    for name, entry in PARSERS.items():
+        parts = name.split()
+        if len(parts) == len(words) and all(part.startswith(word) for part, word in zip(parts, words)):
+            return entry
+    return None
+
+
+register_parser(VersionRecord, "show version")(parse_version)
+register_parser(InterfaceRecord, "show interface", "show interfaces")(parse_interfaces)
+register_parser(ConnCountRecord, "show conn count")(parse_conn_count)
+register_parser(FailoverRecord, "show failover")(parse_failover)
+
+
+def parse_output(command: str, text: str, device: str = "") -> List[Record]:
+    """
+    Parse one command output with the registered parser.
+
+    Args:
+        command (str): The command that produced the output.
+        text (str): The raw output.
+        device (str): Device name stored on each record.
+
+    Returns:
+        List[Record]: Parsed records; empty if no parser is registered for the command.
+    """
+    entry = resolve_parser(command)
+    if entry is None:
+        return []
+    records = entry[0](text)
+    for record in records:
+        record.device = device
+    return records
+
+
+def parse_outputs(outputs: Iterable[Tuple[str, str, str]]) -> Dict[Type[Record], List[Record]]:
+    """
+    Parse many (device, command, output) triples, grouping the records by type.
+
+    Returns:
+        Dict[Type[Record], List[Record]]: Record type -> records, in input order.
+    """
+    grouped: Dict[Type[Record], List[Record]] = {}
+    for device, command, text in outputs:
+        for record in parse_output(command, text, device):
+            grouped.setdefault(type(record), []).append(record)
+    return grouped
+
+
+def parse_collection_files(file_paths: Iterable[str]) -> Dict[Type[Record], List[Record]]:
+    """
+    Parse FleetRunner output files and show-tech captures.
+
+    Both use "------ show <command> ------" section headers; the device name is
+    taken from the capture banner or, failing that, the file name. Text before
+    the first header is "show version" in a show-tech capture; in FleetRunner
+    files it is blank and skipped.
+    """
+    def triples() -> Iterable[Tuple[str, str, str]]:
+        for file_path in file_paths:
+            parser = ShowTechParser(file_path)
+            sections = list(parser.iter_sections(list(PARSERS)))
+            name = os.path.basename(file_path).rsplit("_", 2)[0]
+            device = parser.device or FLEET_FILE_PREFIX_REGEX.sub("", name)
+            for command, text in sections:
+                if command == parser.PREAMBLE_COMMAND and not text.strip():
+                    continue
+                yield device, command.split("#", 1)[0], text
+
+    return parse_outputs(triples())
+
+
+def write_records_csv(records: List[Record], file_path: str) -> None:
+    """
+    Write records of one type to a CSV file with CsvFileWriter.
+
+    Raises:
+        ValueError: If records is empty.
+    """
+    if not records:
+        raise ValueError("No records provided for CSV writing.")
+    CsvFileWriter(file_path).write([record.to_dict() for record in records], include_header=True,
+                                   fieldnames=type(records[0]).fieldnames())
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        grouped = parse_collection_files(["693110730-show_tech_Malathi.txt"])
+        for record_type, records in grouped.items():
+            file_name = f"{record_type.__name__}.csv"
+            write_records_csv(records, file_name)
+            print(f"[+] {len(records)} {record_type.__name__} rows written to {file_name}")
+    except Exception as e:
+        print(f"[-] Error: {e}")
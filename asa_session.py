@@ -0,0 +1,302 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+DeviceKey = Tuple[str, int, str, str]
+
+
+def device_key(device: Dict[str, Any]) -> DeviceKey:
+    """
+    Return the pool key of a netmiko device dictionary.
+
+    Sessions are shared only between dictionaries that point at the same
+    host, port, user and device type.
+    """
+    return (device["host"], int(device.get("port", 22)), device.get("username", ""), device.get("device_type", ""))
+
+
+class PooledSession:
+    """
+    A live, authenticated (and optionally enabled) CLI session owned by a DeviceSessionPool.
+
+    Attributes:
+    -----------
+    connection : Any
+        The netmiko connection object.
+    created : float
+        time.monotonic() when the session was opened; the pool retires it after max_session_age.
+    last_used : float
+        time.monotonic() when the session was last released back to the pool.
+    last_checked : float
+        time.monotonic() of the last successful health check.
+    commands_sent : int
+        Number of commands multiplexed over this session by send_command()/send_commands().
+    """
+
+    __slots__ = ("connection", "created", "last_used", "last_checked", "commands_sent")
+
+    def __init__(self, connection: Any):
+        now = time.monotonic()
+        self.connection = connection
+        self.created = now
+        self.last_used = now
+        self.last_checked = now
+        self.commands_sent = 0
+
+
+class DeviceSessionPool:
+    """
+    A thread-safe pool of persistent netmiko sessions, keyed per device.
+
+    SSH handshake, AAA authentication and "enable" happen once per session
+    instead of once per command. Idle sessions are reused, health-checked with
+    ``is_alive()`` when they have been idle longer than ``health_check_interval``,
+    and closed once idle longer than ``idle_timeout`` (or, with
+    ``max_session_age``, once they have been open that long). At most
+    ``max_sessions_per_device`` sessions are opened to any one device; extra
+    callers wait for a session to be released.
+
+    Example:
+        >>> asa = {"device_type": "cisco_asa", "host": "192.168.1.1",
+        ...        "username": "admin", "password": "password", "secret": "password"}
+        >>> with DeviceSessionPool() as pool:
+        ...     outputs = pool.send_commands(asa, ["show version", "show failover"])
+    """
+
+    def __init__(
+        self,
+        connect_handler: Optional[Callable[..., Any]] = None,
+        max_sessions_per_device: int = 2,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 60.0,
+        enable: bool = True,
+        max_session_age: Optional[float] = None,
+    ):
+        """
+        Initialize the DeviceSessionPool.
+
+        Args:
+            connect_handler (callable, optional): Factory called with the device dictionary
+                to open a session. Defaults to netmiko.ConnectHandler.
+            max_sessions_per_device (int): Upper bound of concurrent sessions per device. Default is 2.
+            idle_timeout (float): Seconds after which an unused session is closed. Default is 300.
+            health_check_interval (float): Idle seconds after which a session is probed with
+                is_alive() before being handed out. Default is 60.
+            enable (bool): Enter privileged mode when the device dictionary has a "secret". Default is True.
+            max_session_age (float, optional): Seconds after which a session is closed instead of
+                being reused, e.g. to stay under a device's session lifetime. Never by default.
+        """
+        if connect_handler is None:
+            from netmiko import ConnectHandler
+            connect_handler = ConnectHandler
+        if max_sessions_per_device < 1:
+            raise ValueError("max_sessions_per_device must be at least 1.")
+        self.connect_handler = connect_handler
+        self.max_sessions_per_device = max_sessions_per_device
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.enable = enable
+        self.max_session_age = max_session_age
+        self._lock = threading.Lock()
+        self._idle: Dict[DeviceKey, List[PooledSession]] = {}
+        self._slots: Dict[DeviceKey, threading.BoundedSemaphore] = {}
+        self._closed = False
+
+    def __enter__(self) -> "DeviceSessionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close_all()
+
+    def _slot(self, key: DeviceKey) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = threading.BoundedSemaphore(self.max_sessions_per_device)
+            return slot
+
+    def _open(self, device: Dict[str, Any]) -> PooledSession:
+        connection = self.connect_handler(**device)
+        if self.enable and device.get("secret"):
+            connection.enable()
+        return PooledSession(connection)
+
+    @staticmethod
+    def _disconnect(session: PooledSession) -> None:
+        try:
+            session.connection.disconnect()
+        except Exception:
+            pass  # The transport is already gone; nothing left to release.
+
+    def _is_expired(self, session: PooledSession, now: float) -> bool:
+        return self.max_session_age is not None and now - session.created > self.max_session_age
+
+    def _is_healthy(self, session: PooledSession) -> bool:
+        now = time.monotonic()
+        if now - session.last_checked < self.health_check_interval:
+            return True
+        is_alive = getattr(session.connection, "is_alive", None)
+        try:
+            healthy = is_alive() if is_alive is not None else True
+        except Exception:
+            healthy = False
+        if healthy:
+            session.last_checked = now
+        return healthy
+
+    def _take_idle(self, key: DeviceKey) -> Optional[PooledSession]:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                sessions = self._idle.get(key)
+                if not sessions:
+                    return None
+                session = sessions.pop()  # Most recently used first: it is the least likely to be stale.
+            if now - session.last_used <= self.idle_timeout and not self._is_expired(session, now) \
+                    and self._is_healthy(session):
+                return session
+            self._disconnect(session)
+
+    @contextmanager
+    def _checkout(self, device: Dict[str, Any], timeout: Optional[float] = None) -> Iterator[PooledSession]:
+        if self._closed:
+            raise RuntimeError("DeviceSessionPool is closed.")
+        key = device_key(device)
+        slot = self._slot(key)
+        if not slot.acquire(timeout=timeout if timeout is not None else -1):
+            raise TimeoutError(f"Timed out waiting for a session to {key[0]}:{key[1]}")
+        try:
+            pooled = self._take_idle(key) or self._open(device)
+            try:
+                yield pooled
+            except BaseException:
+                self._disconnect(pooled)
+                raise
+            pooled.last_used = time.monotonic()
+            with self._lock:
+                retire = self._closed or self._is_expired(pooled, pooled.last_used)
+                if not retire:
+                    self._idle.setdefault(key, []).append(pooled)
+            if retire:
+                self._disconnect(pooled)
+        finally:
+            slot.release()
+
+    @contextmanager
+    def session(self, device: Dict[str, Any], timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Borrow a ready session for a device.
+
+        Args:
+            device (dict): netmiko device dictionary ("device_type", "host", "username", ...).
+            timeout (float, optional): Seconds to wait for a free session slot. Waits forever by default.
+
+        Yields:
+            Any: The netmiko connection. It goes back to the pool when the block exits,
+            or is discarded if the block raised or the session is older than max_session_age.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+            TimeoutError: If no session slot frees up within timeout.
+        """
+        with self._checkout(device, timeout) as pooled:
+            yield pooled.connection
+
+    def has_idle_session(self, device: Dict[str, Any]) -> bool:
+        """
+        Return True if an idle, not yet expired session to the device is waiting in the pool.
+
+        Lets callers run optional commands only when that costs no new login.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return any(now - session.last_used <= self.idle_timeout and not self._is_expired(session, now)
+                       for session in self._idle.get(device_key(device), ()))
+
+    def send_command(self, device: Dict[str, Any], command: str, **kwargs) -> str:
+        """
+        Run one command on a pooled session.
+
+        Args:
+            device (dict): netmiko device dictionary.
+            command (str): The CLI command, e.g. "show version".
+            **kwargs: Passed through to netmiko's send_command.
+
+        Returns:
+            str: The command output.
+        """
+        return self.send_commands(device, [command], **kwargs)[command]
+
+    def send_commands(self, device: Dict[str, Any], commands: List[str], **kwargs) -> Dict[str, str]:
+        """
+        Run several commands back to back over a single pooled session.
+
+        Args:
+            device (dict): netmiko device dictionary.
+            commands (list): CLI commands to run, in order.
+            **kwargs: Passed through to netmiko's send_command.
+
+        Returns:
+            Dict[str, str]: command -> output.
+        """
+        outputs = {}
+        with self._checkout(device) as pooled:
+            for command in commands:
+                outputs[command] = pooled.connection.send_command(command, **kwargs)
+                pooled.commands_sent += 1
+        return outputs
+
+    def close_idle(self) -> int:
+        """
+        Close sessions that have been idle longer than idle_timeout or are older than max_session_age.
+
+        Returns:
+            int: Number of sessions closed.
+        """
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for key, sessions in self._idle.items():
+                keep = [s for s in sessions if now - s.last_used <= self.idle_timeout and not self._is_expired(s, now)]
+                expired.extend(s for s in sessions if s not in keep)
+                self._idle[key] = keep
+        for session in expired:
+            self._disconnect(session)
+        return len(expired)
+
+    def close_all(self) -> None:
+        """
+        Close every idle session and refuse new checkouts. Sessions still in use
+        are closed when they are released.
+        """
+        with self._lock:
+            self._closed = True
+            sessions = [s for group in self._idle.values() for s in group]
+            self._idle.clear()
+        for session in sessions:
+            self._disconnect(session)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the number of idle sessions per device ("host:port").
+        """
+        with self._lock:
+            return {f"{key[0]}:{key[1]}": len(sessions) for key, sessions in self._idle.items() if sessions}
+
+
+# Example Usage
+if __name__ == "__main__":
+    asa = {
+        "device_type": "cisco_asa",
+        "host": "192.168.1.1",  # Replace with ASA IP
+        "username": "admin",
+        "password": "password",  # Replace with actual password
+        "secret": "enable_password",  # Replace if enable mode is needed
+    }
+    try:
+        with DeviceSessionPool() as pool:
+            for command, output in pool.send_commands(asa, ["show version", "show failover"]).items():
+                print(f"[+] {command}\n{output}")
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -0,0 +1,254 @@
+import asyncio
+import random
+import re
+from typing import Dict, List, Optional, Tuple
+
+from server_thread import ServerThread
+from showtech import ShowTechParser
+from terminal_server import TELNET_COMMAND_REGEX
+
+INVALID_INPUT = "ERROR: % Invalid input detected at '^' marker.\r\n"
+MORE_PROMPT = b"<--- More --->"
+# What the ASA prints to blank out the pager prompt once a key is pressed.
+MORE_ERASE = b"\r              \r"
+CLEAR_LINE_REGEX = re.compile(r"^clear line (\d+)$")
+
+
+class SimulatedAsa:
+    """
+    A local stand-in for an ASA console / telnet CLI or a terminal server, served with asyncio.
+
+    Command outputs are replayed from a dictionary, typically loaded from a
+    show-tech capture so "show version", "show interface", ... return real
+    data. The simulator emulates the Username:/Password: login, "enable",
+    "terminal pager", the "<--- More --->" pager, and the "[confirm]" prompt of
+    "clear line", and delays every response by ``latency`` plus up to
+    ``jitter`` seconds so collection code can be benchmarked without hardware.
+
+    Example:
+        >>> device = SimulatedAsa.from_show_tech("693110730-show_tech_Malathi.txt", latency=0.005)
+        >>> with SimulatorThread([device]) as ports:
+        ...     print("ASA listening on port", ports[0])
+    """
+
+    def __init__(
+        self,
+        outputs: Dict[str, str],
+        hostname: str = "ciscoasa",
+        username: Optional[str] = "admin",
+        password: str = "admin",
+        enable_password: Optional[str] = "admin",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        page_lines: int = 24,
+    ):
+        """
+        Initialize the SimulatedAsa.
+
+        Args:
+            outputs (dict): Command -> output text replayed by the CLI.
+            hostname (str): Name shown in the prompt. Default is "ciscoasa".
+            username (str, optional): Login username; None skips the login prompts (console line).
+            password (str): Login password. Default is "admin".
+            enable_password (str, optional): Enable password; None starts sessions in privileged mode.
+            latency (float): Seconds added before every response. Default is 0.
+            jitter (float): Up to this many extra random seconds per response. Default is 0.
+            page_lines (int): Lines per pager page until "terminal pager 0". Default is 24.
+        """
+        self.outputs = {command.strip(): text for command, text in outputs.items()}
+        self.hostname = hostname
+        self.username = username
+        self.password = password
+        self.enable_password = enable_password
+        self.latency = latency
+        self.jitter = jitter
+        self.page_lines = page_lines
+        self.commands_served = 0
+        self.cleared_lines: List[int] = []
+
+    @classmethod
+    def from_show_tech(cls, file_path: str, **kwargs) -> "SimulatedAsa":
+        """
+        Build a simulator that replays every section of a show-tech capture.
+
+        Args:
+            file_path (str): Path to the show-tech capture.
+            **kwargs: Passed to the constructor.
+
+        Returns:
+            SimulatedAsa: The simulator; the hostname defaults to the capture's device name.
+        """
+        parser = ShowTechParser(file_path)
+        outputs = {command: text.strip("\n") for command, text in parser.iter_sections() if "#" not in command}
+        kwargs.setdefault("hostname", parser.device or "ciscoasa")
+        return cls(outputs, **kwargs)
+
+    async def _delay(self) -> None:
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+
+    async def _read_key(self, reader: asyncio.StreamReader) -> bytes:
+        while True:
+            key = await reader.read(1)
+            if not key:
+                raise EOFError()
+            if key == b"\xff":
+                await reader.read(2)  # client telnet negotiation, ignored
+                continue
+            if key != b"\x00":
+                return key
+
+    async def _read_line(self, reader: asyncio.StreamReader) -> str:
+        line = await reader.readuntil(b"\n")
+        line = TELNET_COMMAND_REGEX.sub(b"", line)
+        return line.replace(b"\x00", b"").decode("utf-8", "replace").strip()
+
+    async def _page(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, text: str, paging: int) -> None:
+        lines = text.replace("\r\n", "\n").split("\n")
+        if not paging:
+            writer.write("\r\n".join(lines).encode() + b"\r\n")
+            return
+        for start in range(0, len(lines), paging):
+            writer.write("\r\n".join(lines[start:start + paging]).encode() + b"\r\n")
+            if start + paging >= len(lines):
+                return
+            writer.write(MORE_PROMPT)
+            await writer.drain()
+            key = await self._read_key(reader)
+            writer.write(MORE_ERASE)
+            if key in (b"q", b"Q"):
+                return
+
+    async def _login(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        if self.username is None:
+            return True
+        for _ in range(3):
+            writer.write(b"\r\nUser Access Verification\r\n\r\nUsername: ")
+            await writer.drain()
+            username = await self._read_line(reader)
+            writer.write(b"Password: ")
+            await writer.drain()
+            password = await self._read_line(reader)
+            await self._delay()
+            if username == self.username and password == self.password:
+                return True
+            writer.write(b"\r\n% Login invalid\r\n")
+        return False
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one client connection until it exits or disconnects.
+        """
+        privileged = self.enable_password is None
+        paging = self.page_lines
+        try:
+            if not await self._login(reader, writer):
+                return
+            while True:
+                writer.write(f"{self.hostname}{'#' if privileged else '>'} ".encode())
+                await writer.drain()
+                command = await self._read_line(reader)
+                if not command:
+                    writer.write(b"\r\n")
+                    continue
+                writer.write(command.encode() + b"\r\n")  # echo
+                await self._delay()
+                self.commands_served += 1
+
+                if command in ("exit", "quit", "logout"):
+                    return
+                if command == "enable":
+                    if not privileged:
+                        writer.write(b"Password: ")
+                        await writer.drain()
+                        privileged = await self._read_line(reader) == self.enable_password
+                        if not privileged:
+                            writer.write(b"Invalid password\r\n")
+                    continue
+                if command == "disable":
+                    privileged = self.enable_password is None
+                    continue
+                if command.startswith(("terminal pager", "terminal length")):
+                    paging = int(command.rsplit(None, 1)[-1]) if command[-1].isdigit() else paging
+                    continue
+                if command.startswith("terminal "):
+                    continue
+                clear = CLEAR_LINE_REGEX.match(command)
+                if clear:
+                    writer.write(b"[confirm]")
+                    await writer.drain()
+                    if await self._read_key(reader) in (b"y", b"Y", b"\r", b"\n"):
+                        self.cleared_lines.append(int(clear.group(1)))
+                        writer.write(b" [OK]\r\n")
+                    else:
+                        writer.write(b"\r\n")
+                    continue
+                output = self.outputs.get(command)
+                if output is None or (not privileged and not command.startswith("show")):
+                    writer.write(INVALID_INPUT.encode())
+                    continue
+                await self._page(reader, writer, output, paging)
+        except (EOFError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class SimulatorThread(ServerThread):
+    """
+    Run one or more simulated devices in a background event loop.
+
+    Each device gets its own listening port on 127.0.0.1 (an ephemeral one
+    unless ports are given), so synchronous code such as ConsoleSession or
+    netmiko can connect to it from the main thread.
+
+    Example:
+        >>> with SimulatorThread([SimulatedAsa({"show clock": "16:35:36 UTC"})]) as ports:
+        ...     print(ports)
+    """
+
+    def __init__(self, devices: List[SimulatedAsa], host: str = "127.0.0.1", ports: Optional[List[int]] = None):
+        """
+        Initialize the SimulatorThread.
+
+        Args:
+            devices (list): The simulated devices to serve.
+            host (str): Listening address. Default is "127.0.0.1".
+            ports (list, optional): One port per device; 0 or omitted picks a free port.
+        """
+        self.devices = devices
+        self.host = host
+        self.requested_ports = ports or [0] * len(devices)
+        super().__init__([(device.handle, host, port) for device, port in zip(devices, self.requested_ports)])
+
+    def start(self) -> List[int]:
+        """
+        Start serving and return the bound ports, in device order.
+
+        Raises:
+            OSError: If a port cannot be bound.
+        """
+        return super().start()
+
+
+async def serve_forever(devices_with_ports: List[Tuple[SimulatedAsa, int]], host: str = "127.0.0.1") -> None:
+    """
+    Serve simulated devices on fixed ports until cancelled (for manual testing with a telnet client).
+    """
+    servers = [await asyncio.start_server(device.handle, host, port) for device, port in devices_with_ports]
+    await asyncio.gather(*(server.serve_forever() for server in servers))
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        asa = SimulatedAsa.from_show_tech("693110730-show_tech_Malathi.txt", username="lab", password="lab",
+                                          latency=0.01, jitter=0.005)
+        terminal_server = SimulatedAsa({}, hostname="terminal-server", username="lab", password="lab",
+                                       enable_password=None)
+        print("[+] Simulated terminal server on 127.0.0.1:2023, ASA console on 127.0.0.1:2010")
+        asyncio.run(serve_forever([(terminal_server, 2023), (asa, 2010)]))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -0,0 +1,151 @@
+import argparse
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from asa_simulator import SimulatedAsa, SimulatorThread
+from console import ConsoleSession
+from main import JsonFileWriter
+from terminal_server import AsyncTelnetSession
+
+USERNAME = "lab"
+PASSWORD = "lab"
+ENABLE_PASSWORD = "lab"
+COMMANDS = ["show version", "show clock", "show conn count", "show memory", "show interface"]
+
+
+def summarize(name: str, latencies: List[float], elapsed: float) -> Dict[str, Any]:
+    """
+    Build the result row of one benchmark run.
+
+    Args:
+        name (str): Collection path being measured.
+        latencies (list): Per-command latencies in seconds.
+        elapsed (float): Wall-clock seconds of the whole run.
+
+    Returns:
+        Dict[str, Any]: commands, seconds, commands_per_sec, p50_ms and p99_ms.
+    """
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(int(round(p / 100.0 * (len(ordered) - 1))), len(ordered) - 1)] * 1000.0
+
+    return {
+        "path": name,
+        "commands": len(ordered),
+        "seconds": round(elapsed, 3),
+        "commands_per_sec": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(50), 2),
+        "p99_ms": round(percentile(99), 2),
+    }
+
+
+def bench_console(port: int, rounds: int, disable_paging: bool) -> Dict[str, Any]:
+    """Time ConsoleSession (blocking telnetlib) over one session."""
+    latencies = []
+    started = time.perf_counter()
+    with ConsoleSession("127.0.0.1", port) as console:
+        console.login(USERNAME, PASSWORD, ENABLE_PASSWORD, disable_paging=disable_paging)
+        for _ in range(rounds):
+            for command in COMMANDS:
+                before = time.perf_counter()
+                console.send_command(command)
+                latencies.append(time.perf_counter() - before)
+    name = "telnet console" + ("" if disable_paging else " (paged)")
+    return summarize(name, latencies, time.perf_counter() - started)
+
+
+def bench_async(port: int, rounds: int, sessions: int) -> Dict[str, Any]:
+    """Time AsyncTelnetSession with several concurrent sessions in one event loop."""
+    latencies: List[float] = []
+
+    async def worker() -> None:
+        async with AsyncTelnetSession("127.0.0.1", port) as session:
+            await session.login(USERNAME, PASSWORD, ENABLE_PASSWORD)
+            for _ in range(rounds):
+                for command in COMMANDS:
+                    before = time.perf_counter()
+                    await session.send_command(command)
+                    latencies.append(time.perf_counter() - before)
+
+    async def main() -> None:
+        await asyncio.gather(*(worker() for _ in range(sessions)))
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    return summarize(f"asyncio telnet x{sessions}", latencies, time.perf_counter() - started)
+
+
+def bench_netmiko(port: int, rounds: int) -> Optional[Dict[str, Any]]:
+    """Time netmiko's telnet driver against the simulator, if netmiko is installed."""
+    try:
+        from netmiko import ConnectHandler
+    except ImportError:
+        return None
+    latencies = []
+    started = time.perf_counter()
+    connection = ConnectHandler(device_type="cisco_ios_telnet", host="127.0.0.1", port=port,
+                                username=USERNAME, password=PASSWORD, secret=ENABLE_PASSWORD)
+    try:
+        connection.enable()
+        for _ in range(rounds):
+            for command in COMMANDS:
+                before = time.perf_counter()
+                connection.send_command(command)
+                latencies.append(time.perf_counter() - before)
+    finally:
+        connection.disconnect()
+    return summarize("netmiko telnet", latencies, time.perf_counter() - started)
+
+
+def run_benchmarks(show_tech: str, rounds: int, sessions: int, latency: float, jitter: float) -> List[Dict[str, Any]]:
+    """
+    Start a simulated ASA and measure every collection path against it.
+
+    Returns:
+        List[Dict[str, Any]]: One summarize() row per collection path.
+    """
+    device = SimulatedAsa.from_show_tech(show_tech, username=USERNAME, password=PASSWORD,
+                                         enable_password=ENABLE_PASSWORD, latency=latency, jitter=jitter)
+    benchmarks: List[Callable[[int], Optional[Dict[str, Any]]]] = [
+        lambda port: bench_console(port, rounds, disable_paging=False),
+        lambda port: bench_console(port, rounds, disable_paging=True),
+        lambda port: bench_async(port, rounds, sessions),
+        lambda port: bench_netmiko(port, rounds),
+    ]
+    results = []
+    with SimulatorThread([device]) as ports:
+        for benchmark in benchmarks:
+            try:
+                result = benchmark(ports[0])
+            except Exception as e:
+                print(f"[-] Benchmark failed: {e}")
+                continue
+            if result is not None:
+                results.append(result)
+    return results
+
+
+# Example Usage
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description="Benchmark ASA collection paths against a local simulator.")
+    arguments.add_argument("--show-tech", default="693110730-show_tech_Malathi.txt")
+    arguments.add_argument("--rounds", type=int, default=5)
+    arguments.add_argument("--sessions", type=int, default=8)
+    arguments.add_argument("--latency", type=float, default=0.005)
+    arguments.add_argument("--jitter", type=float, default=0.002)
+    arguments.add_argument("--json", help="Also write the results to this JSON file.")
+    options = arguments.parse_args()
+
+    try:
+        rows = run_benchmarks(options.show_tech, options.rounds, options.sessions, options.latency, options.jitter)
+        for row in rows:
+            print(f"{row['path']:<24} {row['commands']:>6} cmds {row['commands_per_sec']:>9} cmd/s "
+                  f"p50 {row['p50_ms']:>8} ms  p99 {row['p99_ms']:>8} ms")
+        if options.json:
+            JsonFileWriter(options.json).write(rows)
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -0,0 +1,148 @@
+import argparse
+import ftplib
+import os
+import secrets
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+from ftp_server import FtpServerThread, LocalFtpServer
+from ftp_transfer import FtpConnectionPool, FtpTransferManager, summarize_transfers
+from main import JsonFileWriter
+
+
+def make_dataset(directory: str, small_files: int, small_size: int, large_files: int,
+                 large_size: int) -> List[Tuple[str, str]]:
+    """
+    Write a test data set of random files.
+
+    Returns:
+        List[Tuple[str, str]]: (local path, remote path) pairs under "/bench".
+    """
+    pairs = []
+    for index in range(small_files):
+        pairs.append((os.path.join(directory, f"small_{index:05d}.bin"), f"/bench/small/small_{index:05d}.bin"))
+    for index in range(large_files):
+        pairs.append((os.path.join(directory, f"large_{index:03d}.bin"), f"/bench/large/large_{index:03d}.bin"))
+    for local_path, _ in pairs:
+        size = large_size if "large_" in local_path else small_size
+        with open(local_path, "wb") as file:
+            file.write(os.urandom(size))
+    return pairs
+
+
+def bench_connect(port: int, username: str, password: str, rounds: int) -> Dict[str, Any]:
+    """Time connect + login + quit, the cost a per-file connection pays every time."""
+    latencies = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        ftp = ftplib.FTP()
+        ftp.connect("127.0.0.1", port)
+        ftp.login(username, password)
+        latencies.append(time.perf_counter() - started)
+        ftp.quit()
+    latencies.sort()
+    return {"mode": "connect+login", "files": rounds, "connect_ms": round(latencies[len(latencies) // 2] * 1000, 2)}
+
+
+def bench_single(port: int, username: str, password: str, pairs: List[Tuple[str, str]],
+                 blocksize: int) -> Dict[str, Any]:
+    """Upload like 2_C_to_FTP.py: a new connection and login for every file."""
+    results = []
+    started = time.perf_counter()
+    for local_path, remote_path in pairs:
+        before = time.perf_counter()
+        ftp = ftplib.FTP()
+        ftp.connect("127.0.0.1", port)
+        ftp.login(username, password)
+        for directory in ("/bench", os.path.dirname(remote_path)):
+            try:
+                ftp.mkd(directory)
+            except ftplib.error_perm:
+                pass
+        with open(local_path, "rb") as file:
+            ftp.storbinary(f"STOR {remote_path}", file, blocksize=blocksize)
+            moved = file.tell()
+        ftp.quit()
+        results.append({"status": "ok", "bytes": moved, "seconds": time.perf_counter() - before})
+    row = {"mode": "single"}
+    row.update(summarize_transfers(results, time.perf_counter() - started))
+    return row
+
+
+def bench_pooled(port: int, username: str, password: str, pairs: List[Tuple[str, str]], blocksize: int,
+                 connections: int) -> Dict[str, Any]:
+    """Upload through FtpTransferManager over a pool of logged-in connections."""
+    with FtpConnectionPool("127.0.0.1", username, password, port=port, max_connections=connections) as pool:
+        manager = FtpTransferManager(pool, blocksize=blocksize)
+        started = time.perf_counter()
+        results = manager.upload_files(pairs)
+        row = {"mode": "pooled" if connections == 1 else f"parallel x{connections}"}
+        row.update(summarize_transfers(results, time.perf_counter() - started))
+        row["connections_opened"] = pool.connections_opened
+    return row
+
+
+def run_benchmarks(small_files: int, small_size: int, large_files: int, large_size: int, connections: int,
+                   latency: float, blocksize: int) -> List[Dict[str, Any]]:
+    """
+    Start a LocalFtpServer and upload the same data set single, pooled and in parallel.
+
+    The server runs with throwaway credentials generated per run.
+
+    Returns:
+        List[Dict[str, Any]]: One result row per mode.
+    """
+    username, password = "bench", secrets.token_urlsafe(16)
+    workspace = tempfile.mkdtemp(prefix="bench_ftp_")
+    try:
+        source = os.path.join(workspace, "source")
+        os.makedirs(source)
+        pairs = make_dataset(source, small_files, small_size, large_files, large_size)
+        server = LocalFtpServer(os.path.join(workspace, "root"), users={username: password}, latency=latency)
+        rows = []
+        with FtpServerThread(server) as port:
+            benchmarks = [
+                lambda: bench_connect(port, username, password, rounds=20),
+                lambda: bench_single(port, username, password, pairs, blocksize),
+                lambda: bench_pooled(port, username, password, pairs, blocksize, connections=1),
+                lambda: bench_pooled(port, username, password, pairs, blocksize, connections=connections),
+            ]
+            for benchmark in benchmarks:
+                shutil.rmtree(os.path.join(server.root, "bench"), ignore_errors=True)
+                try:
+                    rows.append(benchmark())
+                except Exception as e:
+                    print(f"[-] Benchmark failed: {e}")
+        return rows
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+# Example Usage
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description="Benchmark FTP upload modes against a local FTP server.")
+    arguments.add_argument("--small-files", type=int, default=500)
+    arguments.add_argument("--small-size", type=int, default=16 * 1024)
+    arguments.add_argument("--large-files", type=int, default=4)
+    arguments.add_argument("--large-size", type=int, default=32 * 1024 * 1024)
+    arguments.add_argument("--connections", type=int, default=8)
+    arguments.add_argument("--latency", type=float, default=0.002, help="Seconds added to every control reply.")
+    arguments.add_argument("--blocksize", type=int, default=1024 * 1024)
+    arguments.add_argument("--json", help="Also write the results to this JSON file.")
+    options = arguments.parse_args()
+
+    try:
+        rows = run_benchmarks(options.small_files, options.small_size, options.large_files, options.large_size,
+                              options.connections, options.latency, options.blocksize)
+        for row in rows:
+            if "connect_ms" in row:
+                print(f"{row['mode']:<16} {row['connect_ms']:>9} ms per connection")
+            else:
+                print(f"{row['mode']:<16} {row['files']:>6} files {row['seconds']:>8}s "
+                      f"{row['mb_per_sec']:>9} MB/s {row['files_per_sec']:>9} files/s")
+        if options.json:
+            JsonFileWriter(options.json).write(rows)
+    except Exception as e:
+        print(f"[-] Error: {e}")
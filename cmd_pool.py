@@ -0,0 +1,208 @@
+import argparse
+import asyncio
+import os
+import re
+import shlex
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from main import CsvFileWriter
+
+READ_CHUNK = 64 * 1024
+RESULT_FIELDS = ["index", "command", "status", "exit_code", "seconds", "stdout_bytes", "stderr_bytes",
+                 "stdout", "stderr", "error"]
+
+Command = Union[str, Sequence[str]]
+
+
+def output_name(index: int, command: Command) -> str:
+    """Return a file-system safe base name for a command's output files, e.g. "0003_ipconfig_all"."""
+    text = command if isinstance(command, str) else " ".join(command)
+    return f"{index:04d}_{re.sub(r'[^A-Za-z0-9.-]+', '_', text).strip('_')[:60]}"
+
+
+class CommandPool:
+    """
+    Run many commands concurrently as asyncio subprocesses.
+
+    At most ``max_parallel`` commands run at a time. Each command's stdout
+    and stderr are streamed in chunks to their own files as the command
+    produces them, so long or chatty commands never pile up in memory and
+    partial output survives a timeout. A command still running after
+    ``timeout`` seconds is terminated (then killed). Every command yields a
+    result with its exit code, wall-clock time and output file paths.
+
+    Commands given as a string are split with shlex and run without a shell.
+    Shell built-ins (e.g. "dir" on Windows) need ``shell=True``.
+
+    Example:
+        >>> pool = CommandPool(max_parallel=16, timeout=120, output_dir="diag_output")
+        >>> results = pool.run(["ipconfig /all", "netstat -an", ["ping", "-n", "4", "10.0.0.1"]])
+        >>> failed = [result for result in results if result["status"] != "ok"]
+    """
+
+    def __init__(self, max_parallel: int = 8, timeout: Optional[float] = 300.0, output_dir: str = "cmd_output",
+                 shell: bool = False, cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None):
+        """
+        Initialize the CommandPool.
+
+        Args:
+            max_parallel (int): Commands running at the same time. Default is 8.
+            timeout (float, optional): Seconds each command may run; None for no limit. Default is 300.
+            output_dir (str): Directory for the per-command .stdout/.stderr files. Default is "cmd_output".
+            shell (bool): Run string commands through the system shell. Default is False.
+            cwd (str, optional): Working directory of the commands.
+            env (dict, optional): Environment of the commands (default: inherited).
+        """
+        self.max_parallel = max_parallel
+        self.timeout = timeout
+        self.output_dir = output_dir
+        self.shell = shell
+        self.cwd = cwd
+        self.env = env
+
+    def _argv(self, command: Command) -> List[str]:
+        argv = list(command) if not isinstance(command, str) else shlex.split(command, posix=os.name != "nt")
+        if not argv or not str(argv[0]).strip():
+            raise ValueError("Empty command")
+        return argv
+
+    async def _spawn(self, command: Command) -> asyncio.subprocess.Process:
+        pipes = {"stdin": asyncio.subprocess.DEVNULL, "stdout": asyncio.subprocess.PIPE,
+                 "stderr": asyncio.subprocess.PIPE, "cwd": self.cwd, "env": self.env}
+        if self.shell:
+            text = command if isinstance(command, str) else " ".join(shlex.quote(part) for part in command)
+            if not text.strip():
+                raise ValueError("Empty command")
+            return await asyncio.create_subprocess_shell(text, **pipes)
+        return await asyncio.create_subprocess_exec(*self._argv(command), **pipes)
+
+    @staticmethod
+    async def _pump(stream: asyncio.StreamReader, path: str) -> int:
+        written = 0
+        with open(path, "wb") as file:
+            while True:
+                chunk = await stream.read(READ_CHUNK)
+                if not chunk:
+                    return written
+                file.write(chunk)
+                file.flush()
+                written += len(chunk)
+
+    @staticmethod
+    async def _stop(process: asyncio.subprocess.Process, grace: float = 5.0) -> None:
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), grace)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    async def execute(self, index: int, command: Command,
+                      semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """
+        Run one command, streaming its output to <output_dir>/<name>.stdout and .stderr.
+
+        Returns:
+            Dict[str, Any]: index, command, status ("ok", "failed" for a non-zero exit, "timeout" or
+            "error" if it is empty or could not be started), exit_code, seconds, stdout_bytes, stderr_bytes,
+            stdout and stderr (file paths) and error.
+        """
+        base = os.path.join(self.output_dir, output_name(index, command))
+        text = command if isinstance(command, str) else " ".join(command)
+        result: Dict[str, Any] = {"index": index, "command": text, "status": "error", "exit_code": None,
+                                  "seconds": 0.0, "stdout_bytes": 0, "stderr_bytes": 0, "stdout": base + ".stdout",
+                                  "stderr": base + ".stderr", "error": ""}
+        async with semaphore or asyncio.Semaphore(1):
+            started = time.perf_counter()
+            try:
+                process = await self._spawn(command)
+            except (OSError, ValueError) as e:
+                result.update(error=str(e), stdout="", stderr="")
+                return result
+            pumps = asyncio.gather(self._pump(process.stdout, result["stdout"]),
+                                   self._pump(process.stderr, result["stderr"]))
+            try:
+                try:
+                    await asyncio.wait_for(asyncio.shield(asyncio.gather(process.wait(), pumps)), self.timeout)
+                    result["status"] = "ok" if process.returncode == 0 else "failed"
+                except asyncio.TimeoutError:
+                    result["status"] = "timeout"
+                    result["error"] = f"Timed out after {self.timeout}s"
+                    await self._stop(process)
+                try:
+                    result["stdout_bytes"], result["stderr_bytes"] = await asyncio.wait_for(pumps, 5)
+                except (asyncio.TimeoutError, OSError) as e:
+                    # A grandchild that inherited the pipes can keep them open after the command is gone.
+                    result["error"] = result["error"] or f"Output incomplete: {e!r}"
+            finally:
+                if process.returncode is None:
+                    # Cancelled (or failed) while waiting: the shielded wait would otherwise outlive us.
+                    await asyncio.shield(self._stop(process))
+                if not pumps.done():
+                    pumps.cancel()
+            result["exit_code"] = process.returncode
+            result["seconds"] = round(time.perf_counter() - started, 3)
+        return result
+
+    async def run_async(self, commands: Sequence[Command]) -> List[Dict[str, Any]]:
+        """
+        Run all commands, at most max_parallel at a time.
+
+        Returns:
+            List[Dict[str, Any]]: execute() results, in command order.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        return list(await asyncio.gather(*(self.execute(index, command, semaphore)
+                                           for index, command in enumerate(commands))))
+
+    def run(self, commands: Sequence[Command]) -> List[Dict[str, Any]]:
+        """
+        Blocking wrapper around run_async().
+        """
+        return asyncio.run(self.run_async(commands))
+
+
+def write_results_csv(results: List[Dict[str, Any]], file_path: str) -> None:
+    """
+    Write command results to a CSV file with CsvFileWriter.
+
+    Raises:
+        ValueError: If results is empty.
+    """
+    if not results:
+        raise ValueError("No command results provided for CSV writing.")
+    CsvFileWriter(file_path).write(results, include_header=True, fieldnames=RESULT_FIELDS)
+
+
+# Example Usage
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description="Run commands concurrently, saving each one's output.")
+    arguments.add_argument("commands", nargs="*", help="Commands to run; default reads --file.")
+    arguments.add_argument("--file", help="Text file with one command per line.")
+    arguments.add_argument("--parallel", type=int, default=8)
+    arguments.add_argument("--timeout", type=float, default=300.0)
+    arguments.add_argument("--output-dir", default="cmd_output")
+    arguments.add_argument("--shell", action="store_true", help="Run commands through the system shell.")
+    arguments.add_argument("--csv", help="Also write the results to this CSV file.")
+    options = arguments.parse_args()
+
+    try:
+        commands = list(options.commands)
+        if options.file:
+            with open(options.file, encoding="utf-8") as file:
+                commands.extend(line.strip() for line in file if line.strip() and not line.startswith("#"))
+        pool = CommandPool(options.parallel, options.timeout, options.output_dir, shell=options.shell)
+        started = time.perf_counter()
+        results = pool.run(commands)
+        for result in results:
+            print(f"[{'+' if result['status'] == 'ok' else '-'}] {result['command']}: {result['status']} "
+                  f"(exit {result['exit_code']}, {result['seconds']}s) {result['error']}".rstrip())
+        print(f"{len(results)} commands in {time.perf_counter() - started:.2f}s")
+        if options.csv:
+            write_results_csv(results, options.csv)
+    except Exception as e:
+        print(f"[-] Error: {e}")
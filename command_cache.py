@@ -0,0 +1,330 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from asa_session import DeviceSessionPool, device_key
+
+# First matching pattern wins; commands that match none are never cached.
+DEFAULT_TTLS: List[Tuple[str, float]] = [
+    (r"^show (running-config|startup-config|inventory|module|version|hardware)\b", 3600.0),
+    (r"^show (interface|conn|xlate|cpu|memory|blocks|traffic|asp|logging|process|clock)\b", 30.0),
+    (r"^show ", 300.0),
+]
+
+# "Configuration last modified by enable_1 at 16:18:29.939 UTC Tue Feb 15 2022"
+FINGERPRINT_COMMAND = "show version | include Configuration last modified"
+
+
+class CommandCache:
+    """
+    An on-disk cache of show command outputs with per-command-class TTLs and LRU eviction.
+
+    Entries are keyed by (device, command, config fingerprint) and stored in a
+    SQLite file, so once a configuration change has been seen (a new
+    fingerprint) outputs collected under the old configuration are no longer
+    served, and cached data survives between runs. get() can also be limited
+    to entries stored within ``max_age`` seconds. When the cache grows beyond
+    ``max_bytes`` the least recently read entries are evicted first.
+
+    Example:
+        >>> cache = CommandCache("command_cache.sqlite", max_bytes=256 * 1024 * 1024)
+        >>> cache.put("10.0.0.1:22", "show version", "abc123", output)
+        >>> cache.get("10.0.0.1:22", "show version", "abc123")
+    """
+
+    def __init__(self, db_path: str = "command_cache.sqlite", max_bytes: int = 256 * 1024 * 1024,
+                 ttls: Optional[List[Tuple[str, float]]] = None):
+        """
+        Initialize the CommandCache.
+
+        Args:
+            db_path (str): Path of the SQLite cache file. Default is "command_cache.sqlite".
+            max_bytes (int): Total output size kept before LRU eviction. Default is 256 MB.
+            ttls (list, optional): (regex, seconds) pairs, first match wins. Defaults to DEFAULT_TTLS.
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls or DEFAULT_TTLS)]
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        try:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, device TEXT, command TEXT, fingerprint TEXT,"
+                " expires REAL, last_access REAL, size INTEGER, output TEXT, stored REAL)"
+            )
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(entries)")}
+            if "stored" not in columns:  # Caches written before entries recorded their store time.
+                self._db.execute("ALTER TABLE entries ADD COLUMN stored REAL")
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)")
+            self._db.commit()
+        except sqlite3.Error as e:
+            raise IOError(f"Cannot open command cache: {db_path}. Details: {e}") from e
+
+    def close(self) -> None:
+        """
+        Close the cache file.
+        """
+        with self._lock:
+            self._db.close()
+
+    def ttl(self, command: str) -> Optional[float]:
+        """
+        Return the TTL in seconds for a command, or None if it must not be cached.
+        """
+        command = " ".join(command.split())
+        for pattern, ttl in self.ttls:
+            if pattern.search(command):
+                return ttl
+        return None
+
+    @staticmethod
+    def _key(device: str, command: str, fingerprint: str) -> str:
+        raw = "\x00".join((device, " ".join(command.split()), fingerprint))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, device: str, command: str, fingerprint: str = "", max_age: Optional[float] = None) -> Optional[str]:
+        """
+        Return a cached output, or None if it is missing or expired.
+
+        Args:
+            device (str): Device identifier, e.g. "host:port".
+            command (str): The show command.
+            fingerprint (str): Configuration fingerprint the output was collected under.
+            max_age (float, optional): Also treat outputs stored more than this many seconds ago as missing.
+
+        Returns:
+            Optional[str]: The cached output.
+        """
+        key = self._key(device, command, fingerprint)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT output, expires, stored FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] < now or (max_age is not None and (row[2] or 0.0) < now - max_age):
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, device: str, command: str, fingerprint: str, output: str) -> bool:
+        """
+        Store an output if the command is cacheable.
+
+        Returns:
+            bool: True if the output was stored.
+        """
+        ttl = self.ttl(command)
+        if ttl is None:
+            return False
+        now = time.time()
+        size = len(output.encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, device, command, fingerprint, expires, last_access, size, output,"
+                " stored) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._key(device, command, fingerprint), device, command, fingerprint, now + ttl, now, size, output,
+                 now),
+            )
+            self._evict(now)
+            self._db.commit()
+        return True
+
+    def _evict(self, now: float) -> None:
+        self._db.execute("DELETE FROM entries WHERE expires < ?", (now,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def invalidate(self, device: str) -> int:
+        """
+        Drop every cached output of a device.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        with self._lock:
+            removed = self._db.execute("DELETE FROM entries WHERE device = ?", (device,)).rowcount
+            self._db.commit()
+        return removed
+
+    def latest_fingerprint(self, device: str) -> Optional[str]:
+        """
+        Return the fingerprint of the most recently stored unexpired output of a device, or None.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fingerprint FROM entries WHERE device = ? AND expires >= ? ORDER BY last_access DESC LIMIT 1",
+                (device, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return entry count, stored bytes, and the hit/miss counters of this process.
+        """
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses}
+
+
+class CachedCommandRunner:
+    """
+    A DeviceSessionPool front end that answers idempotent show commands from a CommandCache.
+
+    Outputs are cached per configuration fingerprint (the output of a cheap
+    fingerprint command). A fingerprint read within ``fingerprint_ttl``
+    seconds is trusted; an older one is re-read over an idle pooled session
+    when there is one. Without an open session, cached outputs are served
+    under the last known fingerprint only if they were stored within
+    ``fingerprint_ttl`` seconds, so a device whose commands were all
+    collected recently is not logged into; otherwise the fingerprint is read
+    first. A configuration change is therefore noticed after at most
+    ``fingerprint_ttl`` seconds, not after each command's own TTL. It exposes
+    the pool's send_command/send_commands/close_all methods, so it can be
+    handed to FleetRunner as its ``pool``.
+
+    Example:
+        >>> runner = CachedCommandRunner(DeviceSessionPool(), CommandCache())
+        >>> runner.send_commands(asa, ["show version", "show inventory"])
+    """
+    def __init__(self, pool: DeviceSessionPool, cache: CommandCache,
+                 fingerprint_command: Optional[str] = FINGERPRINT_COMMAND, fingerprint_ttl: float = 60.0):
+        """
+        Initialize the CachedCommandRunner.
+
+        Args:
+            pool (DeviceSessionPool): Pool used for cache misses.
+            cache (CommandCache): The output cache.
+            fingerprint_command (str, optional): Command whose output identifies the configuration
+                revision. None disables fingerprinting (outputs expire by TTL only).
+            fingerprint_ttl (float): Seconds a fingerprint is trusted before it is re-read. Default is 60.
+        """
+        self.pool = pool
+        self.cache = cache
+        self.fingerprint_command = fingerprint_command
+        self.fingerprint_ttl = fingerprint_ttl
+        self._fingerprints: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def device_id(device: Dict[str, Any]) -> str:
+        """Return the cache identifier of a netmiko device dictionary ("host:port")."""
+        host, port, _, _ = device_key(device)
+        return f"{host}:{port}"
+
+    def _remember(self, device_id: str, output: str) -> str:
+        fingerprint = hashlib.sha256(output.strip().encode("utf-8")).hexdigest()[:16]
+        with self._lock:
+            self._fingerprints[device_id] = (fingerprint, time.monotonic())
+        return fingerprint
+
+    def fingerprint(self, device: Dict[str, Any]) -> str:
+        """
+        Return the configuration fingerprint of a device, querying it at most once per fingerprint_ttl.
+
+        Unlike send_commands(), this opens a session if none is pooled.
+        """
+        if self.fingerprint_command is None:
+            return ""
+        device_id = self.device_id(device)
+        with self._lock:
+            cached = self._fingerprints.get(device_id)
+        if cached is not None and time.monotonic() - cached[1] < self.fingerprint_ttl:
+            return cached[0]
+        return self._remember(device_id, self.pool.send_command(device, self.fingerprint_command))
+
+    def _known_fingerprint(self, device: Dict[str, Any], device_id: str) -> Tuple[Optional[str], bool]:
+        # (fingerprint or None if never seen, whether it is current), without opening a session.
+        if self.fingerprint_command is None:
+            return "", True
+        with self._lock:
+            cached = self._fingerprints.get(device_id)
+        if cached is not None and time.monotonic() - cached[1] < self.fingerprint_ttl:
+            return cached[0], True
+        if self.pool.has_idle_session(device):
+            return self.fingerprint(device), True
+        return (cached[0] if cached is not None else self.cache.latest_fingerprint(device_id)), False
+
+    def _lookup(self, device_id: str, commands: List[str], fingerprint: str,
+                max_age: Optional[float] = None) -> Dict[str, str]:
+        outputs = {}
+        for command in commands:
+            if self.cache.ttl(command) is not None:
+                cached = self.cache.get(device_id, command, fingerprint, max_age)
+                if cached is not None:
+                    outputs[command] = cached
+        return outputs
+
+    def send_commands(self, device: Dict[str, Any], commands: List[str], **kwargs) -> Dict[str, str]:
+        """
+        Return outputs for all commands, querying the device only for cache misses.
+
+        Returns:
+            Dict[str, str]: command -> output.
+        """
+        device_id = self.device_id(device)
+        fingerprint, current = self._known_fingerprint(device, device_id)
+        if not current:
+            # Outputs stored within fingerprint_ttl are as fresh as a fingerprint read that long ago.
+            if fingerprint is not None:
+                outputs = self._lookup(device_id, commands, fingerprint, self.fingerprint_ttl)
+                if len(outputs) == len(set(commands)):
+                    return {command: outputs[command] for command in commands}
+            fingerprint = self.fingerprint(device)  # The session it opens is reused for the misses.
+        outputs = self._lookup(device_id, commands, fingerprint)
+        misses = [command for command in dict.fromkeys(commands) if command not in outputs]
+        if misses:
+            fresh = self.pool.send_commands(device, misses, **kwargs)
+            for command, output in fresh.items():
+                self.cache.put(device_id, command, fingerprint, output)
+            outputs.update(fresh)
+        return {command: outputs[command] for command in commands}
+
+    def send_command(self, device: Dict[str, Any], command: str, **kwargs) -> str:
+        """
+        Return the output of one command, from the cache when possible.
+        """
+        return self.send_commands(device, [command], **kwargs)[command]
+
+    def close_all(self) -> None:
+        """
+        Close the underlying session pool.
+        """
+        self.pool.close_all()
+
+
+# Example Usage
+if __name__ == "__main__":
+    asa = {
+        "device_type": "cisco_asa",
+        "host": "192.168.1.1",  # Replace with ASA IP
+        "username": "admin",
+        "password": "password",  # Replace with actual password
+        "secret": "enable_password",  # Replace if enable mode is needed
+    }
+    try:
+        runner = CachedCommandRunner(DeviceSessionPool(), CommandCache("command_cache.sqlite"))
+        print(runner.send_command(asa, "show version"))
+        print(runner.cache.stats())
+        runner.close_all()
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -0,0 +1,328 @@
+import select
+import telnetlib
+import time
+from typing import Any, BinaryIO, Callable, List, Optional, Pattern, Tuple, Union
+
+from console_dialogs import (
+    CONFIRM_REGEX,
+    EXPECT,
+    MORE_REGEX,
+    PAGER_NOISE_REGEX,
+    PRIVILEGED_PROMPT_REGEX,
+    PROMPT,
+    PROMPT_WINDOW,
+    RUN_COMMAND,
+    SEND_LINE,
+    USER_PROMPT_REGEX,
+    WRITE,
+    WRITE_LINE,
+    clear_line_dialog,
+    disable_paging_dialog,
+    enable_dialog,
+    login_dialog,
+    remembered_prompt,
+    run_dialog,
+    wake_dialog,
+)
+
+
+class ConsoleSession:
+    """
+    A prompt-driven (expect-style) telnet console session for ASA devices and terminal servers.
+
+    Every interaction waits on precompiled prompt regexes ("Username:",
+    "Password:", "#", ">", "--- More ---", "confirm") and reacts the moment the
+    matching bytes arrive, instead of sleeping a fixed 1-5 seconds and hoping
+    the device has answered. Latency per command is the device's own response
+    time.
+
+    Example:
+        >>> with ConsoleSession("10.105.206.154", 2010) as console:
+        ...     console.login("lab", "lab")
+        ...     print(console.send_command("show version"))
+    """
+
+    def __init__(self, host: str, port: int = 23, timeout: float = 10.0, encoding: str = "utf-8"):
+        """
+        Initialize the ConsoleSession. The connection is opened by connect() or on entering a with block.
+
+        Args:
+            host (str): Terminal server or device address.
+            port (int): Telnet port, e.g. 2010 for line 10 of a terminal server. Default is 23.
+            timeout (float): Default seconds to wait for a prompt. Default is 10.
+            encoding (str): Encoding used for commands and output. Default is "utf-8".
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.encoding = encoding
+        self.telnet: Optional[telnetlib.Telnet] = None
+        self.prompt: Optional[bytes] = None
+        self.paging_disabled = False
+
+    def __enter__(self) -> "ConsoleSession":
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def connect(self) -> None:
+        """
+        Open the telnet connection.
+
+        Raises:
+            ConnectionError: If the host cannot be reached.
+        """
+        try:
+            self.telnet = telnetlib.Telnet(self.host, self.port, timeout=self.timeout)
+        except OSError as e:
+            raise ConnectionError(f"Cannot connect to {self.host}:{self.port}: {e}") from e
+
+    def close(self) -> None:
+        """
+        Close the telnet connection.
+        """
+        if self.telnet is not None:
+            self.telnet.close()
+            self.telnet = None
+
+    def write(self, data: str) -> None:
+        """
+        Send raw text without a line terminator.
+        """
+        self.telnet.write(data.encode(self.encoding))
+
+    def write_line(self, line: str) -> None:
+        """
+        Send a line of text followed by a newline.
+        """
+        self.telnet.write(line.encode(self.encoding) + b"\n")
+
+    def expect(self, patterns: List[Pattern[bytes]], timeout: Optional[float] = None) -> Tuple[int, bytes]:
+        """
+        Wait until one of the patterns matches the data received so far.
+
+        Args:
+            patterns (list): Compiled byte regexes.
+            timeout (float, optional): Seconds to wait. Defaults to the session timeout.
+
+        Returns:
+            Tuple[int, bytes]: Index of the matched pattern and all bytes read up to the match.
+
+        Raises:
+            TimeoutError: If nothing matched within the timeout.
+            EOFError: If the connection was closed by the peer.
+        """
+        index, _, data = self.telnet.expect(patterns, self.timeout if timeout is None else timeout)
+        if index < 0:
+            tail = data[-80:].decode(self.encoding, 'replace')
+            raise TimeoutError(f"No expected prompt from {self.host}:{self.port} (last output: {tail!r})")
+        return index, data
+
+    def _remember_prompt(self, data: bytes) -> None:
+        self.prompt = remembered_prompt(data)
+
+    def _perform(self, step: tuple) -> Any:
+        """Carry out one step of a console_dialogs dialog."""
+        kind = step[0]
+        if kind == EXPECT:
+            return self.expect(step[1], step[2])
+        if kind == WRITE:
+            self.telnet.write(step[1])
+        elif kind in (WRITE_LINE, SEND_LINE):
+            self.write_line(step[1])
+        elif kind == RUN_COMMAND:
+            return self.send_command(step[1], timeout=self.timeout if step[2] is None else step[2])
+        elif kind == PROMPT:
+            self._remember_prompt(step[1])
+        return None
+
+    def wake(self, timeout: Optional[float] = None) -> int:
+        """
+        Press Enter on an idle console line and wait for any prompt.
+
+        Returns:
+            int: Index of the prompt seen, in the order
+            (username, password, privileged, user, more, confirm).
+        """
+        return run_dialog(wake_dialog(timeout), self._perform)
+
+    def login(self, username: str, password: str, enable_password: Optional[str] = None,
+              timeout: Optional[float] = None, disable_paging: bool = True) -> None:
+        """
+        Answer Username/Password prompts until a CLI prompt appears, then optionally enter enable mode.
+
+        Works both on a fresh connection (the login banner is already coming)
+        and on a console line that needs a keypress to show its prompt.
+
+        Args:
+            username (str): Login username.
+            password (str): Login password.
+            enable_password (str, optional): Enter privileged mode with this password.
+            timeout (float, optional): Seconds to wait for each prompt.
+            disable_paging (bool): Turn the pager off once logged in. Default is True.
+
+        Raises:
+            PermissionError: If the device asks for credentials a second time.
+            TimeoutError: If the device stops responding.
+        """
+        first_timeout = min(self.timeout if timeout is None else timeout, 2.0)
+        dialog = login_dialog(f"{self.host}:{self.port}", username, password, enable_password, first_timeout,
+                              timeout, disable_paging)
+        if run_dialog(dialog, self._perform):
+            self.paging_disabled = True
+
+    def enable(self, enable_password: str, timeout: Optional[float] = None) -> None:
+        """
+        Enter privileged EXEC mode.
+
+        Raises:
+            PermissionError: If the enable password is rejected.
+        """
+        run_dialog(enable_dialog(f"{self.host}:{self.port}", enable_password, timeout), self._perform)
+
+    def disable_paging(self, timeout: Optional[float] = None) -> bool:
+        """
+        Turn the pager off for this session ("terminal pager 0" on ASA, "terminal length 0" on IOS).
+
+        Returns:
+            bool: True if one of the commands was accepted, False if paging stays on
+            (pages are then still answered without delay by send_command/stream_command).
+        """
+        accepted = run_dialog(disable_paging_dialog(timeout), self._perform)
+        self.paging_disabled = self.paging_disabled or accepted
+        return accepted
+
+    def send_command(self, command: str, timeout: float = 60.0, confirm: Optional[str] = None) -> str:
+        """
+        Run a command and return its output as soon as the CLI prompt comes back.
+
+        "--- More ---" pages are answered with a space immediately. A confirm
+        prompt is answered with ``confirm`` if given, otherwise it raises.
+
+        Args:
+            command (str): The command, e.g. "show version".
+            timeout (float): Overall deadline for the command in seconds. Default is 60.
+            confirm (str, optional): Text sent when the device asks for confirmation, e.g. "y".
+
+        Returns:
+            str: The command output without the echoed command, pager prompts and trailing prompt.
+
+        Raises:
+            TimeoutError: If the prompt does not come back before the deadline.
+            RuntimeError: If the device asks for confirmation and ``confirm`` is None.
+        """
+        output = bytearray()
+        self._run(command, output.extend, timeout, confirm)
+        return output.decode(self.encoding, 'replace').rstrip("\n")
+
+    def stream_command(self, command: str, destination: Union[str, BinaryIO], timeout: float = 600.0,
+                       confirm: Optional[str] = None) -> int:
+        """
+        Run a command and write its output to a file while it arrives.
+
+        Meant for "show running-config" / "show tech-support" sized outputs:
+        memory use stays bounded and the output is on disk at line rate.
+
+        Args:
+            command (str): The command, e.g. "show tech-support".
+            destination (str or binary file): Path to write, or an open binary file object.
+            timeout (float): Overall deadline for the command in seconds. Default is 600.
+            confirm (str, optional): Text sent when the device asks for confirmation.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            TimeoutError: If the prompt does not come back before the deadline.
+            PermissionError: If the destination cannot be written.
+        """
+        if not isinstance(destination, str):
+            return self._run(command, destination.write, timeout, confirm)
+        try:
+            with open(destination, 'wb') as file:
+                return self._run(command, file.write, timeout, confirm)
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied: Cannot write to file {destination}") from e
+
+    def _run(self, command: str, write: Callable[[bytes], Any], timeout: float, confirm: Optional[str]) -> int:
+        """
+        Send a command and pass its cleaned output to ``write`` chunk by chunk.
+
+        Received bytes go into a bytearray; prompts are searched for only in its
+        last PROMPT_WINDOW bytes (they are anchored to the end of the data), and
+        everything before that window is cleaned, handed to ``write`` and dropped.
+        Each byte is therefore scanned a bounded number of times, however long
+        the output is.
+        """
+        deadline = time.monotonic() + timeout
+        patterns = [PRIVILEGED_PROMPT_REGEX, USER_PROMPT_REGEX, MORE_REGEX, CONFIRM_REGEX]
+        echo = command.strip().encode(self.encoding)
+        pending = bytearray()
+        echo_checked = False
+        written = 0
+        self.write_line(command)
+        while True:
+            data = self.telnet.read_very_eager()
+            if not data:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    tail = bytes(pending[-80:]).decode(self.encoding, 'replace')
+                    raise TimeoutError(f"{command!r} on {self.host}:{self.port} did not finish (last output: {tail!r})")
+                select.select([self.telnet.get_socket()], [], [], remaining)
+                continue
+            pending += data
+
+            if not echo_checked:
+                newline = pending.find(b"\n")
+                if newline < 0 and not CONFIRM_REGEX.search(pending):
+                    continue
+                if newline >= 0:
+                    if pending[:newline].strip().endswith(echo):
+                        del pending[:newline + 1]
+                    echo_checked = True
+
+            window = max(len(pending) - PROMPT_WINDOW, 0)
+            for index, pattern in enumerate(patterns):
+                match = pattern.search(pending, window)
+                if match:
+                    break
+            else:
+                written += self._flush(pending, window, write)
+                continue
+
+            if index == 2:
+                del pending[match.start():match.end()]
+                self.telnet.write(b" ")
+            elif index == 3:
+                if confirm is None:
+                    raise RuntimeError(f"{command!r} on {self.host}:{self.port} asked for confirmation")
+                self.write(confirm)
+            else:
+                self._remember_prompt(bytes(pending[match.start():]))
+                # The match starts at the newline before the prompt; keep that newline.
+                del pending[match.start() + (pending[match.start()] in b"\r\n"):]
+                return written + self._flush(pending, len(pending), write)
+
+    @staticmethod
+    def _flush(pending: bytearray, end: int, write: Callable[[bytes], Any]) -> int:
+        if end and pending[end - 1:end] == b"\r":
+            end -= 1  # keep a split "\r\n" together for the next flush
+        if not end:
+            return 0
+        chunk = PAGER_NOISE_REGEX.sub(b"", bytes(pending[:end])).replace(b"\r\n", b"\n").replace(b"\r", b"")
+        del pending[:end]
+        if chunk:
+            write(chunk)
+        return len(chunk)
+
+    def clear_line(self, line: int, timeout: Optional[float] = None) -> None:
+        """
+        Run "clear line <n>" on a terminal server and confirm it.
+
+        Args:
+            line (int): Terminal server line number.
+            timeout (float, optional): Seconds to wait for each prompt.
+        """
+        run_dialog(clear_line_dialog(line, timeout), self._perform)
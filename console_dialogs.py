@@ -0,0 +1,175 @@
+import re
+from typing import Any, Awaitable, Callable, Generator, Optional
+
+# Prompts are anchored to the end of the data received so far (\Z), so text
+# such as "confirm" or "#" inside command output never matches.
+USERNAME_REGEX = re.compile(rb"(?:Username|[Ll]ogin): ?\Z")
+PASSWORD_REGEX = re.compile(rb"[Pp]assword: ?\Z")
+MORE_REGEX = re.compile(rb"<?-{2,3} ?More ?-{2,3}>? ?\Z")
+CONFIRM_REGEX = re.compile(rb"(?:\[confirm\]|\[yes/no\]:?|\(y/n\)\??|confirm) ?\Z", re.IGNORECASE)
+PRIVILEGED_PROMPT_REGEX = re.compile(rb"(?:^|[\r\n])[^\s#>]+# ?\Z")
+USER_PROMPT_REGEX = re.compile(rb"(?:^|[\r\n])[^\s#>]+> ?\Z")
+
+# The pager prompt and the backspaces / blank-out sequence the ASA prints after it.
+PAGER_NOISE_REGEX = re.compile(rb"<?-{2,3} ?More ?-{2,3}>?|\x08+ *\x08*|\r {2,}\r?")
+INVALID_INPUT_REGEX = re.compile(r"Invalid input|ERROR:|Unknown command|Incomplete command")
+
+# Tried in order by disable_paging(): ASA first, then IOS terminal servers.
+PAGER_OFF_COMMANDS = ("terminal pager 0", "terminal length 0")
+
+# Trailing bytes searched for prompts; everything before it can be flushed.
+PROMPT_WINDOW = 256
+
+# The login, enable, pager and "clear line" exchanges are written once, as
+# generators that yield I/O steps; ConsoleSession (blocking telnetlib) and
+# terminal_server.AsyncTelnetSession (asyncio) only perform the steps.
+#
+# Steps a dialog yields to the session driving it, and what the session sends back:
+#   (EXPECT, patterns, timeout)  -> (index, data); TimeoutError/EOFError are thrown into the dialog
+#   (WRITE, bytes)               -> None, raw bytes (e.g. b"\r\n" or b"y")
+#   (WRITE_LINE, text)           -> None, text plus a line terminator (usernames, passwords)
+#   (SEND_LINE, command)         -> None, a command line; async sessions also wait for its echo
+#   (RUN_COMMAND, command, timeout) -> the command output, as send_command() returns it
+#   (PROMPT, data)               -> None, remember the CLI prompt that ends data
+EXPECT, WRITE, WRITE_LINE, SEND_LINE = "expect", "write", "write_line", "send_line"
+RUN_COMMAND, PROMPT = "run_command", "prompt"
+
+Dialog = Generator[tuple, Any, Any]
+
+
+def wake_dialog(timeout: Optional[float]) -> Dialog:
+    """
+    Press Enter and wait for any prompt.
+
+    Returns:
+        int: Index of the prompt seen, in the order (username, password, privileged, user, more, confirm).
+    """
+    yield WRITE, b"\r\n"
+    index, data = yield (EXPECT, [USERNAME_REGEX, PASSWORD_REGEX, PRIVILEGED_PROMPT_REGEX, USER_PROMPT_REGEX,
+                                  MORE_REGEX, CONFIRM_REGEX], timeout)
+    if index in (2, 3):
+        yield PROMPT, data
+    return index
+
+
+def login_dialog(name: str, username: str, password: str, enable_password: Optional[str],
+                 first_timeout: float, timeout: Optional[float], disable_paging: bool) -> Dialog:
+    """
+    Answer Username/Password prompts until a CLI prompt appears, then optionally enable and turn the pager off.
+
+    Works both on a fresh connection (the login banner is already coming)
+    and on a console line that needs a keypress to show its prompt: if
+    nothing arrives within ``first_timeout`` seconds, Enter is pressed.
+
+    Returns:
+        bool: True if the pager was turned off.
+
+    Raises:
+        PermissionError: If the device asks for credentials a second time or rejects the enable password.
+    """
+    patterns = [USERNAME_REGEX, PASSWORD_REGEX, PRIVILEGED_PROMPT_REGEX, USER_PROMPT_REGEX]
+    sent_username = sent_password = False
+    try:
+        index, data = yield EXPECT, patterns, first_timeout
+    except TimeoutError:
+        yield WRITE, b"\r\n"
+        index, data = yield EXPECT, patterns, timeout
+    while index in (0, 1):
+        if (index == 0 and sent_username) or (index == 1 and sent_password):
+            raise PermissionError(f"Login to {name} rejected for user {username!r}")
+        yield WRITE_LINE, username if index == 0 else password
+        sent_username = sent_username or index == 0
+        sent_password = sent_password or index == 1
+        index, data = yield EXPECT, patterns, timeout
+    yield PROMPT, data
+
+    if enable_password is not None and index == 3:
+        yield from enable_dialog(name, enable_password, timeout)
+    if disable_paging:
+        return (yield from disable_paging_dialog(timeout))
+    return False
+
+
+def enable_dialog(name: str, enable_password: str, timeout: Optional[float]) -> Dialog:
+    """
+    Enter privileged EXEC mode.
+
+    Raises:
+        PermissionError: If the enable password is rejected.
+    """
+    yield WRITE_LINE, "enable"
+    patterns = [PASSWORD_REGEX, PRIVILEGED_PROMPT_REGEX, USER_PROMPT_REGEX]
+    index, data = yield EXPECT, patterns, timeout
+    if index == 0:
+        yield WRITE_LINE, enable_password
+        index, data = yield EXPECT, patterns, timeout
+    if index != 1:
+        raise PermissionError(f"Enable password rejected by {name}")
+    yield PROMPT, data
+
+
+def disable_paging_dialog(timeout: Optional[float]) -> Dialog:
+    """
+    Turn the pager off ("terminal pager 0" on ASA, "terminal length 0" on IOS).
+
+    Returns:
+        bool: True if one of the commands was accepted.
+    """
+    for command in PAGER_OFF_COMMANDS:
+        output = yield RUN_COMMAND, command, timeout
+        if not INVALID_INPUT_REGEX.search(output):
+            return True
+    return False
+
+
+def clear_line_dialog(line: int, timeout: Optional[float]) -> Dialog:
+    """
+    Run "clear line <n>" on a terminal server and confirm it.
+    """
+    yield SEND_LINE, f"clear line {line}"
+    index, _ = yield EXPECT, [CONFIRM_REGEX, PRIVILEGED_PROMPT_REGEX, USER_PROMPT_REGEX], timeout
+    if index == 0:
+        yield WRITE, b"y"
+        yield EXPECT, [PRIVILEGED_PROMPT_REGEX, USER_PROMPT_REGEX], timeout
+
+
+def run_dialog(dialog: Dialog, perform: Callable[[tuple], Any]) -> Any:
+    """
+    Drive a dialog with a blocking ``perform(step)``; errors it raises are thrown into the dialog.
+
+    Returns:
+        Any: The dialog's return value.
+    """
+    advance: Callable[[Any], tuple] = dialog.send
+    value: Any = None
+    while True:
+        try:
+            step = advance(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value, advance = perform(step), dialog.send
+        except (TimeoutError, EOFError) as e:
+            value, advance = e, dialog.throw
+
+
+async def run_dialog_async(dialog: Dialog, perform: Callable[[tuple], Awaitable[Any]]) -> Any:
+    """
+    Drive a dialog with a coroutine ``perform(step)``; see run_dialog.
+    """
+    advance: Callable[[Any], tuple] = dialog.send
+    value: Any = None
+    while True:
+        try:
+            step = advance(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value, advance = await perform(step), dialog.send
+        except (TimeoutError, EOFError) as e:
+            value, advance = e, dialog.throw
+
+
+def remembered_prompt(data: bytes) -> bytes:
+    """Return the prompt at the end of the received data, e.g. b"ciscoasa#"."""
+    return data.rsplit(b"\n", 1)[-1].strip()
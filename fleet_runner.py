@@ -0,0 +1,242 @@
+import datetime
+import heapq
+import os
+import random
+import re
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from asa_session import DeviceSessionPool
+from main import CsvFileReader, CsvFileWriter
+
+# Inventory columns that are not netmiko ConnectHandler arguments.
+INVENTORY_ONLY_FIELDS = ("site", "name")
+
+
+def load_inventory(file_path: str, defaults: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Load a device inventory from a CSV or YAML file.
+
+    CSV files need a header row with at least a "host" column. YAML files hold
+    either a list of devices or a mapping with a "devices" list. Optional
+    columns are "site", "name", "device_type", "port", "username", "password"
+    and "secret"; missing values are taken from ``defaults``.
+
+    Args:
+        file_path (str): Path to the .csv, .yaml or .yml inventory.
+        defaults (dict, optional): Values applied to every device unless it sets its own.
+
+    Returns:
+        List[Dict[str, Any]]: One dictionary per device.
+
+    Raises:
+        ValueError: If the format is unsupported or a device has no host.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".csv":
+        rows = CsvFileReader(file_path).read(as_dict=True)
+    elif extension in (".yaml", ".yml"):
+        import yaml
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                document = yaml.safe_load(file) or []
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Inventory file not found: {file_path}") from e
+        rows = document.get("devices", []) if isinstance(document, dict) else document
+    else:
+        raise ValueError(f"Unsupported inventory format: {file_path}. Use .csv, .yaml or .yml.")
+
+    base = {"device_type": "cisco_asa"}
+    base.update(defaults or {})
+    devices = []
+    for row in rows:
+        device = dict(base)
+        device.update({key: value for key, value in row.items() if value not in (None, "")})
+        if not device.get("host"):
+            raise ValueError(f"Inventory entry without a host in {file_path}: {row}")
+        if "port" in device:
+            device["port"] = int(device["port"])
+        devices.append(device)
+    return devices
+
+
+class FleetRunner:
+    """
+    Run a list of CLI commands against many devices concurrently.
+
+    Devices are processed on a thread pool of ``max_workers`` threads, and
+    at most ``per_site_limit`` devices of one site (and so one jump host /
+    TACACS server) are in flight at once. Scheduling is done per site: each
+    site has its own queue, and a device is only handed to the thread pool
+    when its site has a free slot, so a site-sorted inventory never leaves
+    workers blocked on one busy site while others wait. Failed devices are
+    re-queued with exponential backoff and jitter instead of sleeping in a
+    worker. Each device's output is written to ``output_dir`` once all of its
+    commands have returned, so results reach the disk device by device
+    instead of being held until the whole fleet finishes.
+
+    Example:
+        >>> devices = load_inventory("inventory.csv", defaults={"username": "admin", "password": "x"})
+        >>> runner = FleetRunner(output_dir="collect", max_workers=64, per_site_limit=8)
+        >>> results = runner.run(devices, ["show version"])
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "fleet_output",
+        max_workers: int = 32,
+        per_site_limit: int = 8,
+        retries: int = 2,
+        backoff: float = 2.0,
+        pool: Optional[DeviceSessionPool] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """
+        Initialize the FleetRunner.
+
+        Args:
+            output_dir (str): Directory receiving one "<inventory index>_<name>_<timestamp>.log" file
+                per device. Default is "fleet_output".
+            max_workers (int): Size of the thread pool. Default is 32.
+            per_site_limit (int): Maximum devices of one site processed at the same time. Default is 8.
+            retries (int): Extra attempts per device after a failure. Default is 2.
+            backoff (float): Base delay in seconds, doubled on every retry. Default is 2.0.
+            pool (DeviceSessionPool, optional): Session pool to use. A private one is created
+                (and closed after each run) if not given.
+            on_result (callable, optional): Called with each device's result dictionary as it completes.
+        """
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        self.per_site_limit = per_site_limit
+        self.retries = retries
+        self.backoff = backoff
+        self.pool = pool
+        self.on_result = on_result
+
+    def _output_path(self, index: int, device: Dict[str, Any], timestamp: str) -> str:
+        # The inventory index keeps names unique when two devices share a name or host.
+        name = device.get("name") or device["host"]
+        safe_name = re.sub(r"[^\w.-]+", "_", str(name))
+        return os.path.join(self.output_dir, f"{index:04d}_{safe_name}_{timestamp}.log")
+
+    def _attempt(self, pool: DeviceSessionPool, index: int, device: Dict[str, Any], commands: List[str],
+                 timestamp: str) -> Tuple[str, str, str]:
+        """One collection attempt: ("ok" | "retry" | "failed", output file, error)."""
+        connection_args = {k: v for k, v in device.items() if k not in INVENTORY_ONLY_FIELDS}
+        try:
+            outputs = pool.send_commands(connection_args, commands)
+        except Exception as e:
+            return "retry", "", f"{type(e).__name__}: {e}"
+        output_file = self._output_path(index, device, timestamp)
+        try:
+            with open(output_file, "w", encoding="utf-8") as file:
+                for command in commands:
+                    file.write(f"------------------ {command} ------------------\n\n")
+                    file.write(outputs[command])
+                    file.write("\n\n")
+        except OSError as e:
+            # Collecting again would not help; report the device instead of losing the whole run.
+            return "failed", "", f"Cannot write {output_file}: {e}"
+        return "ok", output_file, ""
+
+    def run(self, devices: List[Dict[str, Any]], commands: List[str], report_file: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Collect the commands from every device.
+
+        Args:
+            devices (list): Device dictionaries, e.g. from load_inventory().
+            commands (list): CLI commands to run on each device.
+            report_file (str, optional): Write the per-device results to this CSV file.
+
+        Returns:
+            List[Dict[str, Any]]: One result per device with "host", "site", "status",
+            "attempts", "elapsed", "output_file" and "error", in completion order.
+        """
+        if not commands:
+            raise ValueError("No commands provided for the fleet run.")
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        pool = self.pool or DeviceSessionPool(max_sessions_per_device=1)
+
+        # Per-site queues of inventory indexes, served round-robin; "site" -> devices in flight.
+        queues: Dict[str, deque] = {}
+        for index, device in enumerate(devices):
+            queues.setdefault(device.get("site", ""), deque()).append(index)
+        running = dict.fromkeys(queues, 0)
+        delayed: List[Tuple[float, int]] = []  # Heap of (due time, index) of devices backing off.
+        states = [{"host": device["host"], "site": device.get("site", ""), "status": "failed", "attempts": 0,
+                   "elapsed": 0.0, "output_file": "", "error": ""} for device in devices]
+        started = [0.0] * len(devices)
+        results = []
+
+        def finish(index: int) -> None:
+            result = states[index]
+            result["elapsed"] = round(time.monotonic() - started[index], 3)
+            results.append(result)
+            if self.on_result is not None:
+                self.on_result(result)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                in_flight: Dict[Future, int] = {}
+                while in_flight or delayed or any(queues.values()):
+                    now = time.monotonic()
+                    while delayed and delayed[0][0] <= now:
+                        index = heapq.heappop(delayed)[1]
+                        queues[states[index]["site"]].appendleft(index)  # A retry goes first in its site.
+                    submitted = True
+                    while submitted and len(in_flight) < self.max_workers:
+                        submitted = False
+                        for site, queue in queues.items():
+                            if queue and running[site] < self.per_site_limit and len(in_flight) < self.max_workers:
+                                index = queue.popleft()
+                                running[site] += 1
+                                if not states[index]["attempts"]:
+                                    started[index] = time.monotonic()
+                                states[index]["attempts"] += 1
+                                future = executor.submit(self._attempt, pool, index, devices[index], commands,
+                                                         timestamp)
+                                in_flight[future] = index
+                                submitted = True
+
+                    timeout = max(delayed[0][0] - time.monotonic(), 0.0) if delayed else None
+                    if not in_flight:
+                        time.sleep(timeout or 0.0)
+                        continue
+                    done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = in_flight.pop(future)
+                        result = states[index]
+                        running[result["site"]] -= 1
+                        status, result["output_file"], result["error"] = future.result()
+                        attempt = result["attempts"] - 1
+                        if status == "retry" and attempt < self.retries:
+                            delay = self.backoff * (2 ** attempt)
+                            heapq.heappush(delayed, (time.monotonic() + delay + random.uniform(0, delay / 2), index))
+                            continue
+                        result["status"] = "ok" if status == "ok" else "failed"
+                        finish(index)
+        finally:
+            if self.pool is None:
+                pool.close_all()
+
+        if report_file and results:
+            CsvFileWriter(report_file).write(results, include_header=True)
+        return results
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        inventory = load_inventory("inventory.csv", defaults={
+            "username": os.environ.get("ASA_USERNAME", "admin"),
+            "password": os.environ.get("ASA_PASSWORD", ""),
+            "secret": os.environ.get("ASA_SECRET", ""),
+        })
+        runner = FleetRunner(output_dir="fleet_output", max_workers=64, per_site_limit=8,
+                             on_result=lambda r: print(f"[{r['status']}] {r['host']} in {r['elapsed']}s {r['error']}"))
+        runner.run(inventory, ["show version"], report_file="fleet_report.csv")
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -0,0 +1,239 @@
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from main import CsvFileWriter
+
+FILE = "file"
+DIRECTORY = "dir"
+LINK = "link"
+OTHER = "other"
+MODE_KINDS = {stat.S_IFREG: FILE, stat.S_IFDIR: DIRECTORY, stat.S_IFLNK: LINK}
+
+
+class FileRecord:
+    """
+    One inventoried filesystem entry.
+
+    Attributes:
+    -----------
+    path : str
+        Full path of the entry.
+    name : str
+        Base name.
+    kind : str
+        "file", "dir", "link" or "other".
+    size : int
+        Size in bytes (0 for directories, or when stat was skipped).
+    mtime : float
+        Modification time as an epoch (0.0 when stat was skipped).
+    """
+
+    __slots__ = ("path", "name", "kind", "size", "mtime")
+    FIELDS = __slots__
+
+    def __init__(self, path: str, name: str, kind: str, size: int = 0, mtime: float = 0.0):
+        self.path = path
+        self.name = name
+        self.kind = kind
+        self.size = size
+        self.mtime = mtime
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a dictionary, e.g. for CsvFileWriter."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self) -> str:
+        return f"FileRecord({self.path!r}, kind={self.kind!r}, size={self.size}, mtime={self.mtime})"
+
+
+def scan_directory(path: str, with_stat: bool = True,
+                   follow_symlinks: bool = False) -> Tuple[List[FileRecord], List[str]]:
+    """
+    List one directory with a single os.scandir pass.
+
+    Type, size and mtime all come from one ``DirEntry.stat()``, which is
+    cached on the entry (and on Windows is filled in by the listing itself, so
+    no extra system call is made). Without stat, the type comes from the
+    listing's own d_type information.
+
+    Args:
+        path (str): Directory to list.
+        with_stat (bool): Fill in size and mtime. Default is True.
+        follow_symlinks (bool): Treat links to directories as directories. Default is False.
+
+    Returns:
+        Tuple[List[FileRecord], List[str]]: The entries, and the subdirectories to descend into.
+
+    Raises:
+        OSError: If the directory cannot be listed.
+    """
+    records = []
+    subdirectories = []
+    append = records.append
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if with_stat:
+                    # One (cached) stat gives the type as well; no separate is_dir()/is_file() probes.
+                    info = entry.stat(follow_symlinks=follow_symlinks)
+                    kind = MODE_KINDS.get(stat.S_IFMT(info.st_mode), OTHER)
+                    size = info.st_size if kind == FILE else 0
+                    append(FileRecord(entry.path, entry.name, kind, size, info.st_mtime))
+                else:
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        kind = DIRECTORY
+                    elif entry.is_file(follow_symlinks=follow_symlinks):
+                        kind = FILE
+                    else:
+                        kind = LINK if entry.is_symlink() else OTHER
+                    append(FileRecord(entry.path, entry.name, kind))
+            except OSError:
+                append(FileRecord(entry.path, entry.name, OTHER))  # Vanished or unreadable mid-scan.
+                continue
+            if kind == DIRECTORY:
+                subdirectories.append(entry.path)
+    return records, subdirectories
+
+
+class FilesystemInventory:
+    """
+    Inventory a directory tree with os.scandir, scanning subtrees in parallel.
+
+    Each directory is listed exactly once, and every subdirectory found is
+    handed to a thread pool as soon as its parent has been listed, so slow
+    network or OneDrive-backed shares are read with many requests in flight.
+    Directories that cannot be read are recorded in ``errors`` instead of
+    aborting the scan.
+
+    Example:
+        >>> inventory = FilesystemInventory(max_workers=16)
+        >>> records = inventory.scan(r"C:\\Users\\glenka\\OneDrive - Cisco\\Documents")
+        >>> newest_folder = inventory.newest(records, kind="dir")
+    """
+
+    def __init__(self, max_workers: int = 16, with_stat: bool = True, follow_symlinks: bool = False):
+        """
+        Initialize the FilesystemInventory.
+
+        Args:
+            max_workers (int): Directories listed in parallel. Default is 16.
+            with_stat (bool): Collect size and mtime. Default is True.
+            follow_symlinks (bool): Descend into links to directories. Default is False.
+        """
+        self.max_workers = max_workers
+        self.with_stat = with_stat
+        self.follow_symlinks = follow_symlinks
+        self.errors: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def _scan(self, path: str) -> Tuple[List[FileRecord], List[str]]:
+        try:
+            return scan_directory(path, self.with_stat, self.follow_symlinks)
+        except OSError as e:
+            with self._lock:
+                self.errors.append((path, str(e)))
+            return [], []
+
+    def scan(self, root: str, recursive: bool = True) -> List[FileRecord]:
+        """
+        Inventory root (and, by default, everything below it).
+
+        Args:
+            root (str): Directory to scan.
+            recursive (bool): Descend into subdirectories. Default is True.
+
+        Returns:
+            List[FileRecord]: One record per entry found; order between directories is not defined.
+        """
+        self.errors = []
+        if not recursive:
+            return self._scan(root)[0]
+        records: List[FileRecord] = []
+        outstanding = [1]
+        finished = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            def visit(path: str) -> None:
+                # Workers queue their own subdirectories, so no coordinator thread polls for results.
+                subdirectories: List[str] = []
+                try:
+                    found, subdirectories = self._scan(path)
+                    with self._lock:
+                        records.extend(found)
+                except Exception as e:
+                    with self._lock:
+                        self.errors.append((path, repr(e)))
+                finally:
+                    with self._lock:
+                        outstanding[0] += len(subdirectories) - 1
+                        done = outstanding[0] == 0
+                    for subdirectory in subdirectories:
+                        executor.submit(visit, subdirectory)
+                    if done:
+                        finished.set()
+
+            executor.submit(visit, root)
+            finished.wait()
+        return records
+
+    @staticmethod
+    def newest(records: Iterable[FileRecord], kind: Optional[str] = FILE) -> Optional[FileRecord]:
+        """
+        Return the most recently modified record of a kind (any kind if None).
+        """
+        return max((record for record in records if kind is None or record.kind == kind),
+                   key=lambda record: record.mtime, default=None)
+
+    @staticmethod
+    def largest(records: Iterable[FileRecord], count: int = 10) -> List[FileRecord]:
+        """
+        Return the largest files, biggest first.
+        """
+        files = [record for record in records if record.kind == FILE]
+        files.sort(key=lambda record: record.size, reverse=True)
+        return files[:count]
+
+    @staticmethod
+    def summarize(records: Iterable[FileRecord]) -> Dict[str, int]:
+        """
+        Return the number of files and directories and the total file size.
+        """
+        summary = {"files": 0, "directories": 0, "bytes": 0}
+        for record in records:
+            if record.kind == FILE:
+                summary["files"] += 1
+                summary["bytes"] += record.size
+            elif record.kind == DIRECTORY:
+                summary["directories"] += 1
+        return summary
+
+
+def write_inventory_csv(records: List[FileRecord], file_path: str) -> None:
+    """
+    Write inventory records to a CSV file with CsvFileWriter.
+
+    Raises:
+        ValueError: If records is empty.
+    """
+    if not records:
+        raise ValueError("No records provided for CSV writing.")
+    CsvFileWriter(file_path).write([record.to_dict() for record in records], include_header=True,
+                                   fieldnames=list(FileRecord.FIELDS))
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        inventory = FilesystemInventory(max_workers=16)
+        started = time.perf_counter()
+        records = inventory.scan(r"C:\Users\glenka\OneDrive - Cisco\Documents")  # Change this to your directory
+        print(f"[+] {inventory.summarize(records)} in {time.perf_counter() - started:.2f}s")
+        for path, error in inventory.errors:
+            print(f"[-] {path}: {error}")
+        write_inventory_csv(records, "inventory.csv")
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -0,0 +1,258 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from fs_inventory import DIRECTORY, FILE, scan_directory
+from ftp_index import glob_escape
+
+HASH_CHUNK = 1024 * 1024
+
+
+def file_digest(path: str) -> str:
+    """Return the BLAKE2b (16-byte) hex digest of a file's content."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FilesystemSnapshot:
+    """
+    A persistent SQLite snapshot of directory trees with incremental refresh.
+
+    Every entry is stored with its size, mtime, optional content hash and the
+    time the snapshot last saw it change. A refresh stats each known
+    directory once and only lists the directories whose mtime moved (an
+    entry was added, removed or renamed in them); unchanged directories are
+    descended through using the subdirectories already in the snapshot.
+    Newest/largest/changed-since queries are answered from the index.
+
+    A directory's mtime does not change when a file in it is rewritten in
+    place. Use ``deep=True`` on refresh() to re-stat every directory's entries
+    and catch such edits as well.
+
+    Example:
+        >>> snapshot = FilesystemSnapshot("fs_snapshot.sqlite")
+        >>> snapshot.refresh(r"C:\\Users\\glenka\\OneDrive - Cisco\\Documents")
+        >>> print(snapshot.newest(kind="dir"))
+        >>> changes = snapshot.changed_since(time.time() - 86400)
+    """
+
+    def __init__(self, db_path: str = "fs_snapshot.sqlite", hash_files: bool = False, max_workers: int = 16):
+        """
+        Initialize the FilesystemSnapshot.
+
+        Args:
+            db_path (str): Path of the SQLite snapshot file. Default is "fs_snapshot.sqlite".
+            hash_files (bool): Store a content hash for new and changed files. Default is False.
+            max_workers (int): Directories scanned (and files hashed) in parallel. Default is 16.
+        """
+        self.db_path = db_path
+        self.hash_files = hash_files
+        self.max_workers = max_workers
+        self.errors: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        try:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " path TEXT PRIMARY KEY, parent TEXT, name TEXT, kind TEXT, size INTEGER, mtime REAL,"
+                " hash TEXT, changed REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_parent ON entries (parent)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_mtime ON entries (kind, mtime)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_size ON entries (kind, size)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_changed ON entries (changed)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS directories (path TEXT PRIMARY KEY, mtime REAL)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS removed (path TEXT PRIMARY KEY, removed REAL)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS roots (path TEXT PRIMARY KEY, refreshed REAL)")
+            self._db.commit()
+        except sqlite3.Error as e:
+            raise IOError(f"Cannot open filesystem snapshot: {db_path}. Details: {e}") from e
+
+    def close(self) -> None:
+        """
+        Close the snapshot file.
+        """
+        with self._lock:
+            self._db.close()
+
+    def _query(self, query: str, parameters: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self._db.execute(query, parameters).fetchall()
+
+    def _visit(self, path: str, deep: bool, now: float, changes: Dict[str, list]) -> List[str]:
+        """Refresh one directory; return the subdirectories to visit next."""
+        try:
+            directory_mtime = os.stat(path).st_mtime
+        except OSError as e:
+            with self._lock:
+                self.errors.append((path, str(e)))
+            return []
+        known = self._query("SELECT mtime FROM directories WHERE path = ?", (path,))
+        if known and known[0][0] == directory_mtime and not deep:
+            return [row[0] for row in self._query(
+                "SELECT path FROM entries WHERE parent = ? AND kind = ?", (path, DIRECTORY))]
+
+        try:
+            records, subdirectories = scan_directory(path)
+        except OSError as e:
+            with self._lock:
+                self.errors.append((path, str(e)))
+            return []
+        previous = {row[0]: row[1:] for row in self._query(
+            "SELECT path, kind, size, mtime, hash FROM entries WHERE parent = ?", (path,))}
+        upserts = []
+        for record in records:
+            old = previous.pop(record.path, None)
+            if old is not None and old[:3] == (record.kind, record.size, record.mtime):
+                continue
+            digest = None
+            if self.hash_files and record.kind == FILE:
+                try:
+                    digest = file_digest(record.path)
+                except OSError:
+                    pass
+            upserts.append((record.path, path, record.name, record.kind, record.size, record.mtime, digest, now))
+        with self._lock:
+            changes["upserts"].extend(upserts)
+            changes["removed"].extend((removed, kind) for removed, (kind, *_) in previous.items())
+            changes["directories"].append((path, directory_mtime))
+        return subdirectories
+
+    def refresh(self, root: str, deep: bool = False) -> Dict[str, int]:
+        """
+        Bring the snapshot of root up to date.
+
+        Args:
+            root (str): Directory tree to snapshot.
+            deep (bool): Re-list every directory, not only those whose mtime changed. Default is False.
+
+        Returns:
+            Dict[str, int]: Directories listed, entries added or changed, and entries removed.
+        """
+        root = os.path.abspath(root)
+        now = time.time()
+        self.errors = []
+        changes: Dict[str, list] = {"upserts": [], "removed": [], "directories": []}
+        outstanding = [1]
+        finished = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            def visit(path: str) -> None:
+                subdirectories: List[str] = []
+                try:
+                    subdirectories = self._visit(path, deep, now, changes)
+                except Exception as e:
+                    with self._lock:
+                        self.errors.append((path, repr(e)))
+                finally:
+                    with self._lock:
+                        outstanding[0] += len(subdirectories) - 1
+                        done = outstanding[0] == 0
+                    for subdirectory in subdirectories:
+                        executor.submit(visit, subdirectory)
+                    if done:
+                        finished.set()
+
+            executor.submit(visit, root)
+            finished.wait()
+
+        with self._lock:
+            with self._db:
+                self._db.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                     changes["upserts"])
+                self._db.executemany("DELETE FROM removed WHERE path = ?",
+                                     [(row[0],) for row in changes["upserts"]])
+                for path, kind in changes["removed"]:
+                    self._db.execute("DELETE FROM entries WHERE path = ?", (path,))
+                    self._db.execute("INSERT OR REPLACE INTO removed VALUES (?, ?)", (path, now))
+                    if kind == DIRECTORY:
+                        subtree = glob_escape(path) + os.sep + "*"
+                        self._db.execute("DELETE FROM entries WHERE path GLOB ?", (subtree,))
+                        self._db.execute("DELETE FROM directories WHERE path = ? OR path GLOB ?", (path, subtree))
+                self._db.executemany("INSERT OR REPLACE INTO directories VALUES (?, ?)", changes["directories"])
+                # A listed directory changed, so its own row (written when its parent was listed) is stale.
+                self._db.executemany(
+                    "UPDATE entries SET mtime = ?, changed = ? WHERE path = ? AND kind = ? AND mtime != ?",
+                    [(mtime, now, path, DIRECTORY, mtime) for path, mtime in changes["directories"]])
+                self._db.execute("INSERT OR REPLACE INTO roots VALUES (?, ?)", (root, now))
+        return {"directories_listed": len(changes["directories"]), "changed": len(changes["upserts"]),
+                "removed": len(changes["removed"])}
+
+    def _rows(self, query: str, parameters: Tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._db.execute(query, parameters)
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _under(root: Optional[str]) -> str:
+        return glob_escape(os.path.abspath(root)) + os.sep + "*" if root else "*"
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the snapshot entry of one path, or None.
+        """
+        rows = self._rows("SELECT * FROM entries WHERE path = ?", (os.path.abspath(path),))
+        return rows[0] if rows else None
+
+    def newest(self, root: Optional[str] = None, kind: str = FILE, limit: int = 1) -> List[Dict[str, Any]]:
+        """
+        Return the most recently modified entries of a kind, optionally under root.
+        """
+        return self._rows("SELECT * FROM entries WHERE kind = ? AND path GLOB ? ORDER BY mtime DESC LIMIT ?",
+                          (kind, self._under(root), limit))
+
+    def largest(self, root: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Return the largest files, optionally under root, biggest first.
+        """
+        return self._rows("SELECT * FROM entries WHERE kind = ? AND path GLOB ? ORDER BY size DESC LIMIT ?",
+                          (FILE, self._under(root), limit))
+
+    def changed_since(self, since: float, root: Optional[str] = None) -> Dict[str, List[Any]]:
+        """
+        Return what the snapshot saw appear, change or disappear since an epoch.
+
+        Returns:
+            Dict[str, list]: "changed" entry rows and "removed" paths.
+        """
+        under = self._under(root)
+        changed = self._rows("SELECT * FROM entries WHERE changed >= ? AND path GLOB ? ORDER BY path", (since, under))
+        removed = [row[0] for row in self._query(
+            "SELECT path FROM removed WHERE removed >= ? AND path GLOB ? ORDER BY path", (since, under))]
+        return {"changed": changed, "removed": removed}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the number of files and directories, their total size, and the refreshed roots.
+        """
+        files, directories, size = self._query(
+            "SELECT SUM(kind = ?), SUM(kind = ?), COALESCE(SUM(size), 0) FROM entries", (FILE, DIRECTORY))[0]
+        roots = dict(self._query("SELECT path, refreshed FROM roots"))
+        return {"files": files or 0, "directories": directories or 0, "bytes": size, "roots": roots}
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        snapshot = FilesystemSnapshot("fs_snapshot.sqlite")
+        started = time.perf_counter()
+        print(snapshot.refresh(r"C:\Users\glenka\OneDrive - Cisco\Documents"),  # Change this to your directory
+              f"in {time.perf_counter() - started:.2f}s")
+        for row in snapshot.newest(kind=DIRECTORY):
+            print("Last modified folder:", row["name"])
+        for row in snapshot.largest(limit=5):
+            print(f"{row['size'] / 1e6:>10.1f} MB  {row['path']}")
+        snapshot.close()
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -0,0 +1,237 @@
+import ftplib
+import os
+import posixpath
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from ftp_transfer import FtpConnectionPool, facts_mtime, list_directory, load_ftp_credentials
+
+GLOB_SPECIAL_REGEX = re.compile(r"([*?\[])")
+
+
+def glob_escape(text: str) -> str:
+    """Escape a literal path for use in an SQLite GLOB pattern."""
+    return GLOB_SPECIAL_REGEX.sub(r"[\1]", text)
+
+
+class FtpTreeIndex:
+    """
+    A local, queryable index of a remote FTP tree, refreshed by concurrent MLSD walks.
+
+    Directory listings are fetched in parallel over the connections of an
+    FtpConnectionPool, one MLSD (or LIST) round trip per directory, and stored
+    in an indexed SQLite file together with the time of the walk. Queries such
+    as "newest file under /test_data/*" or "total size per user directory" are
+    answered from the index; a root is only walked again once its last walk
+    is older than ``ttl`` seconds.
+
+    Example:
+        >>> with FtpConnectionPool(host, user, password, max_connections=8) as pool:
+        ...     index = FtpTreeIndex(pool, "ftp_index.sqlite", ttl=3600)
+        ...     index.refresh("/test_data")
+        ...     print(index.newest("/test_data/*"))
+        ...     print(index.size_by_directory("/test_data"))
+    """
+
+    def __init__(self, pool: FtpConnectionPool, db_path: str = "ftp_index.sqlite", ttl: float = 3600.0,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize the FtpTreeIndex.
+
+        Args:
+            pool (FtpConnectionPool): Connections used for walking.
+            db_path (str): Path of the SQLite index file. Default is "ftp_index.sqlite".
+            ttl (float): Seconds a walk stays fresh. Default is 3600.
+            max_workers (int, optional): Directories listed in parallel. Defaults to the pool's max_connections.
+        """
+        self.pool = pool
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_workers = max_workers or pool.max_connections
+        self.errors: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        try:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " path TEXT PRIMARY KEY, parent TEXT, name TEXT, type TEXT, size INTEGER, modify REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_parent ON entries (parent)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_modify ON entries (type, modify)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS walks (root TEXT PRIMARY KEY, finished REAL, entries INTEGER)")
+            self._db.commit()
+        except sqlite3.Error as e:
+            raise IOError(f"Cannot open FTP index: {db_path}. Details: {e}") from e
+
+    def close(self) -> None:
+        """
+        Close the index file.
+        """
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return "/" + posixpath.normpath(path).strip("/") if path.strip("/") else "/"
+
+    def _subtree_pattern(self, root: str) -> str:
+        return glob_escape(root.rstrip("/")) + "/*"
+
+    def age(self, root: str) -> Optional[float]:
+        """
+        Return the seconds since root (or a directory above it) was last walked, or None if never.
+        """
+        root = self._normalize(root)
+        with self._lock:
+            walks = self._db.execute("SELECT root, finished FROM walks").fetchall()
+        covering = [finished for walked, finished in walks
+                    if root == walked or root.startswith(walked.rstrip("/") + "/")]
+        return time.time() - max(covering) if covering else None
+
+    def _list(self, directory: str) -> Tuple[str, List[Tuple[str, Dict[str, str]]]]:
+        try:
+            with self.pool.connection() as ftp:
+                return directory, list_directory(ftp, directory)
+        except ftplib.error_perm as e:
+            with self._lock:
+                self.errors.append((directory, str(e)))
+            return directory, []
+
+    def _walk(self, root: str) -> List[Tuple[str, str, str, str, int, Optional[float]]]:
+        rows = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._list, root)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory, entries = future.result()
+                    for name, facts in entries:
+                        path = posixpath.join(directory, name)
+                        kind = facts.get("type", "file")
+                        size = int(facts["size"]) if facts.get("size", "").isdigit() else 0
+                        rows.append((path, directory, name, kind, size, facts_mtime(facts)))
+                        if kind == "dir":
+                            pending.add(executor.submit(self._list, path))
+        return rows
+
+    def refresh(self, root: str = "/", force: bool = False) -> int:
+        """
+        Walk root and replace its part of the index, unless a walk younger than ttl already covers it.
+
+        Args:
+            root (str): Remote directory to index.
+            force (bool): Walk even if the index is fresh. Default is False.
+
+        Directories below root that cannot be listed are recorded in ``errors``
+        (reset by every walk) and left out of the index.
+
+        Returns:
+            int: Number of entries written; 0 if the index was fresh.
+
+        Raises:
+            IOError: If root itself cannot be listed; the index is left unchanged.
+        """
+        root = self._normalize(root)
+        age = self.age(root)
+        if not force and age is not None and age < self.ttl:
+            return 0
+        self.errors = []
+        rows = self._walk(root)
+        for directory, error in self.errors:
+            if directory == root:
+                raise IOError(f"Cannot list FTP directory: {root}. Details: {error}")
+        with self._lock:
+            with self._db:
+                self._db.execute("DELETE FROM entries WHERE path GLOB ?", (self._subtree_pattern(root),))
+                self._db.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self._db.execute("INSERT OR REPLACE INTO walks VALUES (?, ?, ?)", (root, time.time(), len(rows)))
+        return len(rows)
+
+    def _rows(self, query: str, parameters: Tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._db.execute(query, parameters)
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def listdir(self, directory: str) -> List[Dict[str, Any]]:
+        """
+        Return the indexed entries of one directory (path, name, type, size, modify), sorted by name.
+        """
+        return self._rows("SELECT path, name, type, size, modify FROM entries WHERE parent = ? ORDER BY name",
+                          (self._normalize(directory),))
+
+    def find(self, pattern: str, kind: str = "file") -> List[Dict[str, Any]]:
+        """
+        Return entries whose path matches a glob pattern ("*" also matches "/").
+
+        Example:
+            >>> index.find("/test_data/*/*.pcap")
+        """
+        return self._rows("SELECT path, type, size, modify FROM entries WHERE type = ? AND path GLOB ? ORDER BY path",
+                          (kind, pattern))
+
+    def newest(self, pattern: str, limit: int = 1) -> List[Dict[str, Any]]:
+        """
+        Return the most recently modified files whose path matches a glob pattern.
+
+        Example:
+            >>> index.newest("/test_data/*", limit=5)
+        """
+        return self._rows(
+            "SELECT path, size, modify FROM entries WHERE type = 'file' AND path GLOB ? "
+            "ORDER BY modify DESC LIMIT ?",
+            (pattern, limit),
+        )
+
+    def size_by_directory(self, root: str) -> List[Dict[str, Any]]:
+        """
+        Return the total file size and file count under each immediate subdirectory of root.
+
+        Files directly in root are reported under the directory name "".
+
+        Returns:
+            List[Dict[str, Any]]: {"directory", "files", "bytes"} rows, largest first.
+        """
+        root = self._normalize(root)
+        prefix_length = len(root.rstrip("/")) + 2
+        return self._rows(
+            "SELECT CASE WHEN instr(rest, '/') > 0 THEN substr(rest, 1, instr(rest, '/') - 1) ELSE '' END"
+            " AS directory, COUNT(*) AS files, SUM(size) AS bytes"
+            " FROM (SELECT substr(path, ?) AS rest, size FROM entries WHERE type = 'file' AND path GLOB ?)"
+            " GROUP BY directory ORDER BY bytes DESC",
+            (prefix_length, self._subtree_pattern(root)),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the number of indexed files and directories, their total size, and the walked roots.
+        """
+        with self._lock:
+            files, directories, size = self._db.execute(
+                "SELECT SUM(type = 'file'), SUM(type = 'dir'), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            roots = {root: finished for root, finished in self._db.execute("SELECT root, finished FROM walks")}
+        return {"files": files or 0, "directories": directories or 0, "bytes": size, "roots": roots}
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        with FtpConnectionPool(**load_ftp_credentials(), max_connections=8) as pool:
+            index = FtpTreeIndex(pool, "ftp_index.sqlite", ttl=3600)
+            started = time.perf_counter()
+            print(f"[+] Indexed {index.refresh('/test_data')} entries in {time.perf_counter() - started:.2f}s")
+            for row in index.newest("/test_data/*", limit=5):
+                print(f"{row['path']}  {time.ctime(row['modify'])}")
+            for row in index.size_by_directory("/test_data"):
+                print(f"{row['directory']:<20} {row['files']:>8} files {row['bytes'] / 1e6:>12.1f} MB")
+            index.close()
+    except Exception as e:
+        print(f"[-] Error: {e}")
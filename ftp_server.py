@@ -0,0 +1,393 @@
+import asyncio
+import os
+import posixpath
+import shutil
+import stat
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from server_thread import ServerThread
+
+DATA_CHUNK = 256 * 1024
+# Like "ls -l": entries older than six months (or in the future) show a year instead of a time.
+LIST_RECENT_SECONDS = 182 * 24 * 3600
+FEATURES = ("MLST type*;size*;modify*;", "MDTM", "SIZE", "REST STREAM", "EPSV", "PASV", "UTF8")
+
+
+def format_modify(mtime: float) -> str:
+    """Return an MLSD/MDTM timestamp (UTC, "YYYYMMDDHHMMSS")."""
+    return time.strftime("%Y%m%d%H%M%S", time.gmtime(mtime))
+
+
+class FtpSession:
+    """
+    One client connection of a LocalFtpServer: its login state, working directory and passive data port.
+    """
+
+    def __init__(self, server: "LocalFtpServer", reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.cwd = "/"
+        self.user: Optional[str] = None
+        self.authenticated = False
+        self.rest = 0
+        self.rename_from: Optional[str] = None
+        self._passive: Optional[asyncio.AbstractServer] = None
+        self._data: Optional[asyncio.Future] = None
+
+    async def reply(self, text: str) -> None:
+        self.writer.write(text.encode("utf-8") + b"\r\n")
+        await self.writer.drain()
+
+    def resolve(self, path: str) -> Tuple[str, str]:
+        """Map a client path to (virtual path, local path), never escaping the server root."""
+        virtual = posixpath.normpath(posixpath.join(self.cwd, path or "."))
+        virtual = "/" + virtual.lstrip("/")
+        return virtual, os.path.join(self.server.root, *[part for part in virtual.split("/") if part])
+
+    async def open_passive(self, extended: bool) -> None:
+        await self.close_passive()
+        self._data = asyncio.get_running_loop().create_future()
+
+        def accept(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            if self._data is not None and not self._data.done():
+                self._data.set_result((reader, writer))
+            else:
+                writer.close()
+
+        self._passive = await asyncio.start_server(accept, self.server.host, 0)
+        port = self._passive.sockets[0].getsockname()[1]
+        if extended:
+            await self.reply(f"229 Entering Extended Passive Mode (|||{port}|)")
+        else:
+            address = self.server.host.replace(".", ",")
+            await self.reply(f"227 Entering Passive Mode ({address},{port >> 8},{port & 255}).")
+
+    async def close_passive(self) -> None:
+        if self._passive is not None:
+            self._passive.close()
+            self._passive = None
+
+    async def data_connection(self) -> Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]:
+        if self._data is None:
+            await self.reply("425 Use PASV or EPSV first.")
+            return None
+        try:
+            return await asyncio.wait_for(self._data, 10)
+        except asyncio.TimeoutError:
+            await self.reply("425 Can't open data connection.")
+            return None
+        finally:
+            self._data = None
+            await self.close_passive()
+
+    async def send_data(self, chunks: Iterable[bytes]) -> None:
+        connection = await self.data_connection()
+        if connection is None:
+            return
+        await self.reply("150 Opening data connection.")
+        _, data_writer = connection
+        for chunk in chunks:
+            data_writer.write(chunk)
+            await data_writer.drain()
+        data_writer.close()
+        await self.reply("226 Transfer complete.")
+
+
+class LocalFtpServer:
+    """
+    A minimal in-process FTP server over a local directory, for tests and benchmarks.
+
+    It speaks the subset of RFC 959/3659 that ftplib and the FTP tools in this
+    repository use: USER/PASS, PWD/CWD/CDUP, MKD/RMD/DELE/RNFR/RNTO, SIZE/MDTM,
+    PASV/EPSV, LIST/NLST/MLSD, RETR/STOR/APPE with REST, and FEAT/OPTS/NOOP.
+    ``latency`` delays every control reply to emulate a WAN link.
+
+    Example:
+        >>> server = LocalFtpServer("/tmp/ftp_root", users={"admin": "secret"})
+        >>> with FtpServerThread(server) as port:
+        ...     ftp = ftplib.FTP(); ftp.connect("127.0.0.1", port); ftp.login("admin", "secret")
+    """
+
+    def __init__(self, root: str, users: Optional[Dict[str, str]] = None, host: str = "127.0.0.1",
+                 latency: float = 0.0, mlsd: bool = True):
+        """
+        Initialize the LocalFtpServer.
+
+        Args:
+            root (str): Local directory served as "/". Created if missing.
+            users (dict, optional): username -> password. Defaults to {"admin": "admin"}.
+            host (str): Listening address, also advertised in PASV replies. Default is "127.0.0.1".
+            latency (float): Seconds added before every control reply. Default is 0.
+            mlsd (bool): Support MLSD/MLST; False makes clients fall back to LIST. Default is True.
+        """
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+        self.users = users if users is not None else {"admin": "admin"}
+        self.host = host
+        self.latency = latency
+        self.mlsd = mlsd
+        self.connections = 0
+        self.commands = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one control connection until QUIT or disconnect.
+        """
+        session = FtpSession(self, reader, writer)
+        self.connections += 1
+        try:
+            await session.reply("220 LocalFtpServer ready.")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                command, _, argument = line.decode("utf-8", "replace").rstrip("\r\n").partition(" ")
+                command = command.upper()
+                self.commands += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                if command == "QUIT":
+                    await session.reply("221 Goodbye.")
+                    return
+                handler = getattr(self, f"_cmd_{command.lower()}", None)
+                if handler is None:
+                    await session.reply(f"502 Command {command} not implemented.")
+                elif not session.authenticated and command not in ("USER", "PASS", "FEAT", "SYST", "OPTS"):
+                    await session.reply("530 Please login with USER and PASS.")
+                else:
+                    try:
+                        await handler(session, argument)
+                    except FileNotFoundError:
+                        await session.reply("550 No such file or directory.")
+                    except FileExistsError:
+                        await session.reply("550 File exists.")
+                    except OSError as e:
+                        await session.reply(f"550 {e.strerror or e}.")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            await session.close_passive()
+            writer.close()
+
+    async def _cmd_user(self, session: FtpSession, argument: str) -> None:
+        session.user, session.authenticated = argument, False
+        await session.reply("331 Password required.")
+
+    async def _cmd_pass(self, session: FtpSession, argument: str) -> None:
+        if session.user in self.users and self.users[session.user] == argument:
+            session.authenticated = True
+            await session.reply("230 Login successful.")
+        else:
+            await session.reply("530 Login incorrect.")
+
+    async def _cmd_syst(self, session: FtpSession, argument: str) -> None:
+        await session.reply("215 UNIX Type: L8")
+
+    async def _cmd_feat(self, session: FtpSession, argument: str) -> None:
+        features = [feature for feature in FEATURES if self.mlsd or not feature.startswith("MLST")]
+        await session.reply("211-Features:\r\n" + "".join(f" {feature}\r\n" for feature in features) + "211 End")
+
+    async def _cmd_opts(self, session: FtpSession, argument: str) -> None:
+        await session.reply("200 OK.")
+
+    async def _cmd_noop(self, session: FtpSession, argument: str) -> None:
+        await session.reply("200 NOOP ok.")
+
+    async def _cmd_type(self, session: FtpSession, argument: str) -> None:
+        await session.reply(f"200 Type set to {argument or 'I'}.")
+
+    async def _cmd_pwd(self, session: FtpSession, argument: str) -> None:
+        await session.reply(f'257 "{session.cwd}" is the current directory.')
+
+    async def _cmd_cwd(self, session: FtpSession, argument: str) -> None:
+        virtual, local = session.resolve(argument)
+        if not os.path.isdir(local):
+            raise FileNotFoundError(local)
+        session.cwd = virtual
+        await session.reply("250 Directory changed.")
+
+    async def _cmd_cdup(self, session: FtpSession, argument: str) -> None:
+        await self._cmd_cwd(session, "..")
+
+    async def _cmd_mkd(self, session: FtpSession, argument: str) -> None:
+        virtual, local = session.resolve(argument)
+        os.mkdir(local)
+        await session.reply(f'257 "{virtual}" created.')
+
+    async def _cmd_rmd(self, session: FtpSession, argument: str) -> None:
+        os.rmdir(session.resolve(argument)[1])
+        await session.reply("250 Directory removed.")
+
+    async def _cmd_dele(self, session: FtpSession, argument: str) -> None:
+        os.remove(session.resolve(argument)[1])
+        await session.reply("250 File removed.")
+
+    async def _cmd_rnfr(self, session: FtpSession, argument: str) -> None:
+        local = session.resolve(argument)[1]
+        if not os.path.exists(local):
+            raise FileNotFoundError(local)
+        session.rename_from = local
+        await session.reply("350 Ready for RNTO.")
+
+    async def _cmd_rnto(self, session: FtpSession, argument: str) -> None:
+        if session.rename_from is None:
+            await session.reply("503 RNFR required first.")
+            return
+        shutil.move(session.rename_from, session.resolve(argument)[1])
+        session.rename_from = None
+        await session.reply("250 Rename successful.")
+
+    async def _cmd_size(self, session: FtpSession, argument: str) -> None:
+        local = session.resolve(argument)[1]
+        if not os.path.isfile(local):
+            raise FileNotFoundError(local)
+        await session.reply(f"213 {os.path.getsize(local)}")
+
+    async def _cmd_mdtm(self, session: FtpSession, argument: str) -> None:
+        local = session.resolve(argument)[1]
+        await session.reply(f"213 {format_modify(os.stat(local).st_mtime)}")
+
+    async def _cmd_rest(self, session: FtpSession, argument: str) -> None:
+        session.rest = int(argument or 0)
+        await session.reply(f"350 Restarting at {session.rest}.")
+
+    async def _cmd_pasv(self, session: FtpSession, argument: str) -> None:
+        await session.open_passive(extended=False)
+
+    async def _cmd_epsv(self, session: FtpSession, argument: str) -> None:
+        await session.open_passive(extended=True)
+
+    @staticmethod
+    def _list_targets(session: FtpSession, argument: str) -> List[Tuple[str, os.stat_result]]:
+        path = " ".join(part for part in argument.split() if not part.startswith("-"))
+        local = session.resolve(path)[1]
+        if os.path.isfile(local):
+            return [(os.path.basename(local), os.stat(local))]
+        with os.scandir(local) as entries:
+            return sorted((entry.name, entry.stat()) for entry in entries)
+
+    async def _cmd_list(self, session: FtpSession, argument: str) -> None:
+        lines = []
+        for name, info in self._list_targets(session, argument):
+            kind = "d" if stat.S_ISDIR(info.st_mode) else "-"
+            recent = 0 <= time.time() - info.st_mtime < LIST_RECENT_SECONDS
+            stamp = time.strftime("%b %d %H:%M" if recent else "%b %d  %Y", time.localtime(info.st_mtime))
+            lines.append(f"{kind}rw-r--r--    1 ftp      ftp      {info.st_size:>10} {stamp} {name}\r\n")
+        await session.send_data(["".join(lines).encode("utf-8")])
+
+    async def _cmd_nlst(self, session: FtpSession, argument: str) -> None:
+        names = [name for name, _ in self._list_targets(session, argument)]
+        await session.send_data(["".join(f"{name}\r\n" for name in names).encode("utf-8")])
+
+    async def _cmd_mlsd(self, session: FtpSession, argument: str) -> None:
+        if not self.mlsd:
+            await session.reply("502 Command MLSD not implemented.")
+            return
+        local = session.resolve(argument)[1]
+        if not os.path.isdir(local):
+            raise FileNotFoundError(local)
+        lines = []
+        for name, info in self._list_targets(session, argument):
+            kind = "dir" if stat.S_ISDIR(info.st_mode) else "file"
+            lines.append(f"type={kind};size={info.st_size};modify={format_modify(info.st_mtime)}; {name}\r\n")
+        await session.send_data(["".join(lines).encode("utf-8")])
+
+    async def _cmd_retr(self, session: FtpSession, argument: str) -> None:
+        local = session.resolve(argument)[1]
+        if not os.path.isfile(local):
+            raise FileNotFoundError(local)
+        offset, session.rest = session.rest, 0
+
+        def chunks() -> Iterable[bytes]:
+            with open(local, "rb") as file:
+                file.seek(offset)
+                while True:
+                    chunk = file.read(DATA_CHUNK)
+                    if not chunk:
+                        return
+                    yield chunk
+
+        await session.send_data(chunks())
+
+    async def _store(self, session: FtpSession, argument: str, append: bool) -> None:
+        local = session.resolve(argument)[1]
+        if not os.path.isdir(os.path.dirname(local)):
+            raise FileNotFoundError(local)
+        offset, session.rest = session.rest, 0
+        connection = await session.data_connection()
+        if connection is None:
+            return
+        await session.reply("150 Ready to receive.")
+        data_reader, data_writer = connection
+        mode = "ab" if append else ("r+b" if offset and os.path.exists(local) else "wb")
+        with open(local, mode) as file:
+            if offset and not append:
+                file.seek(offset)
+                file.truncate()
+            while True:
+                chunk = await data_reader.read(DATA_CHUNK)
+                if not chunk:
+                    break
+                file.write(chunk)
+        data_writer.close()
+        await session.reply("226 Transfer complete.")
+
+    async def _cmd_stor(self, session: FtpSession, argument: str) -> None:
+        await self._store(session, argument, append=False)
+
+    async def _cmd_appe(self, session: FtpSession, argument: str) -> None:
+        await self._store(session, argument, append=True)
+
+
+class FtpServerThread(ServerThread):
+    """
+    Run a LocalFtpServer in a background event loop, so blocking ftplib code can use it.
+
+    Example:
+        >>> with FtpServerThread(LocalFtpServer("/tmp/ftp_root")) as port:
+        ...     print("FTP listening on port", port)
+    """
+
+    def __init__(self, server: LocalFtpServer, port: int = 0):
+        """
+        Initialize the FtpServerThread.
+
+        Args:
+            server (LocalFtpServer): The server to run.
+            port (int): Control port; 0 picks a free port. Default is 0.
+        """
+        self.server = server
+        self.requested_port = port
+        super().__init__([(server.handle, server.host, port)])
+
+    @property
+    def port(self) -> int:
+        """The bound control port, or 0 before start()."""
+        return self.ports[0] if self.ports else 0
+
+    def start(self) -> int:
+        """
+        Start serving and return the bound control port.
+
+        Raises:
+            OSError: If the port cannot be bound.
+        """
+        super().start()
+        return self.port
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        # Credentials for the local server come from FTP_USER / FTP_PASS, as for the clients.
+        user, password = os.environ.get("FTP_USER", "admin"), os.environ.get("FTP_PASS", "admin")
+        with FtpServerThread(LocalFtpServer("ftp_root", users={user: password}), port=2121) as port:
+            print(f"[+] Serving ./ftp_root on ftp://127.0.0.1:{port} (Ctrl+C to stop)")
+            threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"[-] Error: {e}")
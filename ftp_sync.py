@@ -0,0 +1,178 @@
+import ftplib
+import os
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
+
+from ftp_transfer import FtpConnectionPool, FtpTransferManager, facts_mtime, list_directory, load_ftp_credentials
+from main import JsonFileReader, JsonFileWriter
+
+# LIST timestamps have minute precision; MLSD ones are exact to the second.
+MTIME_TOLERANCE = 60.0
+
+
+class FtpSync:
+    """
+    Push local files to an FTP server, moving only what changed.
+
+    A JSON manifest remembers, per remote path, the size and mtime of the
+    local file last uploaded there. Files whose size and mtime still match the
+    manifest are skipped without touching the server, so a nightly run over a
+    large remote tree lists nothing when nothing changed. Only the remote
+    directories that hold new or changed files are listed (MLSD, falling back
+    to LIST), and a file the manifest has no entry for that is already there
+    with the same size and a newer timestamp is adopted instead of being re-sent.
+
+    Uploads are marked "partial" in the manifest before they start; if a run
+    is interrupted, the next one asks the server how much arrived and resumes
+    from that byte with REST instead of starting over.
+
+    Example:
+        >>> with FtpConnectionPool(host, user, password, max_connections=8) as pool:
+        ...     sync = FtpSync(FtpTransferManager(pool), "ftp_manifest.json")
+        ...     results = sync.push(r"C:\\captures", "/test_data/glenka/captures")
+    """
+
+    def __init__(self, manager: FtpTransferManager, manifest_path: str = "ftp_manifest.json",
+                 verify_remote: bool = False):
+        """
+        Initialize the FtpSync.
+
+        Args:
+            manager (FtpTransferManager): Transfers files over its connection pool.
+            manifest_path (str): JSON manifest of earlier uploads. Default is "ftp_manifest.json".
+            verify_remote (bool): List the remote side even for files the manifest marks as
+                uploaded (catches files deleted on the server). Default is False.
+        """
+        self.manager = manager
+        self.manifest_path = manifest_path
+        self.verify_remote = verify_remote
+        self.manifest: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(manifest_path):
+            self.manifest = JsonFileReader(manifest_path).read()
+
+    def save_manifest(self) -> None:
+        """
+        Write the manifest atomically, so an interrupted run never leaves it truncated.
+        """
+        temporary = f"{self.manifest_path}.tmp"
+        with self._lock:
+            JsonFileWriter(temporary).write(self.manifest, indent=None)
+        os.replace(temporary, self.manifest_path)
+
+    def _list_remote(self, directories: Iterable[str]) -> Dict[str, Dict[str, Dict[str, str]]]:
+        def listing(directory: str) -> Tuple[str, Dict[str, Dict[str, str]]]:
+            try:
+                with self.manager.pool.connection() as ftp:
+                    return directory, dict(list_directory(ftp, directory))
+            except ftplib.error_perm:
+                return directory, {}  # Not created yet.
+
+        with ThreadPoolExecutor(max_workers=self.manager.max_workers) as executor:
+            return dict(executor.map(listing, sorted(set(directories))))
+
+    def plan(self, pairs: Iterable[Tuple[str, str]]) -> Tuple[List[Tuple[str, str, int]], List[str]]:
+        """
+        Decide what to send for (local path, remote path) pairs.
+
+        A manifest entry is trusted: a file whose size and mtime changed since
+        it was recorded is sent again, whatever the server shows. The remote
+        size and timestamp are only used to adopt files the manifest has no
+        entry for, and (with verify_remote) to re-send recorded files that are
+        missing on the server.
+
+        Returns:
+            Tuple[list, list]: (local, remote, resume offset) uploads, and the remote paths left as they are.
+        """
+        candidates = []
+        unchanged = []
+        uploads = []
+        for local_path, remote_path in pairs:
+            info = os.stat(local_path)
+            entry = self.manifest.get(remote_path)
+            signature = (info.st_size, int(info.st_mtime))
+            same_source = entry is not None and (entry["size"], entry["mtime"]) == signature
+            if entry is not None and not same_source:
+                uploads.append((local_path, remote_path, 0))
+            elif same_source and entry["status"] == "ok" and not self.verify_remote:
+                unchanged.append(remote_path)
+            else:
+                candidates.append((local_path, remote_path, signature, entry))
+
+        listings = self._list_remote(posixpath.dirname(remote_path) for _, remote_path, _, _ in candidates)
+        for local_path, remote_path, (size, mtime), entry in candidates:
+            facts = listings[posixpath.dirname(remote_path)].get(posixpath.basename(remote_path))
+            remote_size = int(facts["size"]) if facts and facts.get("size", "").isdigit() else None
+            if entry is None:
+                adopt = remote_size == size and (facts_mtime(facts) or 0) >= mtime - MTIME_TOLERANCE
+            else:
+                adopt = remote_size == size  # Recorded from this very file; a "partial" one may have completed.
+            if adopt:
+                self.manifest[remote_path] = {"size": size, "mtime": mtime, "status": "ok"}
+                unchanged.append(remote_path)
+            elif entry is not None and entry["status"] == "partial" and remote_size is not None \
+                    and remote_size < size:
+                uploads.append((local_path, remote_path, remote_size))
+            else:
+                uploads.append((local_path, remote_path, 0))
+        return uploads, unchanged
+
+    def sync_files(self, pairs: Iterable[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Upload the new, changed and partially uploaded files among (local path, remote path) pairs.
+
+        Returns:
+            List[Dict[str, Any]]: FtpTransferManager.upload_file() results for the files sent,
+            plus a status "skipped" row for every file left as it is.
+        """
+        pairs = list(pairs)
+        uploads, unchanged = self.plan(pairs)
+        for local_path, remote_path, _ in uploads:
+            info = os.stat(local_path)
+            self.manifest[remote_path] = {"size": info.st_size, "mtime": int(info.st_mtime), "status": "partial"}
+        self.save_manifest()
+
+        results = self.manager.upload_files(uploads)
+        for result in results:
+            if result["status"] == "ok":
+                self.manifest[result["remote"]]["status"] = "ok"
+        self.save_manifest()
+        local_by_remote = {remote_path: local_path for local_path, remote_path in pairs}
+        results.extend({"local": local_by_remote[remote_path], "remote": remote_path, "status": "skipped",
+                        "offset": 0, "bytes": 0, "seconds": 0.0, "attempts": 0, "error": ""}
+                       for remote_path in unchanged)
+        return results
+
+    def push(self, local_dir: str, remote_dir: str) -> List[Dict[str, Any]]:
+        """
+        Sync a local directory tree to remote_dir.
+
+        Returns:
+            List[Dict[str, Any]]: See sync_files().
+        """
+        pairs = []
+        for root, _, files in os.walk(local_dir):
+            relative = os.path.relpath(root, local_dir)
+            remote_root = remote_dir if relative == "." else posixpath.join(remote_dir, *relative.split(os.sep))
+            pairs.extend((os.path.join(root, name), posixpath.join(remote_root, name)) for name in files)
+        return self.sync_files(pairs)
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        with FtpConnectionPool(**load_ftp_credentials(), max_connections=8) as pool:
+            sync = FtpSync(FtpTransferManager(pool), "ftp_manifest.json")
+            started = time.perf_counter()
+            results = sync.push(r"C:\Users\glenka\OneDrive - Cisco\Documents\Notepad++ Files", "/test_data/glenka/GTP")
+            sent = [result for result in results if result["status"] != "skipped"]
+            print(f"[+] {len(sent)} sent, {len(results) - len(sent)} unchanged "
+                  f"in {time.perf_counter() - started:.2f}s")
+            for result in sent:
+                if result["status"] != "ok":
+                    print(f"[-] {result['local']}: {result['error']}")
+    except Exception as e:
+        print(f"[-] Error: {e}")
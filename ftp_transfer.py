@@ -0,0 +1,607 @@
+import calendar
+import ftplib
+import os
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from main import JsonFileReader
+
+DEFAULT_BLOCKSIZE = 1024 * 1024
+
+# Connection settings come from these environment variables, or else from FTP_CONFIG_FILE.
+FTP_CONFIG_FILE = "ftp_config.json"
+FTP_ENVIRONMENT = {"host": "FTP_HOST", "port": "FTP_PORT", "username": "FTP_USER", "password": "FTP_PASS"}
+
+# "drwxr-xr-x    2 ftp      ftp          4096 Feb 15 16:18 captures"
+LIST_FIELDS = 9
+LIST_MONTHS = {name: number for number, name in enumerate(calendar.month_abbr) if name}
+
+
+def load_ftp_credentials(config_path: str = FTP_CONFIG_FILE) -> Dict[str, Any]:
+    """
+    Return FTP connection settings, keeping credentials out of the source.
+
+    Each of "host", "port", "username" and "password" is read from its
+    FTP_ENVIRONMENT variable (FTP_HOST, FTP_PORT, FTP_USER, FTP_PASS) or, if
+    that is unset, from the JSON file at config_path.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for FtpConnectionPool.
+
+    Raises:
+        ValueError: If the host, username or password is found in neither place.
+
+    Example:
+        >>> pool = FtpConnectionPool(**load_ftp_credentials(), max_connections=8)
+    """
+    config: Dict[str, Any] = {}
+    if config_path and os.path.exists(config_path):
+        config = JsonFileReader(config_path).read()
+    credentials = {key: os.environ.get(variable) or config.get(key) for key, variable in FTP_ENVIRONMENT.items()}
+    missing = [FTP_ENVIRONMENT[key] for key in ("host", "username", "password") if not credentials[key]]
+    if missing:
+        raise ValueError(f"FTP settings missing: set {', '.join(missing)} or add them to {config_path}.")
+    credentials["port"] = int(credentials["port"] or 21)
+    return credentials
+
+
+class LocalFileError(OSError):
+    """
+    A local file could not be read or written during a transfer; retrying the transfer will not help.
+    """
+
+
+@contextmanager
+def local_file_errors(path: str) -> Iterator[None]:
+    """
+    Re-raise OSErrors from local file operations as LocalFileError, so they are not taken for network errors.
+    """
+    try:
+        yield
+    except LocalFileError:
+        raise
+    except OSError as e:
+        raise LocalFileError(f"Local file {path}: {e}") from e
+
+
+class LocalFileReader:
+    """
+    The ``fp`` handed to storbinary: reads an open file and reports read errors as LocalFileError.
+    """
+
+    __slots__ = ("file", "path")
+
+    def __init__(self, file: BinaryIO, path: str):
+        self.file = file
+        self.path = path
+
+    def read(self, size: int = -1) -> bytes:
+        with local_file_errors(self.path):
+            return self.file.read(size)
+
+
+class PooledFtp:
+    """
+    A logged-in FTP control connection owned by an FtpConnectionPool.
+
+    Attributes:
+    -----------
+    ftp : ftplib.FTP
+        The connection.
+    last_used : float
+        time.monotonic() when it was last released back to the pool.
+    """
+
+    __slots__ = ("ftp", "last_used")
+
+    def __init__(self, ftp: ftplib.FTP):
+        self.ftp = ftp
+        self.last_used = time.monotonic()
+
+
+class FtpConnectionPool:
+    """
+    A thread-safe pool of logged-in FTP connections to one server.
+
+    Connect and USER/PASS happen once per connection instead of once per file.
+    Idle connections are probed with NOOP before reuse when they have been idle
+    longer than ``health_check_interval`` and dropped after ``idle_timeout``; at
+    most ``max_connections`` are open at any time, extra callers wait.
+
+    Example:
+        >>> with FtpConnectionPool(**load_ftp_credentials(), max_connections=8) as pool:
+        ...     with pool.connection() as ftp:
+        ...         print(ftp.nlst("/test_data"))
+    """
+
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        port: int = 21,
+        max_connections: int = 4,
+        timeout: float = 30.0,
+        idle_timeout: float = 120.0,
+        health_check_interval: float = 15.0,
+        passive: bool = True,
+    ):
+        """
+        Initialize the FtpConnectionPool.
+
+        Args:
+            host (str): FTP server address.
+            username (str): Login user.
+            password (str): Login password.
+            port (int): Control port. Default is 21.
+            max_connections (int): Upper bound of concurrent connections. Default is 4.
+            timeout (float): Socket timeout in seconds. Default is 30.
+            idle_timeout (float): Seconds after which an unused connection is closed. Default is 120.
+            health_check_interval (float): Idle seconds after which a connection is probed with NOOP. Default is 15.
+            passive (bool): Use passive mode data connections. Default is True.
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1.")
+        self.host = host
+        self.username = username
+        self.password = password
+        self.port = port
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.passive = passive
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+        self._idle: List[PooledFtp] = []
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._closed = False
+
+    def __enter__(self) -> "FtpConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close_all()
+
+    def _open(self) -> PooledFtp:
+        ftp = ftplib.FTP(timeout=self.timeout)
+        ftp.connect(self.host, self.port)
+        ftp.login(self.username, self.password)
+        ftp.set_pasv(self.passive)
+        ftp.voidcmd("TYPE I")
+        with self._lock:
+            self.connections_opened += 1
+        return PooledFtp(ftp)
+
+    @staticmethod
+    def _disconnect(pooled: PooledFtp) -> None:
+        try:
+            pooled.ftp.quit()
+        except Exception:
+            pooled.ftp.close()
+
+    def _take_idle(self) -> Optional[PooledFtp]:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                pooled = self._idle.pop()
+            idle = now - pooled.last_used
+            if idle <= self.idle_timeout:
+                if idle < self.health_check_interval:
+                    return pooled
+                try:
+                    pooled.ftp.voidcmd("NOOP")
+                    return pooled
+                except (ftplib.Error, OSError, EOFError):
+                    pass
+            self._disconnect(pooled)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[ftplib.FTP]:
+        """
+        Borrow a logged-in connection in binary mode.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free connection slot. Waits forever by default.
+
+        Yields:
+            ftplib.FTP: The connection. It goes back to the pool when the block exits,
+            or is closed if the block raised anything but an FTP permission error.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+            TimeoutError: If no connection slot frees up within timeout.
+        """
+        if self._closed:
+            raise RuntimeError("FtpConnectionPool is closed.")
+        if not self._slots.acquire(timeout=timeout if timeout is not None else -1):
+            raise TimeoutError(f"Timed out waiting for an FTP connection to {self.host}:{self.port}")
+        try:
+            pooled = self._take_idle() or self._open()
+            try:
+                yield pooled.ftp
+            except ftplib.error_perm:
+                # A 5xx reply (missing file, no permission) leaves the control connection usable.
+                self._release(pooled)
+                raise
+            except BaseException:
+                self._disconnect(pooled)
+                raise
+            self._release(pooled)
+        finally:
+            self._slots.release()
+
+    def _release(self, pooled: PooledFtp) -> None:
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            if not self._closed:
+                self._idle.append(pooled)
+                return
+        self._disconnect(pooled)
+
+    def close_all(self) -> None:
+        """
+        Close every idle connection and refuse new checkouts. Connections still
+        in use are closed when they are released.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._disconnect(pooled)
+
+
+def list_directory(ftp: ftplib.FTP, path: str) -> List[Tuple[str, Dict[str, str]]]:
+    """
+    List a remote directory with its facts in one round trip.
+
+    MLSD is used when the server supports it; otherwise the Unix-style LIST
+    output is parsed into the same "type", "size" and "modify" facts. "." and ".." are
+    left out.
+
+    Args:
+        ftp (ftplib.FTP): A logged-in connection.
+        path (str): Remote directory.
+
+    Returns:
+        List[Tuple[str, Dict[str, str]]]: (name, facts) pairs; facts["type"] is "file", "dir" or "link".
+    """
+    try:
+        entries = list(ftp.mlsd(path, facts=["type", "size", "modify"]))
+    except ftplib.error_perm as e:
+        if not str(e).startswith(("500", "502", "504")):
+            raise
+        entries = parse_list_lines(_list_lines(ftp, path))
+    return [(name, facts) for name, facts in entries if facts.get("type", "file") not in ("cdir", "pdir")
+            and name not in (".", "..")]
+
+
+def _list_lines(ftp: ftplib.FTP, path: str) -> List[str]:
+    lines: List[str] = []
+    ftp.retrlines(f"LIST {path}", lines.append)
+    return lines
+
+
+def parse_list_lines(lines: Iterable[str], now: Optional[float] = None) -> List[Tuple[str, Dict[str, str]]]:
+    """
+    Parse Unix-style LIST lines into (name, facts) pairs.
+
+    The "modify" fact is rebuilt in MLSD form ("YYYYMMDDHHMMSS") from the
+    listing date; LIST only has minute precision, and recent entries carry no
+    year, so the most recent year that does not put them in the future is used.
+    Unlike MLSD, LIST dates are in the server's local time; such entries carry
+    a "zone": "local" fact so facts_mtime() converts them accordingly.
+    """
+    current = time.localtime(now)
+    entries = []
+    for line in lines:
+        parts = line.split(None, LIST_FIELDS - 1)
+        if len(parts) < LIST_FIELDS or line.startswith("total "):
+            continue
+        kind = {"d": "dir", "l": "link"}.get(line[0], "file")
+        name = parts[-1]
+        if kind == "link":
+            name = name.split(" -> ", 1)[0]
+        facts = {"type": kind, "size": parts[4]}
+        month, day, year_or_time = LIST_MONTHS.get(parts[5].title()), parts[6], parts[7]
+        if month and day.isdigit():
+            if ":" in year_or_time:
+                hour, minute = year_or_time.split(":", 1)
+                year = current.tm_year if (month, int(day)) <= (current.tm_mon, current.tm_mday + 1) \
+                    else current.tm_year - 1
+            else:
+                year, hour, minute = int(year_or_time), "0", "0"
+            facts["modify"] = f"{year:04d}{month:02d}{int(day):02d}{int(hour):02d}{int(minute):02d}00"
+            facts["zone"] = "local"
+        entries.append((name, facts))
+    return entries
+
+
+def facts_mtime(facts: Dict[str, str]) -> Optional[float]:
+    """
+    Return the "modify" fact of a listing entry as a UTC epoch, or None if absent.
+
+    MLSD times are UTC. LIST times ("zone": "local") are taken to be in this
+    machine's time zone, the best guess for a server whose zone is not reported.
+    """
+    modify = facts.get("modify", "")
+    try:
+        parsed = time.strptime(modify[:14], "%Y%m%d%H%M%S")
+    except ValueError:
+        return None
+    if facts.get("zone") == "local":
+        return time.mktime(parsed[:8] + (-1,))
+    return float(calendar.timegm(parsed))
+
+
+class FtpTransferManager:
+    """
+    Parallel uploads, downloads and directory mirroring over an FtpConnectionPool.
+
+    Each worker thread borrows a pooled connection per file, so thousands of
+    small files cost one login per connection rather than one per file, and
+    large files stream through ``storbinary``/``retrbinary`` in ``blocksize``
+    chunks. Remote directories are created once and remembered, and an
+    existing directory is not an error.
+
+    Example:
+        >>> with FtpConnectionPool(host, user, password, max_connections=8) as pool:
+        ...     manager = FtpTransferManager(pool)
+        ...     results = manager.mirror_upload(r"C:\\captures", "/test_data/glenka/captures")
+    """
+
+    def __init__(self, pool: FtpConnectionPool, blocksize: int = DEFAULT_BLOCKSIZE,
+                 max_workers: Optional[int] = None, retries: int = 1):
+        """
+        Initialize the FtpTransferManager.
+
+        Args:
+            pool (FtpConnectionPool): Connections to the server.
+            blocksize (int): Bytes per storbinary/retrbinary block. Default is 1 MiB.
+            max_workers (int, optional): Parallel transfers. Defaults to the pool's max_connections.
+            retries (int): Extra attempts for a transfer that fails with a network error. Default is 1.
+        """
+        self.pool = pool
+        self.blocksize = blocksize
+        self.max_workers = max_workers or pool.max_connections
+        self.retries = retries
+        self._directories: Set[str] = set()
+        self._directories_lock = threading.Lock()
+
+    def ensure_directory(self, ftp: ftplib.FTP, path: str) -> None:
+        """
+        Create a remote directory and its parents; existing directories are fine.
+        """
+        path = posixpath.normpath(path)
+        with self._directories_lock:
+            if path in self._directories:
+                return
+        current = ""
+        for part in path.strip("/").split("/"):
+            current = f"{current}/{part}" if current or path.startswith("/") else part
+            with self._directories_lock:
+                if current in self._directories:
+                    continue
+            try:
+                ftp.mkd(current)
+            except ftplib.error_perm as e:
+                # 550/521: already exists (or not ours to create); the later STOR reports real problems.
+                if not str(e).startswith(("550", "521")):
+                    raise
+            with self._directories_lock:
+                self._directories.add(current)
+
+    def _attempt(self, action, **result: Any) -> Dict[str, Any]:
+        started = time.perf_counter()
+        for attempt in range(self.retries + 1):
+            try:
+                with self.pool.connection() as ftp:
+                    result["bytes"] = action(ftp)
+                result["status"] = "ok"
+                break
+            except (ftplib.error_perm, LocalFileError) as e:
+                result["status"], result["error"] = "failed", str(e)
+                break
+            except (ftplib.Error, OSError, EOFError) as e:
+                result["status"], result["error"] = "failed", str(e)
+        result["attempts"] = attempt + 1
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        return result
+
+    @staticmethod
+    def _local_failure(result: Dict[str, Any], error: OSError) -> Dict[str, Any]:
+        # The local file could not be opened: no connection was borrowed and nothing is retried.
+        result.update(status="failed", bytes=0, seconds=0.0, attempts=0, error=f"Local file {result['local']}: {error}")
+        return result
+
+    def upload_file(self, local_path: str, remote_path: str, offset: int = 0) -> Dict[str, Any]:
+        """
+        Upload one file, creating the remote directory if needed.
+
+        The local file is opened before a connection is borrowed, so a missing
+        or unreadable source fails at once without costing a connection or a
+        retry.
+
+        Args:
+            local_path (str): File to send.
+            remote_path (str): Destination path on the server.
+            offset (int): Resume a partial upload from this byte with REST. Default is 0 (whole file).
+
+        Returns:
+            Dict[str, Any]: local, remote, status ("ok"/"failed"), offset, bytes sent, seconds, attempts and error.
+        """
+        result = {"local": local_path, "remote": remote_path, "offset": offset, "bytes": 0, "error": ""}
+        try:
+            file = open(local_path, "rb")
+        except OSError as e:
+            return self._local_failure(result, e)
+
+        def upload(ftp: ftplib.FTP) -> int:
+            self.ensure_directory(ftp, posixpath.dirname(remote_path) or "/")
+            with local_file_errors(local_path):
+                file.seek(offset)
+            ftp.storbinary(f"STOR {remote_path}", LocalFileReader(file, local_path), blocksize=self.blocksize,
+                           rest=offset or None)
+            return file.tell() - offset
+
+        with file:
+            return self._attempt(upload, **result)
+
+    def download_file(self, remote_path: str, local_path: str, offset: int = 0) -> Dict[str, Any]:
+        """
+        Download one file, creating the local directory if needed.
+
+        The local file is opened before a connection is borrowed. Resuming into
+        a local file that does not exist downloads the whole file instead
+        (the result's offset is then 0).
+
+        Args:
+            remote_path (str): File on the server.
+            local_path (str): Destination file.
+            offset (int): Resume by appending from this byte with REST. Default is 0 (whole file).
+
+        Returns:
+            Dict[str, Any]: local, remote, status ("ok"/"failed"), offset, bytes received, seconds, attempts and error.
+        """
+        if offset and not os.path.exists(local_path):
+            offset = 0
+        result = {"local": local_path, "remote": remote_path, "offset": offset, "bytes": 0, "error": ""}
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(local_path)), exist_ok=True)
+            file = open(local_path, "r+b" if offset else "wb")
+        except OSError as e:
+            return self._local_failure(result, e)
+
+        def write(block: bytes) -> None:
+            with local_file_errors(local_path):
+                file.write(block)
+
+        def download(ftp: ftplib.FTP) -> int:
+            with local_file_errors(local_path):
+                file.seek(offset)
+                file.truncate()
+            ftp.retrbinary(f"RETR {remote_path}", write, blocksize=self.blocksize, rest=offset or None)
+            return file.tell() - offset
+
+        with file:
+            return self._attempt(download, **result)
+
+    def upload_files(self, pairs: Iterable[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Upload (local path, remote path[, offset]) tuples in parallel.
+
+        Returns:
+            List[Dict[str, Any]]: One upload_file() result per pair, in input order.
+        """
+        pairs = list(pairs)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda pair: self.upload_file(*pair), pairs))
+
+    def download_files(self, pairs: Iterable[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Download (remote path, local path[, offset]) tuples in parallel.
+
+        Returns:
+            List[Dict[str, Any]]: One download_file() result per pair, in input order.
+        """
+        pairs = list(pairs)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda pair: self.download_file(*pair), pairs))
+
+    def mirror_upload(self, local_dir: str, remote_dir: str) -> List[Dict[str, Any]]:
+        """
+        Upload a local directory tree to remote_dir.
+
+        The remote directories are created first over one connection, parents
+        before children, so the parallel uploads never race on MKD.
+
+        Returns:
+            List[Dict[str, Any]]: One upload_file() result per file.
+        """
+        directories = []
+        pairs = []
+        for root, _, files in os.walk(local_dir):
+            relative = os.path.relpath(root, local_dir)
+            remote_root = remote_dir if relative == "." else posixpath.join(remote_dir, *relative.split(os.sep))
+            directories.append(remote_root)
+            pairs.extend((os.path.join(root, name), posixpath.join(remote_root, name)) for name in files)
+        with self.pool.connection() as ftp:
+            for directory in directories:
+                self.ensure_directory(ftp, directory)
+        return self.upload_files(pairs)
+
+    def walk_remote(self, remote_dir: str) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        List every file under a remote directory, one listing per directory, directories listed in parallel.
+
+        Returns:
+            List[Tuple[str, Dict[str, str]]]: (remote path, facts) for every file.
+        """
+        files: List[Tuple[str, Dict[str, str]]] = []
+        pending = [remote_dir]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending:
+                listings = list(executor.map(self._list, pending))
+                pending = []
+                for directory, entries in listings:
+                    for name, facts in entries:
+                        path = posixpath.join(directory, name)
+                        if facts.get("type") == "dir":
+                            pending.append(path)
+                        elif facts.get("type", "file") == "file":
+                            files.append((path, facts))
+        return files
+
+    def _list(self, directory: str) -> Tuple[str, List[Tuple[str, Dict[str, str]]]]:
+        with self.pool.connection() as ftp:
+            return directory, list_directory(ftp, directory)
+
+    def mirror_download(self, remote_dir: str, local_dir: str) -> List[Dict[str, Any]]:
+        """
+        Download a remote directory tree into local_dir.
+
+        Returns:
+            List[Dict[str, Any]]: One download_file() result per file.
+        """
+        pairs = []
+        for remote_path, _ in self.walk_remote(remote_dir):
+            relative = posixpath.relpath(remote_path, remote_dir)
+            pairs.append((remote_path, os.path.join(local_dir, *relative.split("/"))))
+        return self.download_files(pairs)
+
+
+def summarize_transfers(results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """
+    Summarize transfer results: files, failures, bytes, MB/s and files/s over elapsed wall-clock seconds.
+    """
+    moved = sum(result["bytes"] for result in results if result["status"] == "ok")
+    return {
+        "files": len(results),
+        "failed": sum(1 for result in results if result["status"] != "ok"),
+        "bytes": moved,
+        "seconds": round(elapsed, 3),
+        "mb_per_sec": round(moved / elapsed / 1e6, 2) if elapsed else 0.0,
+        "files_per_sec": round(len(results) / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        with FtpConnectionPool(**load_ftp_credentials(), max_connections=8) as pool:
+            manager = FtpTransferManager(pool, blocksize=DEFAULT_BLOCKSIZE)
+            started = time.perf_counter()
+            results = manager.mirror_upload(r"C:\Users\glenka\OneDrive - Cisco\Documents\Notepad++ Files",
+                                            "/test_data/glenka/GTP")
+            print(summarize_transfers(results, time.perf_counter() - started))
+            for result in results:
+                if result["status"] != "ok":
+                    print(f"[-] {result['local']}: {result['error']}")
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -0,0 +1,309 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from main import CsvFileWriter, JsonFileWriter
+
+SUB_BUCKET_BITS = 7
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+TIMESERIES_FIELDS = ["second", "requests", "errors", "bytes", "mean_ms"]
+
+
+class LatencyHistogram:
+    """
+    A log-linear (HDR-style) histogram of latencies in microseconds.
+
+    Values below 2**sub_bucket_bits get a bucket each; above that, every
+    power of two is split into 2**(sub_bucket_bits - 1) equal buckets, so
+    any recorded value is reported within 1 / 2**(sub_bucket_bits - 1) of
+    itself (under 1.6% with the default of 7 bits) however long the tail is.
+    Buckets are kept in a sparse dict, so histograms are cheap to create,
+    copy and merge.
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> for latency in (0.012, 0.015, 0.250):
+        ...     histogram.record(latency)
+        >>> print(histogram.percentiles())
+    """
+
+    __slots__ = ("sub_bucket_bits", "counts", "count", "total", "min", "max")
+
+    def __init__(self, sub_bucket_bits: int = SUB_BUCKET_BITS):
+        """
+        Initialize the LatencyHistogram.
+
+        Args:
+            sub_bucket_bits (int): Precision; values are bucketed to 1 / 2**(bits - 1). Default is 7.
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def bucket_of(self, value: int) -> int:
+        """Return the bucket index of a value in microseconds."""
+        bits = self.sub_bucket_bits
+        if value < (1 << bits):
+            return value
+        shift = value.bit_length() - bits
+        return (1 << bits) + (shift - 1) * (1 << (bits - 1)) + (value >> shift) - (1 << (bits - 1))
+
+    def bucket_range(self, bucket: int) -> range:
+        """Return the values (in microseconds) that fall into a bucket."""
+        bits = self.sub_bucket_bits
+        if bucket < (1 << bits):
+            return range(bucket, bucket + 1)
+        shift, offset = divmod(bucket - (1 << bits), 1 << (bits - 1))
+        top = offset + (1 << (bits - 1))
+        return range(top << (shift + 1), (top + 1) << (shift + 1))
+
+    def record(self, seconds: float) -> None:
+        """Record one latency given in seconds."""
+        value = max(int(seconds * 1_000_000), 0)
+        bucket = self.bucket_of(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add another histogram's counts to this one.
+
+        Raises:
+            ValueError: If the histograms have different precision.
+        """
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms of different precision.")
+        for bucket, count in other.counts.copy().items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def value_at_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Return the latency in seconds at or below which percentile % of the values fall.
+
+        The bucket's highest value is reported (capped at the largest value
+        recorded), so a percentile is never understated.
+        """
+        if not self.count:
+            return None
+        rank = max(1, -(-self.count * percentile // 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self.bucket_range(bucket)[-1], self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    def percentiles(self, percentiles=PERCENTILES) -> Dict[str, Optional[float]]:
+        """
+        Return count, min, mean, max and the given percentiles in milliseconds, e.g. {"p99_ms": 12.4}.
+        """
+        def ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000, 3)
+
+        summary = {
+            "count": self.count,
+            "min_ms": ms(None if self.min is None else self.min / 1_000_000),
+            "mean_ms": ms(self.total / self.count / 1_000_000 if self.count else None),
+            "max_ms": ms(None if self.max is None else self.max / 1_000_000),
+        }
+        for percentile in percentiles:
+            summary[f"p{percentile:g}_ms".replace(".", "")] = ms(self.value_at_percentile(percentile))
+        return summary
+
+
+class MetricsRecorder:
+    """
+    The metrics of one worker: a latency histogram and per-second counters.
+
+    A recorder is written by a single thread (or a single event loop) only,
+    so recording takes no lock; LoadMetrics merges all recorders on demand.
+    """
+
+    __slots__ = ("histogram", "seconds", "started")
+
+    def __init__(self, started: float, sub_bucket_bits: int = SUB_BUCKET_BITS):
+        self.histogram = LatencyHistogram(sub_bucket_bits)
+        self.seconds: Dict[int, List[int]] = {}
+        self.started = started
+
+    def record(self, seconds: float, ok: bool = True, nbytes: int = 0, at: Optional[float] = None) -> None:
+        """
+        Record one operation.
+
+        Args:
+            seconds (float): Its latency.
+            ok (bool): False for a failed operation; its latency is counted in the time series only.
+            nbytes (int): Bytes it transferred.
+            at (float, optional): time.monotonic() at which it completed. Defaults to now.
+        """
+        second = int((time.monotonic() if at is None else at) - self.started)
+        counters = self.seconds.get(second)
+        if counters is None:
+            counters = self.seconds[second] = [0, 0, 0, 0]
+        counters[0] += 1
+        counters[2] += nbytes
+        counters[3] += int(seconds * 1_000_000)
+        if ok:
+            self.histogram.record(seconds)
+        else:
+            counters[1] += 1
+
+
+class LoadMetrics:
+    """
+    Aggregate load-test results from many workers without sharing a list.
+
+    Each thread records into its own MetricsRecorder (handed out through a
+    thread-local on first use), so the hot path is a few dict updates with
+    no lock and no contention. Successful latencies go into a log-linear
+    histogram, which keeps tail percentiles (p99, p99.9) accurate at a fixed
+    memory cost; every operation is also counted in a per-second time
+    series of requests, errors, bytes and mean latency. Reports merge the
+    recorders, and can be exported with CsvFileWriter and JsonFileWriter.
+
+    Example:
+        >>> metrics = LoadMetrics()
+        >>> metrics.record(0.021, ok=True, nbytes=4096)
+        >>> print(metrics.summary())
+        >>> metrics.write_csv("timeseries.csv")
+    """
+
+    def __init__(self, sub_bucket_bits: int = SUB_BUCKET_BITS):
+        """
+        Initialize LoadMetrics; the time series starts now.
+
+        Args:
+            sub_bucket_bits (int): Histogram precision. Default is 7 (under 1.6% error).
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.started = time.monotonic()
+        self.started_epoch = time.time()
+        self._recorders: List[MetricsRecorder] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def recorder(self) -> MetricsRecorder:
+        """
+        Return the calling thread's recorder, creating it on first use.
+        """
+        recorder = getattr(self._local, "recorder", None)
+        if recorder is None:
+            recorder = self._local.recorder = MetricsRecorder(self.started, self.sub_bucket_bits)
+            with self._lock:
+                self._recorders.append(recorder)
+        return recorder
+
+    def record(self, seconds: float, ok: bool = True, nbytes: int = 0, at: Optional[float] = None) -> None:
+        """
+        Record one operation in the calling thread's recorder (see MetricsRecorder.record).
+        """
+        self.recorder().record(seconds, ok, nbytes, at)
+
+    def histogram(self) -> LatencyHistogram:
+        """
+        Return the merged latency histogram of all workers.
+        """
+        merged = LatencyHistogram(self.sub_bucket_bits)
+        with self._lock:
+            recorders = list(self._recorders)
+        for recorder in recorders:
+            merged.merge(recorder.histogram)
+        return merged
+
+    def timeseries(self) -> List[Dict[str, Any]]:
+        """
+        Return one row per second since the start: requests, errors, bytes and mean latency.
+
+        Seconds without any operation are included with zero counts.
+        """
+        merged: Dict[int, List[int]] = {}
+        with self._lock:
+            recorders = list(self._recorders)
+        for recorder in recorders:
+            for second, counters in recorder.seconds.copy().items():
+                total = merged.setdefault(second, [0, 0, 0, 0])
+                for index, value in enumerate(list(counters)):
+                    total[index] += value
+        if not merged:
+            return []
+        rows = []
+        for second in range(min(merged), max(merged) + 1):
+            requests, errors, nbytes, micros = merged.get(second, (0, 0, 0, 0))
+            rows.append({"second": second, "requests": requests, "errors": errors, "bytes": nbytes,
+                         "mean_ms": round(micros / requests / 1000, 3) if requests else None})
+        return rows
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return totals, throughput and latency percentiles over the whole run.
+        """
+        series = self.timeseries()
+        requests = sum(row["requests"] for row in series)
+        errors = sum(row["errors"] for row in series)
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        summary: Dict[str, Any] = {
+            "started": self.started_epoch,
+            "seconds": round(elapsed, 3),
+            "requests": requests,
+            "errors": errors,
+            "bytes": sum(row["bytes"] for row in series),
+            "requests_per_sec": round(requests / elapsed, 2),
+            "peak_requests_per_sec": max((row["requests"] for row in series), default=0),
+        }
+        summary.update(self.histogram().percentiles())
+        return summary
+
+    def write_csv(self, file_path: str) -> None:
+        """
+        Write the per-second time series to a CSV file with CsvFileWriter.
+
+        Raises:
+            ValueError: If nothing has been recorded.
+        """
+        series = self.timeseries()
+        if not series:
+            raise ValueError("No metrics recorded for CSV writing.")
+        CsvFileWriter(file_path).write(series, include_header=True, fieldnames=TIMESERIES_FIELDS)
+
+    def write_json(self, file_path: str) -> None:
+        """
+        Write the summary and the per-second time series to a JSON file with JsonFileWriter.
+        """
+        JsonFileWriter(file_path).write({"summary": self.summary(), "timeseries": self.timeseries()})
+
+
+# Example Usage
+if __name__ == "__main__":
+    import random
+
+    try:
+        metrics = LoadMetrics()
+
+        def client(index: int) -> None:
+            for _ in range(200):
+                latency = random.lognormvariate(-4.5, 0.6)  # About 11 ms median with a long tail.
+                time.sleep(latency / 10)
+                metrics.record(latency, ok=random.random() > 0.01, nbytes=1500)
+
+        with ThreadPoolExecutor(max_workers=50) as executor:
+            list(executor.map(client, range(50)))
+        print(metrics.summary())
+        metrics.write_csv("load_timeseries.csv")
+        metrics.write_json("load_metrics.json")
+    except Exception as e:
+        print(f"[-] Error: {e}")
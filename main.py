@@ -2,7 +2,9 @@ import csv
 import json
 import os
 import re
-from typing import Any, Dict, List, Union, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Pattern, Tuple, Union, Optional
 
 class JsonFileReader:
     """
@@ -112,6 +114,260 @@ class JsonFileWriter:
         except IOError as e:
             raise IOError(f"Failed to write to file: {self.file_path}") from e
 
+class JsonLinesWriter:
+    """
+    A buffered writer for JSON Lines files (one JSON document per line).
+
+    Records are encoded with a single reusable encoder (compact separators
+    by default) and collected in memory; they reach the file in one write
+    per batch, when ``batch_size`` records or ``buffer_bytes`` characters
+    are pending, on flush(), and on close(). Use it as a context manager so
+    the last batch is never lost.
+
+    Example:
+        >>> with JsonLinesWriter("results.jsonl") as writer:
+        ...     for row in rows:
+        ...         writer.write(row)
+    """
+
+    def __init__(self, file_path: str, compact: bool = True, batch_size: int = 1000,
+                 buffer_bytes: int = 1024 * 1024, append: bool = False):
+        """
+        Initialize the JsonLinesWriter with a target file path.
+
+        Args:
+            file_path (str): The path of the .jsonl file.
+            compact (bool): Use "," and ":" separators without spaces. Default is True.
+            batch_size (int): Records buffered before a write. Default is 1000.
+            buffer_bytes (int): Characters buffered before a write. Default is 1 MiB.
+            append (bool): Append to an existing file instead of replacing it. Default is False.
+        """
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.buffer_bytes = buffer_bytes
+        self.append = append
+        self.records_written = 0
+        self._encode = json.JSONEncoder(separators=(",", ":") if compact else None, ensure_ascii=False).encode
+        self._pending: List[str] = []
+        self._pending_bytes = 0
+        self._file = None
+        self._opened = False
+
+    def open(self) -> "JsonLinesWriter":
+        """
+        Open the file for writing.
+
+        Only the first open honours ``append=False``; once the file has been
+        opened, reopening it (e.g. a write after close()) appends, so records
+        already written are never truncated.
+
+        Raises:
+            PermissionError: If the file cannot be written due to insufficient permissions.
+            IOError: If the file cannot be opened.
+        """
+        if self._file is not None:
+            return self
+        try:
+            self._file = open(self.file_path, 'a' if self.append or self._opened else 'w',
+                              encoding='utf-8', newline='\n')
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied when writing to file: {self.file_path}") from e
+        except IOError as e:
+            raise IOError(f"Failed to open file for writing: {self.file_path}") from e
+        self._opened = True
+        return self
+
+    def write(self, record: Any) -> None:
+        """
+        Buffer one record.
+
+        Raises:
+            TypeError: If the record cannot be serialized to JSON.
+        """
+        try:
+            line = self._encode(record)
+        except (TypeError, ValueError) as e:
+            raise TypeError(f"Data provided is not JSON serializable: {e}") from e
+        self._pending.append(line)
+        self._pending_bytes += len(line) + 1
+        if len(self._pending) >= self.batch_size or self._pending_bytes >= self.buffer_bytes:
+            self.flush()
+
+    def write_many(self, records: Iterable[Any]) -> None:
+        """
+        Buffer every record of an iterable.
+        """
+        write = self.write
+        for record in records:
+            write(record)
+
+    def flush(self) -> None:
+        """
+        Write the pending batch to the file.
+
+        Raises:
+            IOError: If an I/O error occurs during writing.
+        """
+        if not self._pending:
+            return
+        if self._file is None:
+            self.open()
+        try:
+            self._file.write("\n".join(self._pending) + "\n")
+            self._file.flush()
+        except IOError as e:
+            raise IOError(f"Failed to write to file: {self.file_path}") from e
+        self.records_written += len(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+
+    def close(self) -> None:
+        """
+        Flush the pending batch and close the file.
+        """
+        try:
+            self.flush()
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "JsonLinesWriter":
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _parse_json_lines_range(task: Tuple[str, int, int]) -> List[Any]:
+    """Parse the JSON Lines between two byte offsets (both at line starts); used by read_parallel()."""
+    file_path, start, end = task
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    records = []
+    offset = start
+    for line in data.split(b"\n"):
+        if line.strip():
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON at byte {offset} of file {file_path}: {e.msg}") from None
+        offset += len(line) + 1
+    return records
+
+
+class JsonLinesReader:
+    """
+    A streaming reader for JSON Lines files (one JSON document per line).
+
+    iter_records() parses one line at a time, so a file of millions of
+    records never has to fit in memory. read_parallel() splits a large file
+    at line boundaries into byte ranges and parses them in a process pool,
+    returning the records in file order. Blank lines are skipped.
+
+    Example:
+        >>> for record in JsonLinesReader("results.jsonl").iter_records():
+        ...     print(record)
+        >>> records = JsonLinesReader("results.jsonl").read_parallel()
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the JsonLinesReader with the path to the .jsonl file.
+
+        Args:
+            file_path (str): Path to the JSON Lines file to be read.
+        """
+        self.file_path = file_path
+
+    def iter_records(self) -> Iterator[Any]:
+        """
+        Yield the records of the file in order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            json.JSONDecodeError: If a line contains invalid JSON (the message names the line).
+            IOError: If there's an issue opening or reading the file.
+        """
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                decode = json.JSONDecoder().decode
+                for line_number, line in enumerate(file, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield decode(line)
+                    except json.JSONDecodeError as e:
+                        raise json.JSONDecodeError(
+                            f"Invalid JSON on line {line_number} of file: {self.file_path}", e.doc, e.pos) from None
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {self.file_path}") from e
+        except IOError as e:
+            raise IOError(f"Error reading file: {self.file_path}") from e
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_records()
+
+    def read(self) -> List[Any]:
+        """
+        Read every record of the file into a list.
+        """
+        return list(self.iter_records())
+
+    def split(self, parts: int) -> List[Tuple[int, int]]:
+        """
+        Return up to parts (start, end) byte ranges that cover the file and begin at line starts.
+        """
+        size = os.path.getsize(self.file_path)
+        bounds = [0]
+        with open(self.file_path, 'rb') as file:
+            for part in range(1, parts):
+                position = max(size * part // parts, bounds[-1])
+                if position >= size:
+                    break
+                file.seek(position)
+                file.readline()  # Move on to the start of the next line.
+                if file.tell() > bounds[-1] and file.tell() < size:
+                    bounds.append(file.tell())
+        bounds.append(size)
+        return list(zip(bounds, bounds[1:]))
+
+    def read_parallel(self, workers: Optional[int] = None, min_chunk_bytes: int = 8 * 1024 * 1024) -> List[Any]:
+        """
+        Read every record, parsing byte ranges of the file in a process pool.
+
+        Files smaller than two chunks (or a single worker) are read in this
+        process, since starting workers and sending their records back costs
+        more than it saves there.
+
+        Args:
+            workers (int, optional): Parsing processes. Defaults to the CPU count.
+            min_chunk_bytes (int): Smallest byte range given to one process. Default is 8 MiB.
+
+        Returns:
+            List[Any]: The records, in file order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If a line contains invalid JSON (the message names its byte offset).
+        """
+        try:
+            size = os.path.getsize(self.file_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {self.file_path}") from e
+        workers = workers or os.cpu_count() or 1
+        parts = min(workers * 4, size // max(min_chunk_bytes, 1))
+        if parts < 2 or workers < 2:
+            return self.read()
+        tasks = [(self.file_path, start, end) for start, end in self.split(parts)]
+        records: List[Any] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in executor.map(_parse_json_lines_range, tasks):
+                records.extend(chunk)
+        return records
+
+
 class LogFileReader:
     """
     A utility class to read contents from a log file.
@@ -464,6 +720,184 @@ class LogFileParser:
 
         return {"configurations": configurations}
 
+######## Typed SLA configuration #################
+# Fields SlaChecker can put in a report row, in their default column order.
+SLA_REPORT_FIELDS = ["log_file", "build_id", "suite_name", "component", "job_url", "testcase_name",
+                     "failed_record", "failed_pattern"]
+
+
+def _sla_text(value: Any) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("must be a non-empty string")
+    return value
+
+
+def _sla_directory(value: Any) -> str:
+    value = _sla_text(value)
+    if not os.path.isdir(value):
+        raise ValueError(f"directory '{value}' does not exist")
+    return value
+
+
+def _sla_pattern(value: Any) -> Pattern:
+    try:
+        return re.compile(_sla_text(value), re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"is not a valid regular expression ({e})") from e
+
+
+def _sla_report_fields(value: Any) -> List[str]:
+    fields = value.split("|") if isinstance(value, str) else value
+    if not isinstance(fields, list) or not fields or not all(isinstance(field, str) for field in fields):
+        raise ValueError("must be a '|' separated string or a list of field names")
+    fields = [field.strip() for field in fields]
+    unknown = [field for field in fields if field not in SLA_REPORT_FIELDS]
+    if unknown:
+        raise ValueError(f"has unknown fields {unknown}; known fields are {SLA_REPORT_FIELDS}")
+    return fields
+
+
+def _sla_suffixes(value: Any) -> Tuple[str, ...]:
+    suffixes = (value,) if isinstance(value, str) else value
+    if not isinstance(suffixes, (list, tuple)) or not suffixes or not all(isinstance(s, str) for s in suffixes):
+        raise ValueError("must be a file suffix or a list of suffixes")
+    return tuple(suffixes)
+
+
+# sla.json key -> (SlaConfig attribute, required, parser). Parsers convert and validate in one step.
+SLA_CONFIG_SCHEMA: Dict[str, Tuple[str, bool, Callable[[Any], Any]]] = {
+    "logs_parent_directory": ("logs_parent_directory", True, _sla_directory),
+    "failed_record_pattern": ("failed_record_regex", True, _sla_pattern),
+    "csv_report_fields": ("csv_report_fields", True, _sla_report_fields),
+    "log_file_suffixes": ("log_file_suffixes", False, _sla_suffixes),
+}
+
+
+class SlaConfig:
+    """
+    A validated, typed SLA configuration (sla.json).
+
+    Values are parsed once when the file is loaded: the failed record
+    pattern is compiled (case-insensitive) and the report fields are split,
+    so a scan only reads attributes.
+
+    Attributes:
+    -----------
+    logs_parent_directory : str
+        Directory searched (recursively) for log files.
+    failed_record_regex : Pattern
+        Compiled "failed_record_pattern".
+    csv_report_fields : List[str]
+        Report columns, in order.
+    log_file_suffixes : Tuple[str, ...]
+        File name endings that are scanned. Default is (".log",).
+    raw : Dict[str, Any]
+        The parsed JSON document, unknown keys included.
+    """
+
+    def __init__(self, raw: Dict[str, Any], source: str = "<dict>"):
+        """
+        Validate a parsed sla.json document.
+
+        Parameters:
+        -----------
+        raw : Dict[str, Any]
+            The parsed JSON document.
+        source : str
+            Where it came from, for error messages.
+
+        Raises:
+        -------
+        ValueError:
+            Listing every missing or invalid field at once.
+        """
+        if not isinstance(raw, dict):
+            raise ValueError(f"SLA configuration {source} must be a JSON object.")
+        self.raw = raw
+        self.source = source
+        self.log_file_suffixes: Tuple[str, ...] = (".log",)
+        errors = []
+        for key, (attribute, required, parse) in SLA_CONFIG_SCHEMA.items():
+            if key not in raw:
+                if required:
+                    errors.append(f"missing required field '{key}'")
+                continue
+            try:
+                setattr(self, attribute, parse(raw[key]))
+            except ValueError as e:
+                errors.append(f"'{key}' {e}")
+        if errors:
+            raise ValueError(f"Invalid SLA configuration {source}: " + "; ".join(errors))
+
+    @property
+    def failed_record_pattern(self) -> str:
+        """The failed record pattern as written in the file."""
+        return self.failed_record_regex.pattern
+
+
+class SlaConfigLoader:
+    """
+    Load sla.json into an SlaConfig, caching it by file modification time.
+
+    Long-running services can call load() before every scan: as long as the
+    file's mtime and size are unchanged the cached SlaConfig (with its
+    compiled regex) is returned without reading the file again. The cache
+    is shared by all loaders in the process.
+
+    Example:
+        >>> config = SlaConfigLoader("sla.json").load()
+        >>> print(config.csv_report_fields)
+    """
+
+    _cache: Dict[str, Tuple[int, int, SlaConfig]] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the SlaConfigLoader with the path to sla.json.
+
+        Parameters:
+        -----------
+        file_path : str
+            Path to the SLA JSON configuration file.
+        """
+        self.file_path = os.path.abspath(file_path)
+
+    def load(self) -> SlaConfig:
+        """
+        Return the validated configuration, re-reading the file only if it changed.
+
+        Raises:
+        -------
+        FileNotFoundError:
+            If the configuration file does not exist.
+        json.JSONDecodeError:
+            If the configuration file contains invalid JSON.
+        ValueError:
+            If the configuration is missing fields or has invalid values.
+        """
+        try:
+            info = os.stat(self.file_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {self.file_path}") from e
+        with self._lock:
+            cached = self._cache.get(self.file_path)
+        if cached is not None and cached[:2] == (info.st_mtime_ns, info.st_size):
+            return cached[2]
+        config = SlaConfig(JsonFileReader(self.file_path).read(), self.file_path)
+        with self._lock:
+            self._cache[self.file_path] = (info.st_mtime_ns, info.st_size, config)
+        return config
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Forget every cached configuration.
+        """
+        with cls._lock:
+            cls._cache.clear()
+
+
 ######## Checking the Failed patterns #################
 class SlaChecker:
     """
@@ -482,6 +916,8 @@ class SlaChecker:
         Path to the SLA configuration JSON file.
     config : Dict[str, str]
         Parsed configuration from the SLA JSON file.
+    sla_config : SlaConfig
+        The validated configuration, with the failed record pattern precompiled.
 
     Methods:
     --------
@@ -489,7 +925,7 @@ class SlaChecker:
         Initializes the SlaChecker with the path to the configuration JSON file.
 
     read_config() -> None:
-        Reads and parses the SLA JSON configuration file.
+        Loads and validates the SLA JSON configuration file (cached by mtime).
 
     scan_logs_and_generate_report() -> None:
         Scans the log files, checks for failed record patterns, and generates a CSV report.
@@ -506,11 +942,15 @@ class SlaChecker:
         """
         self.config_file = config_file
         self.config = {}
+        self.sla_config: Optional[SlaConfig] = None
         self.read_config()
 
     def read_config(self) -> None:
         """
-        Reads and parses the SLA JSON configuration file.
+        Loads and validates the SLA JSON configuration file.
+
+        The file is only re-read and re-validated when its modification time
+        changes, so calling this before every scan is cheap.
 
         Raises:
         -------
@@ -518,9 +958,11 @@ class SlaChecker:
             If the configuration file does not exist.
         json.JSONDecodeError:
             If the configuration file contains invalid JSON.
+        ValueError:
+            If required fields are missing or invalid (e.g. a bad regex or an unknown report field).
         """
-        reader = JsonFileReader(self.config_file)
-        self.config = reader.read()
+        self.sla_config = SlaConfigLoader(self.config_file).load()
+        self.config = self.sla_config.raw
 
     def scan_logs_and_generate_report(self) -> None:
         """
@@ -532,18 +974,15 @@ class SlaChecker:
         FileNotFoundError:
             If the logs parent directory does not exist.
         ValueError:
-            If required fields are missing in the configuration file.
+            If the configuration file is missing fields or has invalid values.
         """
-        # Validate required fields in the configuration
-        required_fields = ["logs_parent_directory", "failed_record_pattern", "csv_report_fields"]
-        for field in required_fields:
-            if field not in self.config:
-                raise ValueError(f"Missing required field '{field}' in the SLA configuration file.")
+        # Pick up edits to sla.json; validation already ran when it was loaded
+        self.read_config()
+        sla_config = self.sla_config
 
-        logs_parent_directory = self.config["logs_parent_directory"]
+        logs_parent_directory = sla_config.logs_parent_directory
         print("Logs Parent Directory:", logs_parent_directory)
-        failed_record_pattern = self.config["failed_record_pattern"]
-        csv_report_fields = self.config["csv_report_fields"].split("|")
+        csv_report_fields = sla_config.csv_report_fields
         print("CSV Report Fields:", csv_report_fields)
 
         # Ensure the logs directory exists
@@ -554,13 +993,13 @@ class SlaChecker:
         csv_writer = CsvFileWriter("sla_report.csv")
         report_data = []
 
-        # Compile the failed record pattern regex
-        failed_record_regex = re.compile(failed_record_pattern, re.IGNORECASE)
+        # The failed record pattern was compiled when the configuration was loaded
+        failed_record_regex = sla_config.failed_record_regex
 
         # Traverse the logs directory and process each log file
         for root, _, files in os.walk(logs_parent_directory):
             for file_name in files:
-                if file_name.endswith(".log"):  # Process only .log files
+                if file_name.endswith(sla_config.log_file_suffixes):  # Process only log files
                     log_file_path = os.path.join(root, file_name)
                     log_parser = LogFileParser(log_file_path)
                     testcases = log_parser.extract_testcases()["testcases"]
@@ -586,7 +1025,7 @@ class SlaChecker:
                                 "failed_pattern": failed_pattern,
                             }
                             print(record , "--------------")
-                            report_data.append(record)
+                            report_data.append({field: record[field] for field in csv_report_fields})
 
         print(report_data)
         # print(csv_report_fields)
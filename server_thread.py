@@ -0,0 +1,86 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+# asyncio.start_server client callback: handler(reader, writer).
+Handler = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+
+class ServerThread:
+    """
+    Run asyncio stream servers in a background event loop, so blocking code (telnetlib, ftplib) can use them.
+
+    Every listener is bound before start() returns; a port that cannot be
+    bound stops the loop and is raised in the calling thread. Used by
+    asa_simulator.SimulatorThread and ftp_server.FtpServerThread.
+
+    Example:
+        >>> with ServerThread([(device.handle, "127.0.0.1", 0)]) as ports:
+        ...     print("listening on", ports)
+    """
+
+    def __init__(self, listeners: Sequence[Tuple[Handler, str, int]]):
+        """
+        Initialize the ServerThread.
+
+        Args:
+            listeners (sequence): (handler, host, port) per server; port 0 picks a free port.
+        """
+        self.listeners = list(listeners)
+        self.ports: List[int] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._stop: Optional[asyncio.Event] = None
+        self._error: Optional[BaseException] = None
+
+    async def _serve(self) -> None:
+        self._stop = asyncio.Event()
+        servers = []
+        try:
+            for handler, host, port in self.listeners:
+                server = await asyncio.start_server(handler, host, port)
+                servers.append(server)
+                self.ports.append(server.sockets[0].getsockname()[1])
+        except OSError as e:
+            self._error = e
+        self._ready.set()
+        if self._error is None:
+            await self._stop.wait()
+        for server in servers:
+            server.close()
+            await server.wait_closed()
+
+    def start(self) -> List[int]:
+        """
+        Start serving and return the bound ports, in listener order.
+
+        Raises:
+            OSError: If a port cannot be bound.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_until_complete, args=(self._serve(),), daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self.stop()
+            raise self._error
+        return self.ports
+
+    def stop(self) -> None:
+        """
+        Stop serving and join the background thread.
+        """
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,409 @@
+import calendar
+import math
+import os
+import re
+import time
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, array.array + pure Python is the fallback
+    np = None
+
+# "------------------ show memory ------------------"
+SECTION_HEADER_REGEX = re.compile(r"^-{3,}\s+(show\s.*?)\s+-{3,}\s*$")
+# "-----------------[ SECHP-DC-FW02 ]------------------"
+DEVICE_BANNER_REGEX = re.compile(r"^-+\[\s*(\S+)\s*\]-+\s*$")
+# "16:35:36.869 UTC Tue Feb 15 2022"
+CLOCK_REGEX = re.compile(
+    r"(\d{1,2}):(\d{2}):(\d{2})(?:\.\d+)?\s+\S+\s+\w{3}\s+(\w{3})\s+(\d{1,2})\s+(\d{4})"
+)
+
+MEMORY_REGEX = re.compile(r"^(Free|Used|Total) memory:\s+(\d+) bytes\s+\(\s*(\d+)%\)", re.M)
+BLOCKS_ROW_REGEX = re.compile(r"^\s*(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s*$", re.M)
+CONN_COUNT_REGEX = re.compile(r"(\d+) in use, (\d+) most used")
+CPU_USAGE_REGEX = re.compile(
+    r"CPU utilization for 5 seconds = ([\d.]+)%; 1 minute: ([\d.]+)%; 5 minutes: ([\d.]+)%"
+)
+DATA_RATE_REGEX = re.compile(r"^\s*([A-Za-z][\w ()/-]*?)\s*[:=]\s*([\d.]+)", re.M)
+
+MONTHS = {name: index for index, name in enumerate(calendar.month_abbr) if name}
+
+
+class ShowTechParser:
+    """
+    A section-indexed reader for ASA/FTD show-tech captures.
+
+    The capture is streamed line by line and split on the
+    "------------------ show <command> ------------------" headers, so files of
+    hundreds of MB are never held in memory as a single string. Commands that
+    appear more than once (e.g. "show ipsec stats") are keyed as
+    "show ipsec stats", "show ipsec stats#2", ...
+
+    Example:
+        >>> parser = ShowTechParser("693110730-show_tech_Malathi.txt")
+        >>> for command, text in parser.iter_sections():
+        ...     print(command, len(text))
+    """
+
+    # Output that precedes the first section header is the "show version" block.
+    PREAMBLE_COMMAND = "show version"
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the ShowTechParser with the path to the show-tech capture.
+
+        Args:
+            file_path (str): Path to the show-tech text file.
+        """
+        self.file_path = file_path
+        self.device: Optional[str] = None
+
+    def iter_sections(self, commands: Optional[List[str]] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Stream the capture and yield one (command, text) pair per section.
+
+        Args:
+            commands (list, optional): Only yield sections whose base command is in
+                this list. Lines of other sections are skipped without being buffered.
+
+        Yields:
+            Tuple[str, str]: The section key and the raw section output.
+
+        Raises:
+            FileNotFoundError: If the capture does not exist.
+            PermissionError: If access to the capture is denied.
+            IOError: If an I/O error occurs while reading the capture.
+        """
+        wanted = set(commands) if commands else None
+        seen: Dict[str, int] = {}
+        command = self.PREAMBLE_COMMAND
+        keep = wanted is None or command in wanted
+        lines: List[str] = []
+
+        try:
+            with open(self.file_path, 'r', encoding='utf-8', errors='replace') as file:
+                for line in file:
+                    if line.startswith('---'):
+                        header = SECTION_HEADER_REGEX.match(line)
+                        if header:
+                            if keep:
+                                yield self._section_key(command, seen), ''.join(lines)
+                            else:
+                                self._section_key(command, seen)
+                            command = header.group(1)
+                            keep = wanted is None or command in wanted
+                            lines = []
+                            continue
+                        if self.device is None:
+                            banner = DEVICE_BANNER_REGEX.match(line)
+                            if banner:
+                                self.device = banner.group(1)
+                                continue
+                    if keep:
+                        lines.append(line)
+                if keep:
+                    yield self._section_key(command, seen), ''.join(lines)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Show-tech file not found: {self.file_path}") from e
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied: Cannot access file {self.file_path}") from e
+        except IOError as e:
+            raise IOError(f"An error occurred while reading file: {self.file_path}") from e
+
+    def sections(self, commands: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Read the capture into a dictionary of section key -> section output.
+
+        Args:
+            commands (list, optional): Restrict the result to these base commands.
+
+        Returns:
+            Dict[str, str]: The indexed sections, in capture order.
+        """
+        return dict(self.iter_sections(commands))
+
+    @staticmethod
+    def _section_key(command: str, seen: Dict[str, int]) -> str:
+        count = seen.get(command, 0) + 1
+        seen[command] = count
+        return command if count == 1 else f"{command}#{count}"
+
+
+def parse_clock(text: str) -> Optional[float]:
+    """
+    Convert "show clock" output into a UTC epoch timestamp.
+
+    Args:
+        text (str): The "show clock" section output.
+
+    Returns:
+        Optional[float]: Seconds since the epoch, or None if no clock line is found.
+    """
+    match = CLOCK_REGEX.search(text)
+    if not match:
+        return None
+    hour, minute, second, month, day, year = match.groups()
+    month_number = MONTHS.get(month.title())
+    if month_number is None:
+        return None
+    return float(calendar.timegm(
+        (int(year), month_number, int(day), int(hour), int(minute), int(second), 0, 0, 0)
+    ))
+
+
+def extract_memory(text: str) -> Dict[str, float]:
+    """Extract free/used/total bytes and percentages from "show memory"."""
+    metrics = {}
+    for kind, size, percent in MEMORY_REGEX.findall(text):
+        kind = kind.lower()
+        metrics[f"memory_{kind}_bytes"] = float(size)
+        if kind != "total":
+            metrics[f"memory_{kind}_pct"] = float(percent)
+    return metrics
+
+
+def extract_blocks(text: str) -> Dict[str, float]:
+    """Extract per block size MAX/LOW/CNT/FAILED counters from "show blocks"."""
+    metrics = {}
+    failed_total = 0.0
+    for size, maximum, low, count, failed in BLOCKS_ROW_REGEX.findall(text):
+        metrics[f"blocks_{size}_max"] = float(maximum)
+        metrics[f"blocks_{size}_low"] = float(low)
+        metrics[f"blocks_{size}_cnt"] = float(count)
+        metrics[f"blocks_{size}_failed"] = float(failed)
+        failed_total += float(failed)
+    if metrics:
+        metrics["blocks_failed_total"] = failed_total
+    return metrics
+
+
+def extract_conn_count(text: str) -> Dict[str, float]:
+    """Extract the in-use and most-used connection counts from "show conn count"."""
+    match = CONN_COUNT_REGEX.search(text)
+    if not match:
+        return {}
+    return {"conn_in_use": float(match.group(1)), "conn_most_used": float(match.group(2))}
+
+
+def extract_conn_data_rate(text: str) -> Dict[str, float]:
+    """Extract "name: value" rate counters from "show conn data-rate" when tracking is enabled."""
+    if "disabled" in text:
+        return {}
+    metrics = {}
+    for name, value in DATA_RATE_REGEX.findall(text):
+        slug = re.sub(r"\W+", "_", name.strip().lower()).strip("_")
+        metrics[f"conn_data_rate_{slug}"] = float(value)
+    return metrics
+
+
+def extract_cpu_usage(text: str) -> Dict[str, float]:
+    """Extract the 5 second / 1 minute / 5 minute utilization from "show cpu usage"."""
+    match = CPU_USAGE_REGEX.search(text)
+    if not match:
+        return {}
+    return {
+        "cpu_5_sec_pct": float(match.group(1)),
+        "cpu_1_min_pct": float(match.group(2)),
+        "cpu_5_min_pct": float(match.group(3)),
+    }
+
+
+# Section command -> extractor. "show cpu" is collected by show-tech as "show cpu usage".
+METRIC_EXTRACTORS = {
+    "show memory": extract_memory,
+    "show blocks": extract_blocks,
+    "show conn count": extract_conn_count,
+    "show conn data-rate": extract_conn_data_rate,
+    "show cpu usage": extract_cpu_usage,
+}
+
+
+class ShowTechMetricsStore:
+    """
+    A columnar store of numeric show-tech metrics keyed by device and capture time.
+
+    Every (device, metric) pair owns two compact ``array('d')`` columns: capture
+    timestamps and values. Appends are O(1) and allocation free; aggregates view
+    the columns through NumPy without copying when it is installed and fall back
+    to pure Python otherwise.
+
+    Example:
+        >>> store = ShowTechMetricsStore()
+        >>> store.add_file("693110730-show_tech_Malathi.txt")
+        >>> store.aggregate("conn_in_use", percentiles=(50, 99))
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty metrics store.
+        """
+        self.series: Dict[Tuple[str, str], Tuple[array, array]] = {}
+
+    def add(self, device: str, timestamp: float, metrics: Dict[str, float]) -> None:
+        """
+        Record one capture worth of metrics for a device.
+
+        Args:
+            device (str): Device name.
+            timestamp (float): Capture time in seconds since the epoch.
+            metrics (dict): Metric name -> value.
+        """
+        for name, value in metrics.items():
+            columns = self.series.get((device, name))
+            if columns is None:
+                columns = self.series[(device, name)] = (array('d'), array('d'))
+            columns[0].append(timestamp)
+            columns[1].append(value)
+
+    def add_file(self, file_path: str, device: Optional[str] = None) -> Dict[str, float]:
+        """
+        Parse a show-tech capture and record every metric it contains.
+
+        The device name defaults to the capture banner and the timestamp to the
+        first "show clock" section (or the file modification time if that is missing).
+        A section captured more than once contributes the metrics of its last copy.
+
+        Args:
+            file_path (str): Path to the show-tech capture.
+            device (str, optional): Override the device name.
+
+        Returns:
+            Dict[str, float]: The metrics extracted from this capture.
+
+        Raises:
+            ValueError: If no device name can be determined.
+        """
+        parser = ShowTechParser(file_path)
+        metrics: Dict[str, float] = {}
+        timestamp = None
+        for command, text in parser.iter_sections(list(METRIC_EXTRACTORS) + ["show clock"]):
+            command = command.split("#", 1)[0]  # Repeated sections are keyed "show memory#2", ...
+            if command == "show clock":
+                timestamp = timestamp if timestamp is not None else parse_clock(text)
+            else:
+                metrics.update(METRIC_EXTRACTORS[command](text))
+
+        device = device or parser.device
+        if not device:
+            raise ValueError(f"Cannot determine the device name for capture: {file_path}")
+        if timestamp is None:
+            timestamp = os.path.getmtime(file_path)
+        self.add(device, timestamp, metrics)
+        return metrics
+
+    def devices(self) -> List[str]:
+        """Return the sorted list of devices with at least one metric."""
+        return sorted({device for device, _ in self.series})
+
+    def metrics(self) -> List[str]:
+        """Return the sorted list of metric names seen across all devices."""
+        return sorted({name for _, name in self.series})
+
+    def column(self, device: str, metric: str) -> Tuple[Any, Any]:
+        """
+        Return the (timestamps, values) columns of a series, sorted by capture time.
+
+        Returns NumPy arrays when NumPy is installed and lists otherwise.
+
+        Raises:
+            KeyError: If the device has no samples for the metric.
+        """
+        timestamps, values = self.series[(device, metric)]
+        if np is not None:
+            timestamps = np.frombuffer(timestamps, dtype=np.float64)
+            values = np.frombuffer(values, dtype=np.float64)
+            order = np.argsort(timestamps, kind="stable")
+            return timestamps[order], values[order]
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        return [timestamps[i] for i in order], [values[i] for i in order]
+
+    def aggregate(self, metric: str, percentiles: Tuple[float, ...] = (50, 95, 99)) -> Dict[str, Dict[str, float]]:
+        """
+        Compute count/min/max/mean and percentiles of a metric for every device.
+
+        Args:
+            metric (str): Metric name, e.g. "conn_in_use".
+            percentiles (tuple): Percentiles to compute (0-100, linear interpolation).
+
+        Returns:
+            Dict[str, Dict[str, float]]: device -> {"count", "min", "max", "mean", "p50", ...}.
+        """
+        report = {}
+        for device in self.devices():
+            if (device, metric) not in self.series:
+                continue
+            _, values = self.column(device, metric)
+            if np is not None:
+                stats = {
+                    "count": float(values.size),
+                    "min": float(values.min()),
+                    "max": float(values.max()),
+                    "mean": float(values.mean()),
+                }
+                for p, value in zip(percentiles, np.percentile(values, percentiles)):
+                    stats[f"p{p:g}"] = float(value)
+            else:
+                ordered = sorted(values)
+                stats = {
+                    "count": float(len(ordered)),
+                    "min": ordered[0],
+                    "max": ordered[-1],
+                    "mean": math.fsum(ordered) / len(ordered),
+                }
+                for p in percentiles:
+                    stats[f"p{p:g}"] = _percentile(ordered, p)
+            report[device] = stats
+        return report
+
+    def deltas(self, device: str, metric: str) -> Tuple[Any, Any]:
+        """
+        Return capture-to-capture changes of a metric for one device.
+
+        Returns:
+            Tuple: (timestamps of the later capture, value deltas), one element
+            shorter than the series.
+        """
+        timestamps, values = self.column(device, metric)
+        if np is not None:
+            return timestamps[1:], np.diff(values)
+        return timestamps[1:], [b - a for a, b in zip(values, values[1:])]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Flatten the store into one dictionary per sample, ready for CsvFileWriter.
+
+        Returns:
+            List[Dict[str, Any]]: Rows with "device", "timestamp", "metric" and "value".
+        """
+        records = []
+        for (device, metric), (timestamps, values) in sorted(self.series.items()):
+            for timestamp, value in zip(timestamps, values):
+                records.append({
+                    "device": device,
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp)),
+                    "metric": metric,
+                    "value": value,
+                })
+        return records
+
+
+def _percentile(ordered: List[float], percentile: float) -> float:
+    """Linear interpolation percentile, matching numpy.percentile's default."""
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * percentile / 100.0
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        store = ShowTechMetricsStore()
+        print(store.add_file("693110730-show_tech_Malathi.txt"))
+        print(store.aggregate("conn_in_use"))
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,325 @@
+import hashlib
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from showtech import METRIC_EXTRACTORS, ShowTechParser
+
+# "Interface Internal-Data0/0 "", is up, line protocol is up"
+INTERFACE_HEADER_REGEX = re.compile(r'^Interface (\S+) "([^"]*)", is (.+?), line protocol is (\S+)', re.M)
+# "2767749 packets input, 2644276936 bytes, 5 no buffer"
+COUNTER_REGEX = re.compile(r"(\d+) ([A-Za-z][A-Za-z0-9 ]*?)(?=,|$)", re.M)
+# "      Heapcache Pools:                    9601653536 bytes (  9% )"
+MEMORY_POOL_REGEX = re.compile(r"^\s*([^:\n]+?):\s+(\d+) bytes", re.M)
+MEMORY_HEADING_REGEX = re.compile(r"^\s*([A-Za-z][\w ]*Memory):\s*$", re.M)
+# Stanzas whose member order is significant: ACEs are matched first to last, policy-map classes in order.
+ORDERED_STANZA_PREFIXES = ("access-list ", "policy-map ")
+
+
+def section_digest(text: str) -> bytes:
+    """Return a short, collision resistant fingerprint of a section's text."""
+    return hashlib.blake2b(text.encode('utf-8', 'replace'), digest_size=16).digest()
+
+
+def base_command(key: str) -> str:
+    """Strip the "#2" occurrence suffix added by ShowTechParser for repeated commands."""
+    return key.split('#', 1)[0]
+
+
+def numeric_changes(old: Dict[str, float], new: Dict[str, float]) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Compare two metric dictionaries.
+
+    Returns:
+        Dict: name -> {"old", "new", "delta"} for every value that differs.
+    """
+    changes = {}
+    for name in sorted(set(old) | set(new)):
+        before, after = old.get(name), new.get(name)
+        if before != after:
+            delta = after - before if before is not None and after is not None else None
+            changes[name] = {"old": before, "new": after, "delta": delta}
+    return changes
+
+
+def parse_interfaces(text: str) -> Dict[str, Dict[str, Any]]:
+    """Split "show interface" output into interface -> {"nameif", "status", counters...}."""
+    interfaces = {}
+    headers = list(INTERFACE_HEADER_REGEX.finditer(text))
+    for index, header in enumerate(headers):
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+        body = text[header.end():end]
+        # Only the hardware counters block; "Traffic Statistics" repeats the same names.
+        body = body.split("Traffic Statistics", 1)[0]
+        record: Dict[str, Any] = {
+            "nameif": header.group(2),
+            "status": f"{header.group(3)}/{header.group(4)}",
+        }
+        for value, name in COUNTER_REGEX.findall(body):
+            record[name.strip()] = float(value)
+        interfaces[header.group(1)] = record
+    return interfaces
+
+
+def parse_memory_pools(text: str) -> Dict[str, float]:
+    """Extract "<Free|Used> Memory / <pool>" -> bytes from "show memory detail"."""
+    pools = {}
+    heading = ""
+    headings = [(m.start(), m.group(1)) for m in MEMORY_HEADING_REGEX.finditer(text)]
+    for match in MEMORY_POOL_REGEX.finditer(text):
+        while headings and headings[0][0] < match.start():
+            heading = headings.pop(0)[1]
+        name = f"{heading} / {match.group(1)}" if heading else match.group(1)
+        pools.setdefault(name, float(match.group(2)))
+    return pools
+
+
+def parse_running_config(text: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Split a running-config into top-level stanzas.
+
+    Indented lines belong to the preceding top-level line ("object network X",
+    "interface Y", ...). Single-line commands that repeat with the same prefix,
+    such as "access-list NAME ...", are grouped under "access-list NAME".
+
+    Returns:
+        Dict[str, Tuple[str, ...]]: stanza key -> member lines, in file order for
+        ORDERED_STANZA_PREFIXES stanzas and sorted for the rest (e.g. object-group members).
+    """
+    stanzas: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    for line in text.splitlines():
+        if not line.strip() or line.startswith((':', '!')):
+            continue
+        if line[0].isspace():
+            if current is not None:
+                current.append(line.strip())
+            continue
+        line = line.rstrip()
+        if line.startswith('access-list '):
+            parts = line.split(None, 2)
+            stanzas.setdefault(' '.join(parts[:2]), []).append(line)
+            current = None
+        else:
+            current = stanzas.setdefault(line, [])
+    return {key: tuple(lines) if key.startswith(ORDERED_STANZA_PREFIXES) else tuple(sorted(lines))
+            for key, lines in stanzas.items()}
+
+
+def diff_lines(old: str, new: str, max_lines: int = 20) -> Optional[Dict[str, Any]]:
+    """Order-insensitive line diff used for sections without a structural parser."""
+    before = Counter(line.strip() for line in old.splitlines() if line.strip())
+    after = Counter(line.strip() for line in new.splitlines() if line.strip())
+    added = list((after - before).elements())
+    removed = list((before - after).elements())
+    if not added and not removed:
+        return None
+    return {
+        "kind": "lines",
+        "added_count": len(added),
+        "removed_count": len(removed),
+        "added": added[:max_lines],
+        "removed": removed[:max_lines],
+    }
+
+
+def diff_running_config(old: str, new: str) -> Optional[Dict[str, Any]]:
+    """
+    Compare objects, object-groups, ACLs, interfaces, ... stanza by stanza.
+
+    For ordered stanzas (ACLs, policy-maps) a change of order is reported too:
+    "moved" lists the lines kept on both sides whose position among them changed.
+    """
+    before, after = parse_running_config(old), parse_running_config(new)
+    added = sorted(set(after) - set(before))
+    removed = sorted(set(before) - set(after))
+    changed = {}
+    for key in sorted(set(before) & set(after)):
+        if before[key] != after[key]:
+            old_lines, new_lines = set(before[key]), set(after[key])
+            members: Dict[str, Any] = {
+                "added": sorted(new_lines - old_lines),
+                "removed": sorted(old_lines - new_lines),
+            }
+            if key.startswith(ORDERED_STANZA_PREFIXES):
+                kept_before = [line for line in before[key] if line in new_lines]
+                kept_after = [line for line in after[key] if line in old_lines]
+                members["moved"] = [line for line, other in zip(kept_after, kept_before) if line != other]
+            changed[key] = members
+    if not added and not removed and not changed:
+        return None
+    return {"kind": "config", "added": added, "removed": removed, "changed": changed}
+
+
+def diff_interfaces(old: str, new: str) -> Optional[Dict[str, Any]]:
+    """Compare per-interface status and counters."""
+    before, after = parse_interfaces(old), parse_interfaces(new)
+    changed = {}
+    for name in sorted(set(before) | set(after)):
+        old_record, new_record = before.get(name), after.get(name)
+        if old_record is None or new_record is None:
+            changed[name] = {"present": {"old": old_record is not None, "new": new_record is not None}}
+            continue
+        record_changes: Dict[str, Any] = numeric_changes(
+            {k: v for k, v in old_record.items() if isinstance(v, float)},
+            {k: v for k, v in new_record.items() if isinstance(v, float)},
+        )
+        for field in ("nameif", "status"):
+            if old_record[field] != new_record[field]:
+                record_changes[field] = {"old": old_record[field], "new": new_record[field]}
+        if record_changes:
+            changed[name] = record_changes
+    return {"kind": "interfaces", "changed": changed} if changed else None
+
+
+def diff_memory_pools(old: str, new: str) -> Optional[Dict[str, Any]]:
+    """Compare "show memory detail" pool sizes."""
+    changes = numeric_changes(parse_memory_pools(old), parse_memory_pools(new))
+    return {"kind": "memory_pools", "changed": changes} if changes else None
+
+
+def _metric_comparator(extractor: Callable[[str], Dict[str, float]]) -> Callable[[str, str], Optional[Dict[str, Any]]]:
+    def compare(old: str, new: str) -> Optional[Dict[str, Any]]:
+        changes = numeric_changes(extractor(old), extractor(new))
+        return {"kind": "metrics", "changed": changes} if changes else None
+    return compare
+
+
+# Base command -> structural comparator. Anything else falls back to diff_lines.
+DIFF_COMPARATORS: Dict[str, Callable[[str, str], Optional[Dict[str, Any]]]] = {
+    "show running-config": diff_running_config,
+    "show interface": diff_interfaces,
+    "show memory detail": diff_memory_pools,
+}
+DIFF_COMPARATORS.update({command: _metric_comparator(f) for command, f in METRIC_EXTRACTORS.items()})
+
+
+class ShowTechDiff:
+    """
+    A structural diff of two show-tech captures.
+
+    The first pass streams both captures and keeps only a 16 byte digest per
+    section, so identical sections are skipped without ever being compared. A
+    second pass re-reads only the sections whose digests differ and compares
+    their parsed structure (config stanzas, ACLs, interface counters, memory
+    pools, metrics) instead of running difflib over the full text.
+
+    Example:
+        >>> diff = ShowTechDiff("before.txt", "after.txt")
+        >>> report = diff.compare()
+        >>> print(diff.format_report(report))
+    """
+
+    def __init__(self, old_file: str, new_file: str):
+        """
+        Initialize the ShowTechDiff with the two captures to compare.
+
+        Args:
+            old_file (str): Path to the baseline show-tech capture.
+            new_file (str): Path to the show-tech capture being checked.
+        """
+        self.old_file = old_file
+        self.new_file = new_file
+
+    @staticmethod
+    def index(file_path: str) -> Dict[str, bytes]:
+        """
+        Stream a capture and return section key -> digest.
+
+        Args:
+            file_path (str): Path to the show-tech capture.
+
+        Returns:
+            Dict[str, bytes]: The per-section digests, in capture order.
+        """
+        return {key: section_digest(text) for key, text in ShowTechParser(file_path).iter_sections()}
+
+    @staticmethod
+    def _load(file_path: str, keys: List[str]) -> Dict[str, str]:
+        wanted = set(keys)
+        parser = ShowTechParser(file_path)
+        commands = sorted({base_command(key) for key in keys})
+        return {key: text for key, text in parser.iter_sections(commands) if key in wanted}
+
+    def compare(self) -> Dict[str, Any]:
+        """
+        Compare the two captures.
+
+        Returns:
+            Dict[str, Any]: {"identical": <count>, "added": [...], "removed": [...],
+            "changed": {section: <comparator result>}}.
+        """
+        old_index = self.index(self.old_file)
+        new_index = self.index(self.new_file)
+
+        common = [key for key in old_index if key in new_index]
+        candidates = [key for key in common if old_index[key] != new_index[key]]
+        report: Dict[str, Any] = {
+            "identical": len(common) - len(candidates),
+            "added": [key for key in new_index if key not in old_index],
+            "removed": [key for key in old_index if key not in new_index],
+            "changed": {},
+        }
+        if not candidates:
+            return report
+
+        old_sections = self._load(self.old_file, candidates)
+        new_sections = self._load(self.new_file, candidates)
+        for key in candidates:
+            comparator = DIFF_COMPARATORS.get(base_command(key), diff_lines)
+            result = comparator(old_sections[key], new_sections[key])
+            if result is None:
+                report["identical"] += 1
+            else:
+                report["changed"][key] = result
+        return report
+
+    @staticmethod
+    def format_report(report: Dict[str, Any]) -> str:
+        """
+        Render a compare() result as a compact, human readable change report.
+
+        Args:
+            report (dict): The result of compare().
+
+        Returns:
+            str: One line per changed item.
+        """
+        lines = [
+            f"Identical sections: {report['identical']}",
+            f"Added sections: {', '.join(report['added']) or '-'}",
+            f"Removed sections: {', '.join(report['removed']) or '-'}",
+        ]
+        for key, result in report["changed"].items():
+            lines.append(f"== {key} ({result['kind']})")
+            if result["kind"] == "lines":
+                lines.extend(f"  + {line}" for line in result["added"])
+                lines.extend(f"  - {line}" for line in result["removed"])
+                hidden = result["added_count"] + result["removed_count"] - len(result["added"]) - len(result["removed"])
+                if hidden:
+                    lines.append(f"  ... {hidden} more lines")
+            elif result["kind"] == "config":
+                lines.extend(f"  + {stanza}" for stanza in result["added"])
+                lines.extend(f"  - {stanza}" for stanza in result["removed"])
+                for stanza, members in result["changed"].items():
+                    moved = f", {len(members['moved'])} reordered" if members.get("moved") else ""
+                    lines.append(f"  ~ {stanza} (+{len(members['added'])}/-{len(members['removed'])}{moved})")
+            elif result["kind"] == "interfaces":
+                for name, changes in result["changed"].items():
+                    lines.append(f"  ~ {name}: " + ", ".join(
+                        f"{field} {change.get('old')} -> {change.get('new')}"
+                        for field, change in changes.items()
+                    ))
+            else:
+                for name, change in result["changed"].items():
+                    lines.append(f"  ~ {name}: {change['old']} -> {change['new']}")
+        return "\n".join(lines)
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        diff = ShowTechDiff("before_show_tech.txt", "after_show_tech.txt")
+        print(diff.format_report(diff.compare()))
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,290 @@
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from showtech import SECTION_HEADER_REGEX
+
+# "Feb 15 2022 16:33:02 SECHP-DC-FW01 : %FTD-6-302010: 24613 in use, 25420 most used"
+# The tag is matched at the first '%' and the optional "<timestamp> <host> :" prefix
+# separately, which is several times cheaper than one anchored regex over the line.
+SYSLOG_TAG_REGEX = re.compile(r"%(?:ASA|FTD|FWSM|PIX)-(\d)-(\d{6}):\s*")
+SYSLOG_PREFIX_REGEX = re.compile(r"(\w{3} +\d{1,2} \d{4} \d{2}:\d{2}:\d{2})?\s*(?:(\S+)\s*:)?\s*$")
+
+_ENDPOINT = r"(?P<{0}_ifc>[^:\s]+):(?P<{0}_ip>[\w.:]+?)(?:/(?P<{0}_port>\d+))?(?=[\s(]|$)"
+
+# Parsers for the message ids we trend. Anything else keeps only its raw text.
+MESSAGE_FIELD_REGEXES = {
+    # Deny tcp src outside:10.1.1.1/1234 dst inside:10.2.2.2/80 by access-group "acl_out" [0x0, 0x0]
+    "106023": re.compile(
+        r"Deny (?P<protocol>\S+) src " + _ENDPOINT.format("src") + r"\s+dst " + _ENDPOINT.format("dst")
+        + r'(?:\s+\(type \d+, code \d+\))? by access-group "(?P<acl>[^"]+)"'
+    ),
+    # Built inbound TCP connection 123 for outside:1.1.1.1/80 (1.1.1.1/80) to inside:2.2.2.2/1024 (3.3.3.3/1024)
+    "302013": re.compile(
+        r"Built (?P<direction>inbound|outbound) (?P<protocol>TCP) connection (?P<connection_id>\d+) for "
+        + _ENDPOINT.format("src") + r" \([^)]*\)(?:\([^)]*\))? to " + _ENDPOINT.format("dst")
+    ),
+    # Teardown TCP connection 123 for outside:1.1.1.1/80 to inside:2.2.2.2/1024 duration 0:00:01 bytes 100 TCP FINs
+    "302014": re.compile(
+        r"Teardown (?P<protocol>TCP) connection (?P<connection_id>\d+) for " + _ENDPOINT.format("src")
+        + r" to " + _ENDPOINT.format("dst") + r" duration (?P<duration>\d+:\d{2}:\d{2}) bytes (?P<bytes>\d+)"
+        + r"\s*(?P<reason>.*)$"
+    ),
+}
+
+# Message ids whose parsed fields feed a summary counter (denied ACLs, teardown reasons).
+COUNTED_FIELD_IDS = frozenset(("106023", "302014"))
+
+LOGGING_SECTION = "show logging buffered"
+
+
+class LogEvent:
+    """
+    A single typed syslog event from "show logging buffered".
+
+    Attributes:
+    -----------
+    timestamp : Optional[str]
+        Device timestamp ("Feb 15 2022 16:24:10"), if the line carries one.
+    host : Optional[str]
+        Device name that emitted the message.
+    severity : int
+        Syslog severity, 0 (emergencies) - 7 (debugging).
+    message_id : str
+        Six digit message id, e.g. "302013".
+    text : str
+        Message body after the "%ASA-x-nnnnnn:" tag.
+    fields : Dict[str, Optional[str]]
+        Parsed fields for message ids in MESSAGE_FIELD_REGEXES, otherwise empty.
+        Optional parts that are absent (e.g. a port for ICMP) are None.
+    """
+
+    __slots__ = ("timestamp", "host", "severity", "message_id", "text", "fields")
+
+    def __init__(self, timestamp: Optional[str], host: Optional[str], severity: int,
+                 message_id: str, text: str, fields: Dict[str, Optional[str]]):
+        self.timestamp = timestamp
+        self.host = host
+        self.severity = severity
+        self.message_id = message_id
+        self.text = text
+        self.fields = fields
+
+    def __repr__(self) -> str:
+        return f"LogEvent({self.timestamp!r}, %{self.severity}-{self.message_id}, {self.text[:40]!r})"
+
+
+class LoggingBufferExtractor:
+    """
+    A streaming extractor of ASA/FTD syslog events.
+
+    Lines are consumed one at a time: each "%ASA-x-nnnnnn" line costs two short
+    precompiled regex matches, plus a field regex for the few message ids we parse.
+    Per-id, per-severity and per-failure-pattern counters are updated as lines
+    arrive, so the summary is ready the moment the stream ends. Like SlaChecker,
+    an optional failure pattern (e.g. sla.json "failed_record_pattern") is
+    compiled once and searched case-insensitively on every message.
+
+    Example:
+        >>> extractor = LoggingBufferExtractor(failure_pattern="Deny|failed")
+        >>> extractor.scan_show_tech("693110730-show_tech_Malathi.txt")
+        >>> print(extractor.summary(top_n=5))
+    """
+
+    def __init__(self, failure_pattern: Optional[str] = None,
+                 on_event: Optional[Callable[[LogEvent], None]] = None):
+        """
+        Initialize the LoggingBufferExtractor.
+
+        Args:
+            failure_pattern (str, optional): Regex of failure keywords to count.
+            on_event (callable, optional): Called with every parsed LogEvent, e.g.
+                to write it out or feed a window analytics stream.
+        """
+        self.failure_regex = re.compile(failure_pattern, re.IGNORECASE) if failure_pattern else None
+        self.on_event = on_event
+        self.total_lines = 0
+        self.unparsed_lines = 0
+        self.message_ids: Counter = Counter()
+        self.severities: Counter = Counter()
+        self.failures: Counter = Counter()
+        self.denied_acls: Counter = Counter()
+        self.teardown_reasons: Counter = Counter()
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+
+    def feed(self, line: str) -> Optional[LogEvent]:
+        """
+        Parse one line and update the counters.
+
+        Args:
+            line (str): A raw log line.
+
+        Returns:
+            Optional[LogEvent]: The event, with its fields parsed, or None for blank / non-syslog lines.
+        """
+        return self._feed(line, True)
+
+    def _feed(self, line: str, all_fields: bool) -> Optional[LogEvent]:
+        # The scan_* loops discard the returned event, so without an on_event consumer
+        # only the ids feeding a counter need their fields parsed.
+        if '%' not in line:
+            if line.strip():
+                self.total_lines += 1
+                self.unparsed_lines += 1
+            return None
+        self.total_lines += 1
+        position = line.find('%')
+        tag = SYSLOG_TAG_REGEX.match(line, position)
+        prefix = SYSLOG_PREFIX_REGEX.match(line, 0, position) if tag else None
+        if prefix is None:
+            self.unparsed_lines += 1
+            return None
+
+        severity, message_id = tag.groups()
+        timestamp, host = prefix.groups()
+        text = line[tag.end():].rstrip()
+        fields: Dict[str, Optional[str]] = {}
+        field_regex = MESSAGE_FIELD_REGEXES.get(message_id)
+        if field_regex is not None and (all_fields or message_id in COUNTED_FIELD_IDS):
+            field_match = field_regex.search(text)
+            if field_match:
+                fields = field_match.groupdict()
+
+        event = LogEvent(timestamp, host, int(severity), message_id, text, fields)
+        self._count(event)
+        if self.on_event is not None:
+            self.on_event(event)
+        return event
+
+    def _count(self, event: LogEvent) -> None:
+        self.message_ids[event.message_id] += 1
+        self.severities[event.severity] += 1
+        if event.timestamp:
+            if self.first_timestamp is None:
+                self.first_timestamp = event.timestamp
+            self.last_timestamp = event.timestamp
+        if event.message_id == "106023" and event.fields.get("acl"):
+            self.denied_acls[event.fields["acl"]] += 1
+        elif event.message_id == "302014" and event.fields.get("reason"):
+            self.teardown_reasons[event.fields["reason"]] += 1
+        if self.failure_regex is not None:
+            failure = self.failure_regex.search(event.text)
+            if failure:
+                self.failures[failure.group(0).lower()] += 1
+
+    def scan_lines(self, lines: Iterable[str]) -> None:
+        """
+        Feed every line of an iterable (an open file, a socket reader, ...).
+
+        Args:
+            lines (Iterable[str]): Raw log lines.
+        """
+        feed = self._feed
+        all_fields = self.on_event is not None
+        for line in lines:
+            feed(line, all_fields)
+
+    def scan_show_tech(self, file_path: str) -> None:
+        """
+        Stream a show-tech capture and feed only the "show logging buffered" section.
+
+        Lines outside the section are skipped with a cheap prefix check and are
+        never buffered.
+
+        Args:
+            file_path (str): Path to the show-tech capture.
+
+        Raises:
+            FileNotFoundError: If the capture does not exist.
+            PermissionError: If access to the capture is denied.
+            IOError: If an I/O error occurs while reading the capture.
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+                inside = False
+                all_fields = self.on_event is not None
+                for line in file:
+                    if line.startswith('---'):
+                        header = SECTION_HEADER_REGEX.match(line)
+                        if header:
+                            if inside:
+                                break
+                            inside = header.group(1) == LOGGING_SECTION
+                            continue
+                    if inside:
+                        self._feed(line, all_fields)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Show-tech file not found: {file_path}") from e
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied: Cannot access file {file_path}") from e
+        except IOError as e:
+            raise IOError(f"An error occurred while reading file: {file_path}") from e
+
+    def scan_file(self, file_path: str) -> None:
+        """
+        Stream a plain syslog file (one message per line).
+
+        Args:
+            file_path (str): Path to the log file.
+
+        Raises:
+            FileNotFoundError: If the log file does not exist.
+            PermissionError: If access to the log file is denied.
+            IOError: If an I/O error occurs while reading the file.
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+                self.scan_lines(file)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Log file not found: {file_path}") from e
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied: Cannot access file {file_path}") from e
+        except IOError as e:
+            raise IOError(f"An error occurred while reading file: {file_path}") from e
+
+    def top_message_ids(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Return the n most frequent message ids with their counts."""
+        return self.message_ids.most_common(n)
+
+    def summary(self, top_n: int = 10) -> Dict[str, Any]:
+        """
+        Return the counters collected so far.
+
+        Args:
+            top_n (int): How many entries to keep in each top-N list.
+
+        Returns:
+            Dict[str, Any]: Totals, time range, and top-N lists per counter.
+        """
+        return {
+            "total_lines": self.total_lines,
+            "events": sum(self.message_ids.values()),
+            "unparsed_lines": self.unparsed_lines,
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+            "severities": dict(sorted(self.severities.items())),
+            "top_message_ids": self.top_message_ids(top_n),
+            "top_denied_acls": self.denied_acls.most_common(top_n),
+            "top_teardown_reasons": self.teardown_reasons.most_common(top_n),
+            "failures": self.failures.most_common(top_n),
+        }
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Return the per message id counters as rows for CsvFileWriter.
+
+        Returns:
+            List[Dict[str, Any]]: [{"message_id": ..., "count": ...}, ...], most frequent first.
+        """
+        return [{"message_id": message_id, "count": count} for message_id, count in self.message_ids.most_common()]
+
+
+# Example Usage
+if __name__ == "__main__":
+    try:
+        extractor = LoggingBufferExtractor(failure_pattern="Traceback|Failed|Exception|Error|Deny")
+        extractor.scan_show_tech("693110730-show_tech_Malathi.txt")
+        print(extractor.summary(top_n=5))
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,214 @@
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, array.array + pure Python is the fallback
+    np = None
+
+DEFAULT_CHUNK = 1 << 20
+ANCHOR_STRIDE = 16
+# Integer prefix sums are exact; beyond this bound sum x length could overflow int64, so floats are used.
+INT_PRODUCT_LIMIT = 1 << 62
+
+
+def _bisect(prefix: Any, rights: Any, lo: Any, hi: Any, k: float) -> Any:
+    """Smallest l in [lo, hi] per right end r whose window l..r fits; hi must fit or be r + 1."""
+    lo = lo.copy()
+    hi = hi.copy()
+    end = prefix[rights + 1]
+    stop = rights + 1
+    while True:
+        open_ = lo < hi
+        if not open_.any():
+            return lo
+        mid = (lo + hi) >> 1
+        fits = ((end - prefix[mid]) * (stop - mid) < k) | ~open_
+        np.copyto(hi, mid, where=fits)
+        np.copyto(lo, mid + 1, where=~fits)
+
+
+def _left_bounds(prefix: Any, rights: Any, lowest: int, k: float) -> Any:
+    """
+    For every right end r, return the smallest left end l >= lowest with (sum of l..r) x (r - l + 1) < k.
+
+    With non-negative values the score only falls as l moves right, and the
+    left end never moves back as r grows. So the left ends of every
+    ANCHOR_STRIDE-th right end are found first (recursively), and every other
+    right end is bisected only between its neighbouring anchors' left ends,
+    which are usually a few samples apart. l = r + 1 (the empty window) means
+    none qualifies.
+    """
+    lo = np.full(rights.shape, lowest, dtype=np.int64)
+    hi = rights + 1
+    if rights.size > ANCHOR_STRIDE:
+        anchors = _left_bounds(prefix, rights[::ANCHOR_STRIDE], lowest, k)
+        block = np.arange(rights.size) // ANCHOR_STRIDE
+        lo = anchors[block]
+        hi = np.minimum(hi, np.append(anchors[1:], rights[-1] + 1)[block])
+    return _bisect(prefix, rights, lo, hi, k)
+
+
+class SubarrayCounter:
+    """
+    Count windows with sum x length < k over a stream of non-negative samples.
+
+    This is the two-pointer count of 14_sub.py (countSubarrays) made usable
+    on per-second conn-rate series of tens of millions of samples:
+
+    - several k thresholds are counted in one pass over the data;
+    - input arrives in chunks (NumPy arrays, ``array.array`` buffers or any
+      sequence); between chunks only the samples of the longest still-open
+      window are carried over, with each threshold's left edge;
+    - with NumPy every chunk is processed with vectorized prefix sums and a
+      bisection of all window starts at once (see _left_bounds); without it the two-pointer
+      loop runs over ``array('d')`` buffers, without any per-sample I/O.
+
+    Counts are exact for integer samples. Values must be non-negative (the
+    window score must grow with the window for two pointers to apply). A
+    threshold so large that its window never closes keeps carrying every
+    sample, so pick thresholds that windows of interest actually exceed.
+
+    Example:
+        >>> counter = SubarrayCounter(thresholds=[10, 100, 1000])
+        >>> for chunk in chunks:
+        ...     counter.feed(chunk)
+        >>> print(counter.counts())
+    """
+
+    def __init__(self, thresholds: Iterable[float]):
+        """
+        Initialize the SubarrayCounter.
+
+        Args:
+            thresholds (iterable): The k values to count windows for.
+        """
+        self.thresholds = list(thresholds)
+        self.samples = 0
+        self._totals = [0] * len(self.thresholds)
+        self._lefts = [0] * len(self.thresholds)  # Absolute index of each threshold's window start.
+        self._sums = [0] * len(self.thresholds)   # Window sums, for the pure Python loop.
+        self._base = 0                            # Absolute index of the first carried sample.
+        self._carry: Any = None
+        self._integer = True
+
+    def feed(self, chunk: Any) -> None:
+        """
+        Count the windows ending in the next chunk of samples.
+
+        Raises:
+            ValueError: If the chunk contains negative values.
+        """
+        if np is not None:
+            self._feed_numpy(np.asarray(chunk))
+        else:
+            self._feed_python(chunk)
+
+    def _feed_numpy(self, chunk: Any) -> None:
+        if chunk.size == 0:
+            return
+        if chunk.min() < 0:
+            raise ValueError("Window counts need non-negative values.")
+        self._integer = self._integer and chunk.dtype.kind in "biu"
+        dtype = np.int64 if self._integer else np.float64
+        carry = np.empty(0, dtype=dtype) if self._carry is None else self._carry
+        values = np.concatenate((carry.astype(dtype, copy=False), chunk.astype(dtype, copy=False)))
+        prefix = np.zeros(values.size + 1, dtype=dtype)
+        np.cumsum(values, out=prefix[1:])
+        if dtype is np.int64 and int(prefix[-1]) * values.size >= INT_PRODUCT_LIMIT:
+            prefix = prefix.astype(np.float64)
+        rights = np.arange(carry.size, values.size, dtype=np.int64)
+        for index, k in enumerate(self.thresholds):
+            lefts = _left_bounds(prefix, rights, self._lefts[index] - self._base, k)
+            self._totals[index] += int((rights + 1 - lefts).sum())
+            self._lefts[index] = int(lefts[-1]) + self._base
+        self._trim(values)
+        self.samples += chunk.size
+
+    def _feed_python(self, chunk: Any) -> None:
+        if not len(chunk):
+            return
+        if min(chunk) < 0:
+            raise ValueError("Window counts need non-negative values.")
+        if isinstance(chunk, array):
+            integer = chunk.typecode in "bBhHiIlLqQ"
+        else:
+            integer = all(isinstance(value, int) for value in chunk)
+        self._integer = self._integer and integer
+        values = array('q' if self._integer else 'd')
+        if self._carry is not None:
+            values.extend(iter(self._carry) if self._carry.typecode != values.typecode else self._carry)
+        values.extend(iter(chunk) if not isinstance(chunk, array) or chunk.typecode != values.typecode else chunk)
+        start = self.samples - self._base
+        for index, k in enumerate(self.thresholds):
+            left, total, window = self._lefts[index] - self._base, self._totals[index], self._sums[index]
+            for right in range(start, len(values)):
+                window += values[right]
+                while left <= right and window * (right - left + 1) >= k:
+                    window -= values[left]
+                    left += 1
+                total += right - left + 1
+            self._lefts[index], self._totals[index], self._sums[index] = left + self._base, total, window
+        self._trim(values)
+        self.samples += len(chunk)
+
+    def _trim(self, values: Any) -> None:
+        # Samples left of every threshold's window start can never be part of a counted window again.
+        base = min(self._lefts) if self._lefts else self._base + len(values)
+        self._carry = values[base - self._base:]
+        self._base = base
+
+    def counts(self) -> Dict[float, int]:
+        """
+        Return threshold -> number of qualifying windows seen so far.
+        """
+        return dict(zip(self.thresholds, self._totals))
+
+    @property
+    def carried(self) -> int:
+        """Samples currently held for windows that are still open."""
+        return 0 if self._carry is None else len(self._carry)
+
+
+def count_subarrays_batch(values: Any, thresholds: Sequence[float], chunk_size: int = DEFAULT_CHUNK) -> List[int]:
+    """
+    Count windows with sum x length < k for several thresholds.
+
+    Args:
+        values: Non-negative samples (NumPy array, array.array or sequence).
+        thresholds (sequence): The k values.
+        chunk_size (int): Samples processed per vectorized step (bounds memory). Default is 1M.
+
+    Returns:
+        List[int]: One count per threshold, in the given order.
+    """
+    counter = SubarrayCounter(thresholds)
+    for start in range(0, len(values), chunk_size):
+        counter.feed(values[start:start + chunk_size])
+    return [counter.counts()[k] for k in thresholds]
+
+
+def count_subarrays(values: Any, k: float) -> int:
+    """
+    Count windows with sum x length < k (countSubarrays of 14_sub.py, without the per-step print).
+
+    Example:
+        >>> count_subarrays([2, 1, 4, 3, 5], 10)
+        6
+    """
+    return count_subarrays_batch(values, [k])[0]
+
+
+# Example Usage
+if __name__ == "__main__":
+    import random
+
+    try:
+        rates = array('q', (random.randint(0, 50) for _ in range(2_000_000)))  # Per-second conn rate samples.
+        started = time.perf_counter()
+        results = count_subarrays_batch(rates, [1_000, 10_000, 100_000])
+        print(f"[+] {results} in {time.perf_counter() - started:.2f}s "
+              f"({'NumPy' if np is not None else 'pure Python'})")
+    except Exception as e:
+        print(f"[-] Error: {e}")
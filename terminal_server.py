@@ -0,0 +1,515 @@
+import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from console_dialogs import (
+    CONFIRM_REGEX,
+    EXPECT,
+    MORE_REGEX,
+    PAGER_NOISE_REGEX,
+    PRIVILEGED_PROMPT_REGEX,
+    PROMPT,
+    PROMPT_WINDOW,
+    RUN_COMMAND,
+    SEND_LINE,
+    USER_PROMPT_REGEX,
+    WRITE,
+    WRITE_LINE,
+    clear_line_dialog,
+    disable_paging_dialog,
+    enable_dialog,
+    login_dialog,
+    remembered_prompt,
+    run_dialog_async,
+    wake_dialog,
+)
+
+# Telnet protocol bytes (RFC 854/855).
+IAC, DONT, DO, WONT, WILL, SB, SE = 255, 254, 253, 252, 251, 250, 240
+OPTION_ECHO, OPTION_SUPPRESS_GO_AHEAD = 1, 3
+# IAC <verb> <option> / IAC SB ... IAC SE / IAC <single byte command>
+TELNET_COMMAND_REGEX = re.compile(rb"\xff(?:\xff|[\xfb-\xfe].|\xfa.*?\xff\xf0|[^\xfa-\xff])", re.DOTALL)
+
+
+class AsyncTelnetSession:
+    """
+    A minimal asyncio telnet client with the same prompt handling as ConsoleSession.
+
+    Telnet option negotiation is answered inline (the server may echo and
+    suppress go-ahead, everything else is refused), so any number of sessions
+    can share one event loop without a thread each.
+
+    Example:
+        >>> async def main():
+        ...     async with AsyncTelnetSession("10.105.206.154", 2010) as session:
+        ...         await session.wake()
+        ...         print(await session.send_command("show version"))
+    """
+
+    def __init__(self, host: str, port: int = 23, timeout: float = 10.0, encoding: str = "utf-8"):
+        """
+        Initialize the AsyncTelnetSession. The connection is opened by connect() or on entering an async with block.
+
+        Args:
+            host (str): Terminal server or device address.
+            port (int): Telnet port. Default is 23.
+            timeout (float): Default seconds to wait for a prompt. Default is 10.
+            encoding (str): Encoding used for commands and output. Default is "utf-8".
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.encoding = encoding
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.prompt: Optional[bytes] = None
+        self._buffer = bytearray()
+        self._partial = b""
+
+    async def __aenter__(self) -> "AsyncTelnetSession":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """
+        Open the TCP connection.
+
+        Raises:
+            ConnectionError: If the host cannot be reached in time.
+        """
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Cannot connect to {self.host}:{self.port}: {e}") from e
+
+    async def close(self) -> None:
+        """
+        Close the connection.
+        """
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+            self.writer = None
+
+    def write(self, data: str) -> None:
+        """
+        Queue raw text without a line terminator.
+        """
+        self.writer.write(data.encode(self.encoding).replace(b"\xff", b"\xff\xff"))
+
+    def write_line(self, line: str) -> None:
+        """
+        Queue a line of text followed by a newline.
+        """
+        self.write(line + "\n")
+
+    def _negotiate(self, data: bytes) -> bytes:
+        """Strip telnet commands from received bytes and answer option requests."""
+        data = self._partial + data
+        self._partial = b""
+        if IAC not in data:
+            return data
+        last = data.rfind(b"\xff")
+        # An IAC sequence cut by the end of the chunk is kept for the next read.
+        if last >= len(data) - 2 and not TELNET_COMMAND_REGEX.match(data, last):
+            data, self._partial = data[:last], data[last:]
+        replies = bytearray()
+
+        def answer(match: "re.Match[bytes]") -> bytes:
+            command = match.group(0)
+            if command == b"\xff\xff":
+                return b"\xff"
+            if len(command) == 3 and command[1] in (DO, DONT, WILL, WONT):
+                verb, option = command[1], command[2]
+                if verb == DO:
+                    replies.extend((IAC, WONT, option))
+                elif verb == WILL:
+                    accept = option in (OPTION_ECHO, OPTION_SUPPRESS_GO_AHEAD)
+                    replies.extend((IAC, DO if accept else DONT, option))
+            return b""
+
+        data = TELNET_COMMAND_REGEX.sub(answer, data)
+        if replies:
+            self.writer.write(bytes(replies))
+        return data
+
+    async def _read(self, deadline: float) -> bytes:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        data = await asyncio.wait_for(self.reader.read(65536), remaining)
+        if not data:
+            raise EOFError(f"Connection to {self.host}:{self.port} closed")
+        return self._negotiate(data)
+
+    async def expect(self, patterns: List[Pattern[bytes]], timeout: Optional[float] = None) -> Tuple[int, bytes]:
+        """
+        Wait until one of the end-anchored prompt patterns matches.
+
+        Args:
+            patterns (list): Compiled byte regexes.
+            timeout (float, optional): Seconds to wait. Defaults to the session timeout.
+
+        Returns:
+            Tuple[int, bytes]: Index of the matched pattern and the bytes consumed up to the match.
+
+        Raises:
+            TimeoutError: If nothing matched within the timeout.
+            EOFError: If the connection was closed by the peer.
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        await self.writer.drain()
+        while True:
+            window = max(len(self._buffer) - PROMPT_WINDOW, 0)
+            for index, pattern in enumerate(patterns):
+                match = pattern.search(self._buffer, window)
+                if match:
+                    data = bytes(self._buffer[:match.end()])
+                    del self._buffer[:match.end()]
+                    return index, data
+            try:
+                self._buffer += await self._read(deadline)
+            except asyncio.TimeoutError:
+                tail = bytes(self._buffer[-80:]).decode(self.encoding, 'replace')
+                raise TimeoutError(f"No expected prompt from {self.host}:{self.port} (last output: {tail!r})") from None
+
+    def _remember_prompt(self, data: bytes) -> None:
+        self.prompt = remembered_prompt(data)
+
+    async def _perform(self, step: tuple) -> Any:
+        """Carry out one step of a console_dialogs dialog."""
+        kind = step[0]
+        if kind == EXPECT:
+            return await self.expect(step[1], step[2])
+        if kind == WRITE:
+            self.writer.write(step[1])
+        elif kind == WRITE_LINE:
+            self.write_line(step[1])
+        elif kind == SEND_LINE:
+            await self.write_command(step[1])
+        elif kind == RUN_COMMAND:
+            return await self.send_command(step[1], timeout=self.timeout if step[2] is None else step[2])
+        elif kind == PROMPT:
+            self._remember_prompt(step[1])
+        return None
+
+    async def wake(self, timeout: Optional[float] = None) -> int:
+        """
+        Press Enter and wait for any prompt.
+
+        Returns:
+            int: Index of the prompt seen, in the order
+            (username, password, privileged, user, more, confirm).
+        """
+        return await run_dialog_async(wake_dialog(timeout), self._perform)
+
+    async def login(self, username: str, password: str, enable_password: Optional[str] = None,
+                    timeout: Optional[float] = None, disable_paging: bool = True) -> None:
+        """
+        Answer Username/Password prompts until a CLI prompt appears; see ConsoleSession.login.
+
+        Raises:
+            PermissionError: If the credentials or the enable password are rejected.
+            TimeoutError: If the device stops responding.
+        """
+        first_timeout = min(self.timeout if timeout is None else timeout, 2.0)
+        dialog = login_dialog(f"{self.host}:{self.port}", username, password, enable_password, first_timeout,
+                              timeout, disable_paging)
+        await run_dialog_async(dialog, self._perform)
+
+    async def enable(self, enable_password: str, timeout: Optional[float] = None) -> None:
+        """
+        Enter privileged EXEC mode.
+
+        Raises:
+            PermissionError: If the enable password is rejected.
+        """
+        await run_dialog_async(enable_dialog(f"{self.host}:{self.port}", enable_password, timeout), self._perform)
+
+    async def disable_paging(self, timeout: Optional[float] = None) -> bool:
+        """
+        Turn the pager off ("terminal pager 0", then "terminal length 0").
+
+        Returns:
+            bool: True if one of the commands was accepted.
+        """
+        return await run_dialog_async(disable_paging_dialog(timeout), self._perform)
+
+    async def clear_line(self, line: int, timeout: Optional[float] = None) -> None:
+        """
+        Run "clear line <n>" on a terminal server and confirm it.
+        """
+        await run_dialog_async(clear_line_dialog(line, timeout), self._perform)
+
+    async def send_command(self, command: str, timeout: float = 60.0, confirm: Optional[str] = None) -> str:
+        """
+        Run a command and return its output once the CLI prompt comes back.
+
+        Pager prompts are answered immediately; a confirm prompt is answered
+        with ``confirm`` or raises RuntimeError if it is None.
+
+        Output received before the command's echo (such as a stale prompt) is
+        discarded, so back-to-back commands never return each other's output.
+
+        Returns:
+            str: The command output without echo, pager prompts and trailing prompt.
+        """
+        patterns = [PRIVILEGED_PROMPT_REGEX, USER_PROMPT_REGEX, MORE_REGEX, CONFIRM_REGEX]
+        deadline = time.monotonic() + timeout
+        chunks: List[bytes] = []
+        await self.write_command(command, max(deadline - time.monotonic(), 0.0))
+        while True:
+            index, data = await self.expect(patterns, max(deadline - time.monotonic(), 0.0))
+            chunks.append(data)
+            if index == 2:
+                self.writer.write(b" ")
+            elif index == 3:
+                if confirm is None:
+                    raise RuntimeError(f"{command!r} on {self.host}:{self.port} asked for confirmation")
+                self.write(confirm)
+            else:
+                self._remember_prompt(data)
+                break
+        raw = PAGER_NOISE_REGEX.sub(b"", b"".join(chunks))
+        lines = raw.decode(self.encoding, 'replace').replace("\r\n", "\n").replace("\r", "").split("\n")
+        return "\n".join(lines[:-1])
+
+    async def write_command(self, command: str, timeout: Optional[float] = None) -> None:
+        """
+        Send a command and consume everything up to and including its echo.
+
+        Anything received before the echo (e.g. the extra prompt an Enter from
+        wake() produces) predates the command, so it is dropped instead of
+        being taken for the end of the command's output.
+
+        Raises:
+            TimeoutError: If the command is not echoed in time.
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        echo = re.compile(re.escape(command.strip().encode(self.encoding)) + rb"[ \t]*\r*\n")
+        self._buffer.clear()
+        self.write_line(command)
+        await self.writer.drain()
+        while True:
+            match = echo.search(self._buffer)
+            if match:
+                del self._buffer[:match.end()]
+                return
+            try:
+                self._buffer += await self._read(deadline)
+            except asyncio.TimeoutError:
+                tail = bytes(self._buffer[-80:]).decode(self.encoding, 'replace')
+                raise TimeoutError(f"{command!r} was not echoed by {self.host}:{self.port} "
+                                   f"(last output: {tail!r})") from None
+
+
+class TerminalServerClient:
+    """
+    Drive every console line of a terminal server from one asyncio event loop.
+
+    A single authenticated control session to the terminal server is kept
+    open and reused for "clear line" commands (serialised with a lock), instead
+    of logging in again before every console connection. Each line can be
+    reserved by one task at a time, and console sessions to the reverse-telnet
+    ports (port_base + line) run concurrently.
+
+    Example:
+        >>> async def show_version(console, line):
+        ...     return await console.send_command("show version")
+        >>> async def main():
+        ...     async with TerminalServerClient("10.105.206.154", "lab", "lab") as ts:
+        ...         return await ts.run_on_lines(range(1, 49), show_version)
+        >>> results = asyncio.run(main())
+    """
+
+    def __init__(self, host: str, username: str, password: str, enable_password: Optional[str] = None,
+                 port: int = 23, port_base: int = 2000, timeout: float = 10.0, max_concurrency: int = 48):
+        """
+        Initialize the TerminalServerClient.
+
+        Args:
+            host (str): Terminal server address.
+            username (str): Terminal server login username.
+            password (str): Terminal server login password.
+            enable_password (str, optional): Enable password, if "clear line" needs privileged mode.
+            port (int): Terminal server management telnet port. Default is 23.
+            port_base (int): Line n is reached on port_base + n. Default is 2000.
+            timeout (float): Default prompt timeout in seconds. Default is 10.
+            max_concurrency (int): Maximum console sessions open at once. Default is 48.
+        """
+        self.host = host
+        self.username = username
+        self.password = password
+        self.enable_password = enable_password
+        self.port = port
+        self.port_base = port_base
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.control: Optional[AsyncTelnetSession] = None
+        self._control_lock = asyncio.Lock()  # Guards every use and replacement of self.control.
+        self._line_locks: Dict[int, asyncio.Lock] = {}
+
+    async def __aenter__(self) -> "TerminalServerClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """
+        Open and authenticate the control session.
+
+        self.control is only set once the login succeeded; a session that
+        fails to log in is closed instead of being left for the next caller.
+        """
+        control = AsyncTelnetSession(self.host, self.port, self.timeout)
+        await control.connect()
+        try:
+            await control.login(self.username, self.password, self.enable_password)
+        except BaseException:
+            await control.close()
+            raise
+        self.control = control
+
+    async def close(self) -> None:
+        """
+        Log out of and close the control session.
+        """
+        async with self._control_lock:
+            await self._close_control()
+
+    async def _close_control(self) -> None:
+        # Callers hold _control_lock.
+        if self.control is not None:
+            control, self.control = self.control, None
+            try:
+                control.write_line("exit")
+                await control.writer.drain()
+            except (OSError, AttributeError):
+                pass
+            await control.close()
+
+    async def _ensure_control(self) -> None:
+        # Callers hold _control_lock.
+        if self.control is None or self.control.writer is None or self.control.writer.is_closing():
+            await self._close_control()
+            await self.open()
+
+    async def clear_line(self, line: int) -> None:
+        """
+        Run "clear line <n>" on the control session and confirm it.
+
+        Reconnects the control session once if the terminal server dropped it
+        or stopped answering. A session that timed out is closed rather than
+        reused, since its unread output would be taken for the next reply.
+        The whole exchange, including any reconnect, runs under the control
+        lock, so concurrent callers never see a half-replaced session.
+        """
+        async with self._control_lock:
+            for attempt in range(2):
+                try:
+                    await self._ensure_control()
+                    await self.control.clear_line(line)
+                    return
+                except (EOFError, ConnectionError, TimeoutError):
+                    if self.control is not None:
+                        await self.control.close()
+                        self.control = None
+                    if attempt:
+                        raise
+
+    def reserve(self, line: int) -> asyncio.Lock:
+        """
+        Return the lock that gives a task exclusive use of a console line.
+        """
+        lock = self._line_locks.get(line)
+        if lock is None:
+            lock = self._line_locks[line] = asyncio.Lock()
+        return lock
+
+    @asynccontextmanager
+    async def console(self, line: int, clear: bool = True, username: Optional[str] = None,
+                      password: Optional[str] = None, enable_password: Optional[str] = None) -> AsyncIterator[AsyncTelnetSession]:
+        """
+        Reserve a line, optionally clear it, and open a console session on its reverse-telnet port.
+
+        Args:
+            line (int): Terminal server line number.
+            clear (bool): Clear the line first so a stale session does not block it. Default is True.
+            username (str, optional): Device login username, if the console asks for one.
+            password (str, optional): Device login password.
+            enable_password (str, optional): Device enable password.
+
+        Yields:
+            AsyncTelnetSession: The console session, at a CLI prompt with paging disabled.
+        """
+        async with self.reserve(line):
+            if clear:
+                await self.clear_line(line)
+            session = AsyncTelnetSession(self.host, self.port_base + line, self.timeout)
+            await session.connect()
+            try:
+                if username is not None:
+                    await session.login(username, password or "", enable_password)
+                else:
+                    await session.wake()
+                    await session.disable_paging()
+                yield session
+            finally:
+                await session.close()
+
+    async def run_on_lines(
+        self,
+        lines: Iterable[int],
+        action: Callable[[AsyncTelnetSession, int], Awaitable[Any]],
+        **console_kwargs,
+    ) -> Dict[int, Any]:
+        """
+        Run ``action(session, line)`` on many console lines concurrently.
+
+        Args:
+            lines (iterable): Line numbers to drive.
+            action (callable): Coroutine function receiving the console session and the line number.
+            **console_kwargs: Passed to console() (clear, username, password, enable_password).
+
+        Returns:
+            Dict[int, Any]: line -> the action's result, or the exception it raised.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(line: int) -> Any:
+            async with semaphore:
+                async with self.console(line, **console_kwargs) as session:
+                    return await action(session, line)
+
+        lines = list(lines)
+        results = await asyncio.gather(*(run(line) for line in lines), return_exceptions=True)
+        return dict(zip(lines, results))
+
+
+# Example Usage
+if __name__ == "__main__":
+    async def show_version(console: AsyncTelnetSession, line: int) -> str:
+        return await console.send_command("show version")
+
+    async def main() -> None:
+        async with TerminalServerClient("10.105.206.154", "lab", "lab") as terminal_server:
+            results = await terminal_server.run_on_lines([10, 15], show_version)
+        for line, output in results.items():
+            print(f"[+] Line {line}:\n{output}")
+
+    try:
+        asyncio.run(main())
+    except Exception as e:
+        print(f"[-] Error: {e}")
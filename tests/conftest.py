@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+# The modules live flat in the repository root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import subarrays  # noqa: E402
+import window_analytics  # noqa: E402
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    """Run a test with NumPy and again with the array.array fallback (NumPy hidden)."""
+    if request.param == "array":
+        monkeypatch.setattr(subarrays, "np", None)
+        monkeypatch.setattr(window_analytics, "np", None)
+    elif subarrays.np is None:
+        pytest.skip("NumPy is not installed")
+    return request.param
@@ -0,0 +1,24 @@
+from asa_parsers import VersionRecord, parse_collection_files
+
+FLEET_OUTPUT = """\
+------------------ show version ------------------
+
+Cisco Adaptive Security Appliance Software Version 9.16(2)
+
+------------------ show conn count ------------------
+
+12 in use, 40 most used
+
+"""
+
+
+def test_blank_preamble_is_not_a_version_record(tmp_path):
+    output_file = tmp_path / "asa1_20220215_163536.txt"
+    output_file.write_text(FLEET_OUTPUT)
+
+    grouped = parse_collection_files([str(output_file)])
+
+    versions = grouped[VersionRecord]
+    assert len(versions) == 1
+    assert versions[0].software_version == "9.16(2)"
+    assert versions[0].device == "asa1"
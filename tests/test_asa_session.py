@@ -0,0 +1,51 @@
+import time
+
+from asa_session import DeviceSessionPool
+
+ASA = {"device_type": "cisco_asa", "host": "192.0.2.1", "username": "admin", "password": "admin"}
+
+
+class FakeConnection:
+    opened = 0
+
+    def __init__(self, **device):
+        FakeConnection.opened += 1
+        self.disconnected = False
+
+    def send_command(self, command, **kwargs):
+        return command
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def test_commands_are_counted_per_session():
+    pool = DeviceSessionPool(connect_handler=FakeConnection)
+    pool.send_commands(ASA, ["show version", "show failover"])
+    pool.send_command(ASA, "show clock")
+
+    [session] = pool._idle[next(iter(pool._idle))]
+    assert session.commands_sent == 3
+
+
+def test_sessions_older_than_max_age_are_replaced():
+    FakeConnection.opened = 0
+    pool = DeviceSessionPool(connect_handler=FakeConnection, max_session_age=0.05)
+    pool.send_command(ASA, "show version")
+    pool.send_command(ASA, "show version")
+    assert FakeConnection.opened == 1
+
+    time.sleep(0.1)
+    pool.send_command(ASA, "show version")
+    assert FakeConnection.opened == 2
+
+
+def test_sessions_past_max_age_are_not_idle_candidates():
+    pool = DeviceSessionPool(connect_handler=FakeConnection, max_session_age=0.05)
+    pool.send_command(ASA, "show version")
+    assert pool.has_idle_session(ASA)
+
+    time.sleep(0.1)
+    assert not pool.has_idle_session(ASA)
+    assert pool.close_idle() == 1
+    assert pool.stats() == {}
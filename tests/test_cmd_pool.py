@@ -0,0 +1,36 @@
+import asyncio
+import sys
+
+from cmd_pool import CommandPool
+
+SLEEP = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+
+def test_blank_commands_are_errors(tmp_path):
+    pool = CommandPool(timeout=1, output_dir=str(tmp_path))
+
+    results = pool.run([[sys.executable, "-c", "pass"], "", "   "])
+
+    assert [result["status"] for result in results] == ["ok", "error", "error"]
+    assert results[1]["error"] == "Empty command"
+
+
+def test_cancelled_execute_stops_the_process(tmp_path):
+    pool = CommandPool(output_dir=str(tmp_path))
+    processes = []
+    spawn = pool._spawn
+
+    async def tracking_spawn(command):
+        process = await spawn(command)
+        processes.append(process)
+        return process
+
+    async def cancel_while_running():
+        pool._spawn = tracking_spawn
+        task = asyncio.ensure_future(pool.execute(0, SLEEP))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(asyncio.wait_for(cancel_while_running(), 10))
+    assert processes and processes[0].returncode is not None
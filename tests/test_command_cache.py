@@ -0,0 +1,64 @@
+from asa_session import DeviceSessionPool
+from command_cache import FINGERPRINT_COMMAND, CachedCommandRunner, CommandCache
+
+ASA = {"device_type": "cisco_asa", "host": "192.0.2.1", "username": "admin", "password": "admin"}
+
+
+class FakeDevice:
+    """Stands in for netmiko.ConnectHandler, counting logins and commands."""
+
+    def __init__(self):
+        self.logins = 0
+        self.commands = []
+        self.config = "Configuration last modified by enable_1 at 16:18:29.939 UTC Tue Feb 15 2022"
+
+    def __call__(self, **device):
+        self.logins += 1
+        return self
+
+    def send_command(self, command, **kwargs):
+        self.commands.append(command)
+        if command == FINGERPRINT_COMMAND:
+            return self.config
+        return f"{command} ({self.config[-4:]}, #{len(self.commands)})"
+
+    def disconnect(self):
+        pass
+
+
+def test_cached_device_is_not_logged_into(tmp_path):
+    device = FakeDevice()
+    cache = CommandCache(str(tmp_path / "cache.sqlite"))
+    first = CachedCommandRunner(DeviceSessionPool(connect_handler=device), cache, fingerprint_ttl=0)
+    outputs = first.send_commands(ASA, ["show version", "show inventory"])
+    first.close_all()
+
+    again = CachedCommandRunner(DeviceSessionPool(connect_handler=device), cache, fingerprint_ttl=60)
+    assert again.send_commands(ASA, ["show version", "show inventory"]) == outputs
+    assert device.logins == 1
+
+
+def test_old_hits_wait_for_the_fingerprint(tmp_path):
+    device = FakeDevice()
+    cache = CommandCache(str(tmp_path / "cache.sqlite"))
+    outputs = CachedCommandRunner(DeviceSessionPool(connect_handler=device), cache).send_commands(
+        ASA, ["show version", "show inventory"])
+    sent = len(device.commands)
+
+    # Stored longer ago than fingerprint_ttl: the fingerprint is read first, then the cache answers.
+    runner = CachedCommandRunner(DeviceSessionPool(connect_handler=device), cache, fingerprint_ttl=0)
+    assert runner.send_commands(ASA, ["show version", "show inventory"]) == outputs
+    assert device.commands[sent:] == [FINGERPRINT_COMMAND]
+
+
+def test_config_change_refreshes_the_hits(tmp_path):
+    device = FakeDevice()
+    cache = CommandCache(str(tmp_path / "cache.sqlite"))
+    CachedCommandRunner(DeviceSessionPool(connect_handler=device), cache).send_commands(ASA, ["show version"])
+    device.config = device.config.replace("2022", "2023")
+
+    runner = CachedCommandRunner(DeviceSessionPool(connect_handler=device), cache, fingerprint_ttl=0)
+    outputs = runner.send_commands(ASA, ["show version", "show inventory"])
+
+    assert device.logins == 2
+    assert all("2023" in output for output in outputs.values())
@@ -0,0 +1,22 @@
+import os
+
+from dedup_finder import DuplicateFinder
+
+
+def test_overlapping_roots_and_hard_links_are_not_duplicates(tmp_path):
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    content = os.urandom(300_000)
+    (tmp_path / "original").write_bytes(content)
+    (nested / "copy").write_bytes(content)
+    os.link(tmp_path / "original", nested / "link")
+
+    finder = DuplicateFinder(workers=0, block=64 * 1024)
+    groups = finder.find([str(tmp_path), str(nested), str(tmp_path) + os.sep])
+
+    assert len(groups) == 1
+    assert len(groups[0]["paths"]) == 2
+    assert groups[0]["wasted"] == len(content)
+    assert finder.stats["files"] == 3
+    assert finder.stats["hard_links"] == 1
+    assert finder.stats["bytes_read"] == 2 * len(content)
@@ -0,0 +1,103 @@
+import os
+import threading
+import time
+
+from asa_parsers import VersionRecord, parse_collection_files
+from asa_session import DeviceSessionPool
+from fleet_runner import FleetRunner
+
+
+class FakeAsa:
+    """Stands in for netmiko.ConnectHandler; the output names the device that produced it."""
+
+    def __call__(self, **device):
+        self.host = device["host"]
+        return self
+
+    def send_command(self, command, **kwargs):
+        return f"Cisco Adaptive Security Appliance Software Version 9.16(2)\n{self.host} up 1 day"
+
+    def disconnect(self):
+        pass
+
+
+def test_devices_with_the_same_name_get_their_own_file(tmp_path):
+    devices = [{"host": "192.0.2.1", "name": "asa"}, {"host": "192.0.2.2", "name": "asa"}]
+    runner = FleetRunner(output_dir=str(tmp_path), max_workers=1, retries=0,
+                         pool=DeviceSessionPool(connect_handler=FakeAsa()))
+
+    results = runner.run(devices, ["show version"])
+
+    files = sorted(result["output_file"] for result in results)
+    assert [result["status"] for result in results] == ["ok", "ok"]
+    assert len(set(files)) == 2 and all(os.path.basename(path).endswith(".log") for path in files)
+    versions = parse_collection_files(files)[VersionRecord]
+    assert [record.device for record in versions] == ["asa", "asa"]
+
+
+def test_write_errors_are_reported_per_device(tmp_path):
+    runner = FleetRunner(output_dir=str(tmp_path), retries=0, pool=DeviceSessionPool(connect_handler=FakeAsa()))
+    runner._output_path = lambda index, device, timestamp: str(tmp_path)  # A directory cannot be opened for writing.
+
+    [result] = runner.run([{"host": "192.0.2.1"}], ["show version"])
+
+    assert result["status"] == "failed"
+    assert result["error"].startswith("Cannot write")
+
+
+class SlowPool:
+    """A send_commands() stand-in that tracks how many devices, overall and per site, run at once."""
+
+    def __init__(self, seconds, failures=0):
+        self.seconds = seconds
+        self.failures = failures
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.sites = {}
+        self.site_peak = 0
+
+    def send_commands(self, device, commands):
+        site = device["host"].rsplit(".", 1)[0]
+        with self.lock:
+            self.running += 1
+            self.sites[site] = self.sites.get(site, 0) + 1
+            self.peak = max(self.peak, self.running)
+            self.site_peak = max(self.site_peak, self.sites[site])
+            fail = self.failures > 0
+            self.failures -= fail
+        time.sleep(self.seconds)
+        with self.lock:
+            self.running -= 1
+            self.sites[site] -= 1
+        if fail:
+            raise ConnectionError("connection refused")
+        return {command: "ok" for command in commands}
+
+
+def test_site_sorted_inventory_keeps_every_worker_busy(tmp_path):
+    devices = [{"host": f"10.0.{site}.{unit}", "site": f"site{site}"} for site in range(4) for unit in range(10)]
+    pool = SlowPool(0.05)
+    runner = FleetRunner(output_dir=str(tmp_path), max_workers=8, per_site_limit=2, pool=pool)
+
+    started = time.monotonic()
+    results = runner.run(devices, ["show version"])
+
+    assert all(result["status"] == "ok" for result in results)
+    assert pool.peak == 8 and pool.site_peak == 2
+    assert time.monotonic() - started < 0.5  # 40 devices / 8 workers x 0.05s = 0.25s
+
+
+def test_failed_devices_back_off_without_holding_a_worker(tmp_path):
+    devices = [{"host": f"10.0.0.{unit}", "site": "hq"} for unit in range(4)]
+    pool = SlowPool(0.01, failures=1)
+    runner = FleetRunner(output_dir=str(tmp_path), max_workers=1, per_site_limit=1, retries=1, backoff=0.2,
+                         pool=pool)
+
+    started = time.monotonic()
+    results = runner.run(devices, ["show version"])
+
+    assert sorted(result["attempts"] for result in results) == [1, 1, 1, 2]
+    assert all(result["status"] == "ok" for result in results)
+    assert results[-1]["attempts"] == 2  # The other devices went ahead during the back-off.
+    assert time.monotonic() - started < 0.4
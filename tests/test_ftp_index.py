@@ -0,0 +1,23 @@
+import pytest
+
+from ftp_index import FtpTreeIndex
+from ftp_server import FtpServerThread, LocalFtpServer
+from ftp_transfer import FtpConnectionPool
+
+
+def test_missing_root_raises_instead_of_caching_an_empty_tree(tmp_path):
+    remote = tmp_path / "remote"
+    (remote / "captures").mkdir(parents=True)
+    (remote / "captures" / "capture.txt").write_text("captured")
+    server = LocalFtpServer(str(remote))
+
+    with FtpServerThread(server) as port, FtpConnectionPool("127.0.0.1", "admin", "admin", port=port) as pool:
+        index = FtpTreeIndex(pool, str(tmp_path / "index.sqlite"))
+        with pytest.raises(IOError, match="/missing"):
+            index.refresh("/missing")
+        written = index.refresh("/captures")
+        roots = index.stats()["roots"]
+        index.close()
+
+    assert written == 1 and index.errors == []
+    assert list(roots) == ["/captures"]
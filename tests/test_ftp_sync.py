@@ -0,0 +1,38 @@
+import os
+import time
+
+import pytest
+
+from ftp_server import FtpServerThread, LocalFtpServer
+from ftp_sync import FtpSync
+from ftp_transfer import FtpConnectionPool, FtpTransferManager, facts_mtime, parse_list_lines
+
+
+@pytest.mark.parametrize("mlsd", [True, False])
+def test_changed_file_is_sent_even_if_the_remote_looks_current(tmp_path, mlsd):
+    local_dir = tmp_path / "local"
+    local_dir.mkdir()
+    capture = local_dir / "capture.txt"
+    capture.write_text("version 1")
+    server = LocalFtpServer(str(tmp_path / "remote"), mlsd=mlsd)
+    manifest = str(tmp_path / "manifest.json")
+
+    with FtpServerThread(server) as port, FtpConnectionPool("127.0.0.1", "admin", "admin", port=port) as pool:
+        first = FtpSync(FtpTransferManager(pool), manifest).push(str(local_dir), "/captures")
+        # Same size, older mtime than the remote copy: only the manifest can tell it changed.
+        capture.write_text("version 2")
+        past = time.time() - 3600
+        os.utime(capture, (past, past))
+        second = FtpSync(FtpTransferManager(pool), manifest).push(str(local_dir), "/captures")
+        third = FtpSync(FtpTransferManager(pool), manifest).push(str(local_dir), "/captures")
+
+    assert [result["status"] for result in first + second + third] == ["ok", "ok", "skipped"]
+    assert (tmp_path / "remote" / "captures" / "capture.txt").read_text() == "version 2"
+
+
+def test_list_times_are_local():
+    now = time.time()
+    stamp = time.strftime("%b %d %H:%M", time.localtime(now))
+    [(_, facts)] = parse_list_lines([f"-rw-r--r--    1 ftp      ftp            10 {stamp} capture.txt"], now)
+
+    assert abs(facts_mtime(facts) - now) < 60
@@ -0,0 +1,25 @@
+from ftp_server import FtpServerThread, LocalFtpServer
+from ftp_transfer import FtpConnectionPool, FtpTransferManager
+
+
+def test_missing_local_files_fail_without_retries(tmp_path):
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    (remote / "capture.txt").write_text("captured")
+    server = LocalFtpServer(str(remote))
+
+    with FtpServerThread(server) as port, FtpConnectionPool("127.0.0.1", "admin", "admin", port=port) as pool:
+        manager = FtpTransferManager(pool, retries=3)
+        missing = manager.upload_file(str(tmp_path / "missing.txt"), "/missing.txt")
+        opened_after_upload = pool.connections_opened
+        # Resuming into a file that is not there downloads the whole file.
+        resumed = manager.download_file("/capture.txt", str(tmp_path / "local" / "capture.txt"), offset=4)
+        reused = manager.download_file("/capture.txt", str(tmp_path / "again.txt"))
+
+    assert (missing["status"], missing["attempts"]) == ("failed", 0)
+    assert "missing.txt" in missing["error"]
+    assert opened_after_upload == 0
+    assert (resumed["status"], resumed["offset"], resumed["bytes"]) == ("ok", 0, len("captured"))
+    assert (tmp_path / "local" / "capture.txt").read_text() == "captured"
+    assert reused["status"] == "ok"
+    assert pool.connections_opened == 1
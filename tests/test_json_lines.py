@@ -0,0 +1,23 @@
+from main import JsonLinesReader, JsonLinesWriter
+
+
+def test_write_after_close_appends(tmp_path):
+    file_path = str(tmp_path / "results.jsonl")
+    writer = JsonLinesWriter(file_path)
+    with writer:
+        writer.write({"index": 0})
+    writer.write({"index": 1})
+    writer.close()
+
+    assert list(JsonLinesReader(file_path).iter_records()) == [{"index": 0}, {"index": 1}]
+    assert writer.records_written == 2
+
+
+def test_new_writer_replaces_the_file(tmp_path):
+    file_path = str(tmp_path / "results.jsonl")
+    with JsonLinesWriter(file_path) as writer:
+        writer.write({"index": 0})
+    with JsonLinesWriter(file_path) as writer:
+        writer.write({"index": 1})
+
+    assert list(JsonLinesReader(file_path).iter_records()) == [{"index": 1}]
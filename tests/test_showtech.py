@@ -0,0 +1,26 @@
+from showtech import ShowTechMetricsStore
+
+CAPTURE = """\
+Cisco Adaptive Security Appliance Software Version 9.16(2)
+------------------ show clock ------------------
+16:35:36.123 UTC Tue Feb 15 2022
+------------------ show conn count ------------------
+12 in use, 40 most used
+------------------ show clock ------------------
+16:40:00.000 UTC Tue Feb 15 2022
+------------------ show conn count ------------------
+15 in use, 40 most used
+"""
+
+
+def test_add_file_handles_repeated_sections(tmp_path):
+    capture = tmp_path / "show_tech.txt"
+    capture.write_text(CAPTURE)
+    store = ShowTechMetricsStore()
+
+    metrics = store.add_file(str(capture), device="asa1")
+
+    assert metrics == {"conn_in_use": 15.0, "conn_most_used": 40.0}
+    timestamps, values = store.column("asa1", "conn_in_use")
+    assert list(timestamps) == [1644942936.0]
+    assert list(values) == [15.0]
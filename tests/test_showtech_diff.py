@@ -0,0 +1,28 @@
+from showtech_diff import diff_running_config
+
+OLD = """\
+object-group network servers
+ network-object host 10.0.0.1
+ network-object host 10.0.0.2
+access-list outside_in extended deny ip host 192.0.2.1 any
+access-list outside_in extended permit ip any any
+"""
+
+
+def test_reordered_aces_are_a_change():
+    new = OLD.replace("deny ip host 192.0.2.1 any\naccess-list outside_in extended permit ip any any",
+                      "permit ip any any\naccess-list outside_in extended deny ip host 192.0.2.1 any")
+
+    result = diff_running_config(OLD, new)
+
+    change = result["changed"]["access-list outside_in"]
+    assert change["added"] == [] and change["removed"] == []
+    assert change["moved"] == ["access-list outside_in extended permit ip any any",
+                               "access-list outside_in extended deny ip host 192.0.2.1 any"]
+
+
+def test_object_group_member_order_is_ignored():
+    new = OLD.replace(" network-object host 10.0.0.1\n network-object host 10.0.0.2",
+                      " network-object host 10.0.0.2\n network-object host 10.0.0.1")
+
+    assert diff_running_config(OLD, new) is None
@@ -0,0 +1,24 @@
+from showtech_logging import LoggingBufferExtractor
+
+BUILT = ("Feb 15 2022 16:33:02 asa1 : %ASA-6-302013: Built inbound TCP connection 123 for "
+         "outside:1.1.1.1/80 (1.1.1.1/80) to inside:2.2.2.2/1024 (3.3.3.3/1024)")
+
+
+def test_feed_parses_fields_without_a_consumer():
+    extractor = LoggingBufferExtractor()
+
+    event = extractor.feed(BUILT)
+
+    assert event.message_id == "302013"
+    assert event.fields["direction"] == "inbound"
+    assert event.fields["connection_id"] == "123"
+
+
+def test_scan_lines_passes_parsed_events_to_the_consumer():
+    events = []
+    extractor = LoggingBufferExtractor(on_event=events.append)
+
+    extractor.scan_lines([BUILT, "not a syslog line"])
+
+    assert [event.fields["protocol"] for event in events] == ["TCP"]
+    assert extractor.unparsed_lines == 1
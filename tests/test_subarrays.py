@@ -0,0 +1,60 @@
+import random
+from array import array
+
+import pytest
+
+from subarrays import SubarrayCounter, count_subarrays, count_subarrays_batch
+
+THRESHOLDS = [1, 5, 10, 50, 200, 10_000]
+
+
+def naive_count(values, k):
+    count = 0
+    for left in range(len(values)):
+        total = 0
+        for right in range(left, len(values)):
+            total += values[right]
+            if total * (right - left + 1) < k:
+                count += 1
+    return count
+
+
+def test_documented_example(backend):
+    assert count_subarrays([2, 1, 4, 3, 5], 10) == 6
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 16, 17, 33, 1000])
+@pytest.mark.parametrize("seed", range(4))
+def test_batch_matches_brute_force(backend, chunk_size, seed):
+    rng = random.Random(seed)
+    values = [rng.choice((0, 0, 1, 2, 3, 7, 20)) for _ in range(rng.randint(0, 120))]
+    expected = [naive_count(values, k) for k in THRESHOLDS]
+    assert count_subarrays_batch(values, THRESHOLDS, chunk_size=chunk_size) == expected
+    assert count_subarrays_batch(array('q', values), THRESHOLDS, chunk_size=chunk_size) == expected
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_float_samples_in_uneven_chunks(backend, seed):
+    rng = random.Random(seed)
+    values = [rng.choice((0.0, 0.5, 1.25, 4.0)) for _ in range(90)]
+    counter = SubarrayCounter(THRESHOLDS)
+    start = 0
+    while start < len(values):
+        size = rng.randint(0, 12)
+        counter.feed(array('d', values[start:start + size]))
+        start += size
+    assert counter.samples == len(values)
+    assert counter.counts() == {k: naive_count(values, k) for k in THRESHOLDS}
+
+
+def test_integer_then_float_chunks(backend):
+    values = [3, 0, 1, 2.5, 0.5, 4, 1]
+    counter = SubarrayCounter([4, 12, 40])
+    counter.feed(values[:3])
+    counter.feed(values[3:])
+    assert counter.counts() == {k: naive_count(values, k) for k in (4, 12, 40)}
+
+
+def test_negative_values_are_rejected(backend):
+    with pytest.raises(ValueError):
+        SubarrayCounter([10]).feed([1, -1, 2])
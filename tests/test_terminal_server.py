@@ -0,0 +1,77 @@
+import asyncio
+
+from asa_simulator import SimulatedAsa, SimulatorThread
+from terminal_server import TerminalServerClient
+
+OUTPUTS = {
+    "show version": "Cisco Adaptive Security Appliance Software Version 9.16(2)",
+    "show clock": "16:35:36.123 UTC Tue Feb 15 2022",
+}
+
+
+def test_back_to_back_commands_on_console_line():
+    terminal_server = SimulatedAsa({}, hostname="ts", enable_password=None)
+    device = SimulatedAsa(OUTPUTS, username=None, enable_password=None)
+
+    async def collect(control_port, console_port):
+        client = TerminalServerClient("127.0.0.1", "admin", "admin", port=control_port, port_base=0)
+        async with client:
+            async with client.console(console_port, username=None) as session:
+                return [await session.send_command(command)
+                        for command in ("show version", "show clock", "show version")]
+
+    with SimulatorThread([terminal_server, device]) as ports:
+        outputs = asyncio.run(collect(*ports))
+    assert outputs == [OUTPUTS["show version"], OUTPUTS["show clock"], OUTPUTS["show version"]]
+    assert terminal_server.cleared_lines == [ports[1]]
+
+
+def test_concurrent_clear_line_after_control_drop():
+    terminal_server = SimulatedAsa({}, hostname="ts", enable_password=None)
+
+    async def clear(port):
+        client = TerminalServerClient("127.0.0.1", "admin", "admin", port=port)
+        async with client:
+            client.control.writer.close()
+            await asyncio.gather(*(client.clear_line(line) for line in (1, 2, 3, 4)))
+
+    with SimulatorThread([terminal_server]) as ports:
+        asyncio.run(clear(ports[0]))
+    assert sorted(terminal_server.cleared_lines) == [1, 2, 3, 4]
+
+
+def test_timed_out_control_session_is_replaced():
+    terminal_server = SimulatedAsa({}, hostname="ts", enable_password=None)
+
+    async def clear(port):
+        client = TerminalServerClient("127.0.0.1", "admin", "admin", port=port)
+        async with client:
+            stalled = client.control
+
+            async def time_out(line, timeout=None):
+                raise TimeoutError("No expected prompt")
+
+            stalled.clear_line = time_out
+            await client.clear_line(1)
+            return stalled, client.control
+
+    with SimulatorThread([terminal_server]) as ports:
+        stalled, control = asyncio.run(clear(ports[0]))
+    assert stalled.writer is None
+    assert control is not stalled
+    assert terminal_server.cleared_lines == [1]
+
+
+def test_failed_login_leaves_no_control_session():
+    terminal_server = SimulatedAsa({}, hostname="ts", enable_password=None)
+
+    async def open_client(port):
+        client = TerminalServerClient("127.0.0.1", "admin", "wrong", port=port)
+        try:
+            await client.open()
+        except PermissionError:
+            return client.control
+        raise AssertionError("login with a wrong password succeeded")
+
+    with SimulatorThread([terminal_server]) as ports:
+        assert asyncio.run(open_client(ports[0])) is None
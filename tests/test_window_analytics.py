@@ -0,0 +1,126 @@
+import random
+import time
+
+import pytest
+
+from window_analytics import (
+    EventRateStream,
+    SlidingWindow,
+    count_windows_over,
+    sliding_maxes,
+    sliding_means,
+    sliding_sums,
+)
+
+WIDTHS = [1, 2, 3, 7, 16, 40]
+
+
+def naive_windows(values, width):
+    return [values[end - width + 1:end + 1] for end in range(width - 1, len(values))]
+
+
+def naive_subarray_count(values, k):
+    return sum(1 for left in range(len(values)) for right in range(left, len(values))
+               if sum(values[left:right + 1]) * (right - left + 1) < k)
+
+
+def random_series(seed, size):
+    rng = random.Random(seed)
+    return [rng.choice((0, 0, 1, 2, 5, 9)) for _ in range(size)]
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+@pytest.mark.parametrize("size", [0, 1, 15, 16, 17, 100])
+def test_batch_functions_match_brute_force(backend, width, size):
+    values = random_series(width * 1000 + size, size)
+    windows = naive_windows(values, width)
+    assert list(sliding_sums(values, width)) == [float(sum(window)) for window in windows]
+    assert list(sliding_means(values, width)) == pytest.approx([sum(window) / width for window in windows])
+    assert list(sliding_maxes(values, width)) == [float(max(window)) for window in windows]
+    assert count_windows_over(values, width, 10) == sum(1 for window in windows if sum(window) > 10)
+
+
+def test_batch_functions_reject_empty_windows(backend):
+    for function in (sliding_sums, sliding_maxes):
+        with pytest.raises(ValueError):
+            function([1, 2, 3], 0)
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+def test_sliding_window_matches_brute_force(backend, width):
+    values = random_series(width, 90)
+    thresholds = [5, 60, 900]
+    window = SlidingWindow(width=width, budget=12, thresholds=thresholds)
+    peak_sum = peak_end = None
+    breaches = 0
+    for index, value in enumerate(values):
+        window.push(value)
+        current = values[max(0, index - width + 1):index + 1]
+        assert window.sum == sum(current)
+        assert window.max == max(current)
+        assert window.mean == pytest.approx(sum(current) / len(current))
+        if index >= width - 1:
+            if peak_sum is None or sum(current) > peak_sum:
+                peak_sum, peak_end = sum(current), index
+            breaches += sum(current) > 12
+    summary = window.summary()
+    assert (summary["peak_sum"], summary["peak_end"], summary["breaches"]) == (peak_sum, peak_end, breaches)
+    assert summary["subarray_counts"] == {k: naive_subarray_count(values, k) for k in thresholds}
+
+
+@pytest.mark.parametrize("gap", [0, 1, 4, 5, 6, 37])
+def test_push_zeros_matches_pushing_each_zero(backend, gap):
+    rng = random.Random(gap)
+    bulk = SlidingWindow(width=5, budget=3, thresholds=[4, 30, 500])
+    single = SlidingWindow(width=5, budget=3, thresholds=[4, 30, 500])
+    for _ in range(3):
+        values = [rng.randint(0, 4) for _ in range(rng.randint(1, 9))]
+        bulk.extend(values)
+        single.extend(values)
+        bulk.push_zeros(gap)
+        single.extend([0] * gap)
+        assert bulk.summary() == single.summary()
+        assert bulk.max == single.max
+
+
+def test_huge_gap_costs_the_window_width(backend):
+    window = SlidingWindow(width=300, budget=2)
+    stream = EventRateStream([window])
+    stream.add(0.0, 5)
+    started = time.perf_counter()
+    stream.add(1e9)
+    stream.flush()
+    assert time.perf_counter() - started < 1.0
+    assert window.samples == 1_000_000_001
+    assert (window.sum, window.max, window.peak_sum, window.peak_end, window.breaches) == (1.0, 1.0, 5.0, 299, 1)
+
+
+def test_max_gap_counts_skipped_buckets():
+    window = SlidingWindow(width=10)
+    stream = EventRateStream([window], max_gap=100)
+    stream.add(0.0)
+    stream.add(1000.0)
+    stream.flush()
+    assert (window.samples, stream.skipped_buckets) == (102, 899)
+
+
+def test_event_rate_stream_matches_bucketed_counts(backend):
+    rng = random.Random(7)
+    times = sorted(rng.uniform(0, 60) for _ in range(200))
+    times[50], times[51] = times[51] - 5, times[50]  # One late line.
+    streamed = SlidingWindow(width=4, budget=15, thresholds=[10, 100])
+    stream = EventRateStream([streamed], interval=2.0)
+    for timestamp in times:
+        stream.add(timestamp)
+    stream.flush()
+
+    first = int(times[0] // 2)
+    buckets = [0] * (int(max(times) // 2) - first + 1)
+    current = first
+    for timestamp in times:
+        current = max(current, int(timestamp // 2))  # Late events count in the bucket in progress.
+        buckets[current - first] += 1
+    expected = SlidingWindow(width=4, budget=15, thresholds=[10, 100])
+    expected.extend(buckets)
+    assert stream.late_events == 1
+    assert streamed.summary() == expected.summary()
@@ -0,0 +1,432 @@
+import argparse
+import asyncio
+import re
+import signal
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from load_metrics import LoadMetrics
+from main import CsvFileWriter
+
+# Output of the stand-in client (and what the default patterns look for).
+CONNECTED_LINE = "CONNECTED"
+BYTES_LINE_REGEX = re.compile(r"^BYTES (\d+)")
+
+# The stand-in client, run as a subprocess like any real VPN client.
+STAND_IN_CLIENT_COMMAND = [sys.executable, __file__, "client", "--host", "{server}", "--port", "{port}",
+                           "--username", "{username}"]
+
+
+def linear_ramp(clients: int, ramp_seconds: float) -> List[float]:
+    """
+    Return start offsets that bring clients up evenly over ramp_seconds.
+    """
+    if clients <= 1 or ramp_seconds <= 0:
+        return [0.0] * clients
+    return [ramp_seconds * index / (clients - 1) for index in range(clients)]
+
+
+def step_ramp(steps: Sequence[Tuple[float, int]]) -> List[float]:
+    """
+    Return start offsets for a stepped ramp.
+
+    Args:
+        steps: (seconds from start, clients started at that moment) pairs, e.g. [(0, 10), (30, 20), (60, 20)].
+    """
+    return [float(at) for at, count in steps for _ in range(count)]
+
+
+class VpnLoadGenerator:
+    """
+    Launch many concurrent VPN client sessions as subprocesses and measure them.
+
+    The client is any command line (openconnect, a vendor CLI, or the
+    stand-in client of this module), given as an argument list whose items may
+    contain {server}, {port}, {username}, {password} and {session}
+    placeholders. Clients are started with asyncio subprocesses, without a
+    shell, at the offsets of a ramp schedule. Each session is considered up
+    when a line of its output matches ``connected_regex``; it is held for
+    ``hold_seconds`` and then terminated. Transferred bytes are taken from
+    output lines matching ``bytes_regex`` (the last value wins).
+
+    Example:
+        >>> generator = VpnLoadGenerator(["openconnect", "--user={username}", "--passwd-on-stdin", "{server}"],
+        ...                              server="vpn.example.com", username="testuser", password="testpass",
+        ...                              stdin_template="{password}\\n", connected_regex=r"Established DTLS")
+        >>> results = generator.run(linear_ramp(50, ramp_seconds=60))
+    """
+
+    def __init__(
+        self,
+        client_command: Sequence[str],
+        server: str,
+        username: str,
+        password: str = "",
+        port: int = 443,
+        stdin_template: Optional[str] = None,
+        connected_regex: str = f"^{CONNECTED_LINE}",
+        bytes_regex: Optional[str] = BYTES_LINE_REGEX.pattern,
+        connect_timeout: float = 30.0,
+        hold_seconds: float = 10.0,
+        metrics: Optional[LoadMetrics] = None,
+    ):
+        """
+        Initialize the VpnLoadGenerator.
+
+        Args:
+            client_command (list): Client argument list with optional placeholders.
+            server (str): VPN headend address.
+            username (str): Login user ({session} in it gives each session its own user).
+            password (str): Login password, substituted into the command or stdin_template.
+            port (int): Headend port. Default is 443.
+            stdin_template (str, optional): Text written to the client's stdin, e.g. "{password}\\n".
+            connected_regex (str): Output line that marks the session as connected.
+            bytes_regex (str, optional): Output line whose group 1 is the bytes transferred so far.
+            connect_timeout (float): Seconds allowed until connected. Default is 30.
+            hold_seconds (float): Seconds a session stays up after connecting. Default is 10.
+            metrics (LoadMetrics, optional): Also record each session's connect latency and bytes here.
+        """
+        self.client_command = list(client_command)
+        self.server = server
+        self.username = username
+        self.password = password
+        self.port = port
+        self.stdin_template = stdin_template
+        self.connected_regex = re.compile(connected_regex)
+        self.bytes_regex = re.compile(bytes_regex) if bytes_regex else None
+        self.connect_timeout = connect_timeout
+        self.hold_seconds = hold_seconds
+        self.metrics = metrics
+
+    def _render(self, template: str, session: int) -> str:
+        values = {"server": self.server, "port": self.port, "password": self.password, "session": session}
+        values["username"] = self.username.format(**values)
+        return template.format(**values)
+
+    async def _watch(self, process: asyncio.subprocess.Process, result: Dict[str, Any],
+                     connected: asyncio.Event, started: float) -> None:
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                return
+            text = line.decode("utf-8", "replace").strip()
+            if not connected.is_set():
+                result["last_line"] = text
+            if not connected.is_set() and self.connected_regex.search(text):
+                result["connect_seconds"] = round(time.perf_counter() - started, 4)
+                connected.set()
+            elif self.bytes_regex is not None:
+                match = self.bytes_regex.search(text)
+                if match:
+                    result["bytes"] = max(result["bytes"], int(match.group(1)))
+
+    @staticmethod
+    async def _stop(process: asyncio.subprocess.Process, grace: float = 5.0) -> None:
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), grace)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    async def session(self, session: int, delay: float = 0.0) -> Dict[str, Any]:
+        """
+        Run one client session after delay seconds.
+
+        Returns:
+            Dict[str, Any]: session, start_offset, status, connect_seconds (from process start), bytes,
+            seconds (time connected), throughput_bps, exit_code and error (the client's last line if it
+            never connected). Status is "ok" (held until stopped), "exited" (the client quit while
+            connected), "failed" (it quit before connecting) or "connect_timeout".
+        """
+        await asyncio.sleep(delay)
+        result: Dict[str, Any] = {"session": session, "start_offset": round(delay, 3), "status": "failed",
+                                  "connect_seconds": None, "bytes": 0, "seconds": 0.0, "throughput_bps": 0.0,
+                                  "exit_code": None, "error": ""}
+        argv = [self._render(argument, session) for argument in self.client_command]
+        started = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.PIPE if self.stdin_template else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+        except OSError as e:
+            result["error"] = str(e)
+            return result
+        if self.stdin_template:
+            process.stdin.write(self._render(self.stdin_template, session).encode("utf-8"))
+            await process.stdin.drain()
+            process.stdin.close()
+
+        connected = asyncio.Event()
+        watcher = asyncio.ensure_future(self._watch(process, result, connected, started))
+        exited = asyncio.ensure_future(process.wait())
+        try:
+            waiter = asyncio.ensure_future(connected.wait())
+            await asyncio.wait({waiter, exited}, timeout=self.connect_timeout, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+            if not connected.is_set():
+                result["status"] = "failed" if exited.done() else "connect_timeout"
+            else:
+                up = time.perf_counter()
+                await asyncio.wait({exited}, timeout=self.hold_seconds)
+                result["status"] = "exited" if exited.done() else "ok"
+                result["seconds"] = round(time.perf_counter() - up, 3)
+        finally:
+            await self._stop(process)
+            await asyncio.wait({watcher}, timeout=5)
+            watcher.cancel()
+        result["exit_code"] = process.returncode
+        last_line = result.pop("last_line", "")
+        if result["connect_seconds"] is None:
+            result["error"] = last_line or result["status"]
+        if result["seconds"]:
+            result["throughput_bps"] = round(result["bytes"] * 8 / result["seconds"], 1)
+        if self.metrics is not None:
+            connect_seconds = result["connect_seconds"]
+            self.metrics.record(time.perf_counter() - started if connect_seconds is None else connect_seconds,
+                                ok=result["status"] in ("ok", "exited"), nbytes=result["bytes"])
+        return result
+
+    async def run_async(self, start_offsets: Sequence[float]) -> List[Dict[str, Any]]:
+        """
+        Run one session per start offset, concurrently.
+
+        Returns:
+            List[Dict[str, Any]]: session() results, in session order.
+        """
+        return list(await asyncio.gather(*(self.session(index, delay) for index, delay in enumerate(start_offsets))))
+
+    def run(self, start_offsets: Sequence[float]) -> List[Dict[str, Any]]:
+        """
+        Blocking wrapper around run_async().
+        """
+        return asyncio.run(self.run_async(start_offsets))
+
+
+def summarize_sessions(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize session results: counts per status, connect latency percentiles and total throughput.
+    """
+    statuses: Dict[str, int] = {}
+    for result in results:
+        statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+    latencies = sorted(result["connect_seconds"] for result in results if result["connect_seconds"] is not None)
+
+    def percentile(p: float) -> Optional[float]:
+        if not latencies:
+            return None
+        return round(latencies[min(int(round(p / 100.0 * (len(latencies) - 1))), len(latencies) - 1)] * 1000, 2)
+
+    return {
+        "sessions": len(results),
+        "statuses": statuses,
+        "connect_p50_ms": percentile(50),
+        "connect_p99_ms": percentile(99),
+        "bytes": sum(result["bytes"] for result in results),
+        "throughput_bps": round(sum(result["throughput_bps"] for result in results), 1),
+    }
+
+
+class VpnStandInServer:
+    """
+    A local stand-in VPN headend for load tests without real hardware.
+
+    Clients send "AUTH <username>"; after ``handshake_latency`` seconds
+    (emulating TLS and AAA) the server answers "OK" and then streams
+    ``session_rate`` bytes per second until the client disconnects. Beyond
+    ``max_sessions`` concurrent sessions it answers "BUSY", so capacity
+    limits show up as failures in the load test.
+
+    Example:
+        >>> server = VpnStandInServer(handshake_latency=0.2, max_sessions=40)
+        >>> with server.running() as port:
+        ...     generator = VpnLoadGenerator(STAND_IN_CLIENT_COMMAND, "127.0.0.1", "user{session}", port=port)
+    """
+
+    def __init__(self, handshake_latency: float = 0.1, session_rate: int = 256 * 1024, max_sessions: int = 1000,
+                 host: str = "127.0.0.1"):
+        """
+        Initialize the VpnStandInServer.
+
+        Args:
+            handshake_latency (float): Seconds before a session is accepted. Default is 0.1.
+            session_rate (int): Bytes per second streamed to each session. Default is 256 KiB.
+            max_sessions (int): Concurrent sessions accepted. Default is 1000.
+            host (str): Listening address. Default is "127.0.0.1".
+        """
+        self.handshake_latency = handshake_latency
+        self.session_rate = session_rate
+        self.max_sessions = max_sessions
+        self.host = host
+        self.active = 0
+        self.peak = 0
+        self.rejected = 0
+        self._sessions: set = set()
+        self._closing = False
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one client session.
+        """
+        self._sessions.add(asyncio.current_task())
+        try:
+            line = await reader.readline()
+            if not line.startswith(b"AUTH "):
+                writer.write(b"ERROR\n")
+                return
+            await asyncio.sleep(self.handshake_latency)
+            if self.active >= self.max_sessions:
+                self.rejected += 1
+                writer.write(b"BUSY\n")
+                return
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                writer.write(b"OK\n")
+                chunk = b"\0" * max(1, self.session_rate // 10)
+                while not reader.at_eof() and not self._closing:
+                    writer.write(chunk)
+                    await writer.drain()
+                    await asyncio.sleep(0.1)
+            finally:
+                self.active -= 1
+        except ConnectionError:
+            pass
+        finally:
+            self._sessions.discard(asyncio.current_task())
+            writer.close()
+
+    async def close_sessions(self) -> None:
+        """
+        End every session still being served.
+        """
+        self._closing = True
+        if self._sessions:
+            await asyncio.wait(list(self._sessions), timeout=5)
+
+    def running(self) -> "_ServerThread":
+        """
+        Return a context manager that serves in a background thread and yields the bound port.
+        """
+        return _ServerThread(self)
+
+
+class _ServerThread:
+    def __init__(self, server: VpnStandInServer):
+        self.server = server
+        self._loop = asyncio.new_event_loop()
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._stop: Optional[asyncio.Event] = None
+        self.port = 0
+
+    async def _serve(self) -> None:
+        self._stop = asyncio.Event()
+        listener = await asyncio.start_server(self.server.handle, self.server.host, 0, backlog=1024)
+        self.port = listener.sockets[0].getsockname()[1]
+        self._ready.set()
+        await self._stop.wait()
+        listener.close()
+        await self.server.close_sessions()
+        await listener.wait_closed()
+
+    def __enter__(self) -> int:
+        self._thread = threading.Thread(target=self._loop.run_until_complete, args=(self._serve(),), daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self.port
+
+    def __exit__(self, *exc_info) -> None:
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+
+async def stand_in_client(host: str, port: int, username: str) -> int:
+    """
+    The stand-in VPN client: authenticate, print CONNECTED, then print "BYTES <n>" every second
+    and once more when the server closes or the process is asked to terminate.
+
+    Returns:
+        int: Process exit code (0 after a session, 1 if the server refused it).
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"AUTH {username}\n".encode())
+    reply = await reader.readline()
+    if reply.strip() != b"OK":
+        print(f"REFUSED {reply.decode().strip()}", flush=True)
+        return 1
+    print(CONNECTED_LINE, flush=True)
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    except (NotImplementedError, AttributeError):
+        pass  # Windows: terminate() kills the client outright; the last periodic report stands.
+    received = [0]
+
+    async def pump() -> None:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            received[0] += len(data)
+        stop.set()
+
+    pumping = asyncio.ensure_future(pump())
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), 1.0)
+        except asyncio.TimeoutError:
+            pass
+        print(f"BYTES {received[0]}", flush=True)
+    pumping.cancel()
+    writer.close()
+    return 0
+
+
+# Example Usage
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description="VPN load generator and its local stand-in headend.")
+    modes = arguments.add_subparsers(dest="mode")
+    run_mode = modes.add_parser("run", help="Load-test the local stand-in headend.")
+    run_mode.add_argument("--clients", type=int, default=50)
+    run_mode.add_argument("--ramp", type=float, default=5.0, help="Seconds to bring all clients up.")
+    run_mode.add_argument("--hold", type=float, default=5.0)
+    run_mode.add_argument("--capacity", type=int, default=1000)
+    run_mode.add_argument("--csv", help="Also write per-session results to this CSV file.")
+    run_mode.add_argument("--json", help="Also write latency percentiles and the per-second series to this file.")
+    client_mode = modes.add_parser("client", help="Stand-in VPN client (started by the generator).")
+    client_mode.add_argument("--host", required=True)
+    client_mode.add_argument("--port", type=int, required=True)
+    client_mode.add_argument("--username", default="user")
+    options = arguments.parse_args()
+
+    if options.mode == "client":
+        try:
+            sys.exit(asyncio.run(stand_in_client(options.host, options.port, options.username)))
+        except (KeyboardInterrupt, ConnectionError):
+            sys.exit(1)
+
+    try:
+        headend = VpnStandInServer(max_sessions=getattr(options, "capacity", 1000))
+        metrics = LoadMetrics()
+        with headend.running() as headend_port:
+            generator = VpnLoadGenerator(STAND_IN_CLIENT_COMMAND, "127.0.0.1", "user{session}", port=headend_port,
+                                         hold_seconds=getattr(options, "hold", 5.0), metrics=metrics)
+            sessions = generator.run(linear_ramp(getattr(options, "clients", 50), getattr(options, "ramp", 5.0)))
+        print(summarize_sessions(sessions), f"peak sessions {headend.peak}")
+        if getattr(options, "csv", None):
+            CsvFileWriter(options.csv).write(sessions, include_header=True)
+        if getattr(options, "json", None):
+            metrics.write_json(options.json)
+    except Exception as e:
+        print(f"[-] Error: {e}")
@@ -0,0 +1,404 @@
+import calendar
+import math
+import re
+from array import array
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from showtech import MONTHS
+from subarrays import DEFAULT_CHUNK, SubarrayCounter
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, array.array + pure Python is the fallback
+    np = None
+
+# LogEvent.timestamp, e.g. "Feb 15 2022 16:33:02"
+EVENT_TIME_REGEX = re.compile(r"(\w{3}) +(\d{1,2}) (\d{4}) (\d{2}):(\d{2}):(\d{2})")
+COUNTER_CHUNK = 4096
+
+
+def parse_event_time(timestamp: str) -> Optional[float]:
+    """
+    Convert a syslog timestamp ("Feb 15 2022 16:33:02") into a UTC epoch.
+
+    Returns:
+        Optional[float]: Seconds since the epoch, or None if the text is not a timestamp.
+    """
+    match = EVENT_TIME_REGEX.match(timestamp)
+    if not match:
+        return None
+    month, day, year, hour, minute, second = match.groups()
+    month_number = MONTHS.get(month.title())
+    if month_number is None:
+        return None
+    return float(calendar.timegm(
+        (int(year), month_number, int(day), int(hour), int(minute), int(second), 0, 0, 0)
+    ))
+
+
+def sliding_sums(values: Any, width: int) -> Any:
+    """
+    Return the sum of every full window of width samples (n - width + 1 values), in O(n).
+
+    Returns a NumPy array when NumPy is installed and an array('d') otherwise.
+
+    Raises:
+        ValueError: If width is not positive.
+    """
+    if width < 1:
+        raise ValueError("Window width must be at least 1.")
+    if np is not None:
+        prefix = np.concatenate(([0.0], np.cumsum(np.asarray(values, dtype=np.float64))))
+        return prefix[width:] - prefix[:-width] if prefix.size > width else prefix[:0]
+    sums = array('d')
+    window = 0.0
+    for index, value in enumerate(values):
+        window += value
+        if index >= width:
+            window -= values[index - width]
+        if index >= width - 1:
+            sums.append(window)
+    return sums
+
+
+def sliding_means(values: Any, width: int) -> Any:
+    """
+    Return the mean of every full window of width samples, in O(n).
+    """
+    sums = sliding_sums(values, width)
+    if np is not None:
+        return sums / width
+    return array('d', (total / width for total in sums))
+
+
+def sliding_maxes(values: Any, width: int) -> Any:
+    """
+    Return the maximum of every full window of width samples, in O(n).
+
+    With NumPy this is the van Herk/Gil-Werman scheme: running maxima within
+    blocks of width samples, forwards and backwards, and every window is
+    the larger of one backward and one forward running maximum. Without it,
+    a monotonic deque holds the candidates for the current maximum.
+
+    Raises:
+        ValueError: If width is not positive.
+    """
+    if width < 1:
+        raise ValueError("Window width must be at least 1.")
+    if np is not None:
+        values = np.asarray(values, dtype=np.float64)
+        count = values.size - width + 1
+        if count <= 0:
+            return values[:0]
+        padded = np.full(-(-values.size // width) * width, -np.inf)
+        padded[:values.size] = values
+        blocks = padded.reshape(-1, width)
+        forward = np.maximum.accumulate(blocks, axis=1).ravel()
+        backward = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+        return np.maximum(backward[:count], forward[width - 1:width - 1 + count])
+    maxes = array('d')
+    candidates: deque = deque()
+    for index, value in enumerate(values):
+        while candidates and values[candidates[-1]] <= value:
+            candidates.pop()
+        candidates.append(index)
+        if candidates[0] <= index - width:
+            candidates.popleft()
+        if index >= width - 1:
+            maxes.append(values[candidates[0]])
+    return maxes
+
+
+def count_windows_over(values: Any, width: int, limit: float) -> int:
+    """
+    Count the full windows of width samples whose sum exceeds limit (e.g. SLA error budget burns), in O(n).
+    """
+    sums = sliding_sums(values, width)
+    if np is not None:
+        return int(np.count_nonzero(sums > limit))
+    return sum(1 for total in sums if total > limit)
+
+
+class SlidingWindow:
+    """
+    Streaming analytics over the last ``width`` samples of a series.
+
+    Every push() is O(1) (amortized): the window lives in a fixed ring
+    buffer (``array('d')``), the sum is kept running, and the maximum comes
+    from a monotonic deque of candidate positions. Alongside the current
+    window it tracks the worst window sum seen, how many full windows broke
+    a budget, and, through subarrays.SubarrayCounter, the number of windows
+    of any length with sum x length < k for each threshold.
+
+    Example:
+        >>> window = SlidingWindow(width=300, budget=50, thresholds=[1000])
+        >>> window.extend(failures_per_second)
+        >>> print(window.summary())
+    """
+
+    def __init__(self, width: int, budget: Optional[float] = None, thresholds: Iterable[float] = ()):
+        """
+        Initialize the SlidingWindow.
+
+        Args:
+            width (int): Samples per window, e.g. 300 one-second buckets for 5 minutes.
+            budget (float, optional): Count full windows whose sum exceeds this.
+            thresholds (iterable): k values for qualifying-subarray counts (sum x length < k).
+
+        Raises:
+            ValueError: If width is not positive.
+        """
+        if width < 1:
+            raise ValueError("Window width must be at least 1.")
+        self.width = width
+        self.budget = budget
+        self.samples = 0
+        self.breaches = 0
+        self.peak_sum: Optional[float] = None
+        self.peak_end: Optional[int] = None
+        self._ring = array('d', bytes(8 * width))
+        self._sum = 0.0
+        self._candidates: deque = deque()  # (index, value), values decreasing.
+        self._counter = SubarrayCounter(thresholds) if thresholds else None
+        self._pending = array('d')
+
+    def push(self, value: float) -> None:
+        """
+        Add the next sample.
+        """
+        index = self.samples
+        slot = index % self.width
+        self._sum += value - self._ring[slot]
+        self._ring[slot] = value
+        self.samples = index + 1
+        if slot == self.width - 1:
+            self._sum = math.fsum(self._ring)  # Once per lap, so float drift cannot build up.
+
+        candidates = self._candidates
+        while candidates and candidates[-1][1] <= value:
+            candidates.pop()
+        candidates.append((index, value))
+        if candidates[0][0] <= index - self.width:
+            candidates.popleft()
+
+        if self.samples >= self.width:
+            if self.peak_sum is None or self._sum > self.peak_sum:
+                self.peak_sum, self.peak_end = self._sum, index
+            if self.budget is not None and self._sum > self.budget:
+                self.breaches += 1
+        if self._counter is not None:
+            self._pending.append(value)
+            if len(self._pending) >= COUNTER_CHUNK:
+                self._flush()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Add samples in order.
+        """
+        push = self.push
+        for value in values:
+            push(value)
+
+    def push_zeros(self, count: int) -> None:
+        """
+        Add count zero samples, e.g. the empty intervals of a gap in an event stream.
+
+        Only the first width zeros go through push(); after them the window
+        holds nothing but zeros, so the ring, sum and maximum are reset for
+        the rest of the run in O(width), and a subarray counter gets it in
+        chunks instead of sample by sample.
+        """
+        lead = min(count, self.width)
+        for _ in range(lead):
+            self.push(0.0)
+        rest = count - lead
+        if rest <= 0:
+            return
+        first = self.samples
+        self.samples += rest
+        self._ring = array('d', bytes(8 * self.width))
+        self._sum = 0.0
+        self._candidates = deque([(self.samples - 1, 0.0)])
+        if self.peak_sum is None or self.peak_sum < 0.0:
+            self.peak_sum, self.peak_end = 0.0, first
+        if self.budget is not None and self.budget < 0.0:
+            self.breaches += rest
+        if self._counter is not None:
+            self._flush()
+            for start in range(0, rest, DEFAULT_CHUNK):
+                size = min(DEFAULT_CHUNK, rest - start)
+                self._counter.feed(np.zeros(size, dtype=np.int64) if np is not None else array('q', bytes(8 * size)))
+
+    def _flush(self) -> None:
+        if self._counter is not None and self._pending:
+            self._counter.feed(self._pending)
+            self._pending = array('d')
+
+    @property
+    def sum(self) -> float:
+        """Sum of the current window (the last width samples, or fewer at the start)."""
+        return self._sum
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of the current window."""
+        filled = min(self.samples, self.width)
+        return self._sum / filled if filled else None
+
+    @property
+    def max(self) -> Optional[float]:
+        """Maximum of the current window."""
+        return self._candidates[0][1] if self._candidates else None
+
+    def subarray_counts(self) -> Dict[float, int]:
+        """
+        Return threshold -> number of windows (any length) with sum x length < k seen so far.
+        """
+        self._flush()
+        return self._counter.counts() if self._counter is not None else {}
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the current window statistics, the worst window and the budget breaches.
+        """
+        return {
+            "samples": self.samples,
+            "width": self.width,
+            "sum": self.sum,
+            "mean": self.mean,
+            "max": self.max,
+            "peak_sum": self.peak_sum,
+            "peak_end": self.peak_end,
+            "breaches": self.breaches,
+            "subarray_counts": self.subarray_counts(),
+        }
+
+
+class EventRateStream:
+    """
+    Turn a stream of timestamped events into per-interval counts for SlidingWindow.
+
+    Designed as the ``on_event`` callback of showtech_logging's
+    LoggingBufferExtractor: every accepted event adds one to its interval's
+    bucket, and when time moves on the finished bucket (plus a zero for
+    every empty interval in between, see SlidingWindow.push_zeros) is
+    pushed into each window. Syslog
+    timestamps repeat for every event in the same second, so the last one
+    parsed is cached.
+
+    Example:
+        >>> failures = SlidingWindow(width=300, budget=100)
+        >>> stream = EventRateStream([failures], predicate=lambda event: event.severity <= 3)
+        >>> LoggingBufferExtractor(on_event=stream.on_event).scan_show_tech("show_tech.txt")
+        >>> stream.flush()
+        >>> print(failures.summary())
+    """
+
+    def __init__(self, windows: List[SlidingWindow], interval: float = 1.0,
+                 predicate: Optional[Callable[[Any], bool]] = None, max_gap: Optional[int] = None):
+        """
+        Initialize the EventRateStream.
+
+        Args:
+            windows (list): SlidingWindow objects that receive every finished bucket.
+            interval (float): Bucket length in seconds. Default is 1.
+            predicate (callable, optional): Count only events for which it returns True.
+            max_gap (int, optional): Most empty intervals pushed for one gap; the rest are
+                counted in skipped_buckets (e.g. after a clock jump). Default is None (no cap).
+        """
+        self.windows = windows
+        self.interval = interval
+        self.predicate = predicate
+        self.max_gap = max_gap
+        self.late_events = 0
+        self.skipped_buckets = 0
+        self.undated_events = 0
+        self.first_bucket: Optional[int] = None
+        self._bucket: Optional[int] = None
+        self._count = 0
+        self._last_text: Optional[str] = None
+        self._last_time: Optional[float] = None
+
+    def add(self, timestamp: float, count: int = 1) -> None:
+        """
+        Count events at an epoch timestamp.
+
+        Events older than the current bucket (out-of-order lines) are added to it and counted in late_events.
+        """
+        bucket = int(timestamp // self.interval)
+        if self._bucket is None:
+            self._bucket = self.first_bucket = bucket
+        elif bucket > self._bucket:
+            self._emit(self._count)
+            gap = bucket - self._bucket - 1
+            if self.max_gap is not None and gap > self.max_gap:
+                self.skipped_buckets += gap - self.max_gap
+                gap = self.max_gap
+            for window in self.windows:
+                window.push_zeros(gap)
+            self._bucket, self._count = bucket, 0
+        elif bucket < self._bucket:
+            self.late_events += count
+        self._count += count
+
+    def on_event(self, event: Any) -> None:
+        """
+        Count a LogEvent (or anything with a syslog-style ``timestamp``) if it passes the predicate.
+        """
+        if self.predicate is not None and not self.predicate(event):
+            return
+        if event.timestamp != self._last_text:
+            self._last_text = event.timestamp
+            self._last_time = parse_event_time(event.timestamp) if event.timestamp else None
+        if self._last_time is None:
+            self.undated_events += 1
+            return
+        self.add(self._last_time)
+
+    def _emit(self, count: int) -> None:
+        for window in self.windows:
+            window.push(count)
+
+    def flush(self) -> None:
+        """
+        Push the bucket in progress; call once the stream has ended.
+        """
+        if self._bucket is not None:
+            self._emit(self._count)
+            self._bucket, self._count = None, 0
+
+
+def window_series(store: Any, device: str, metric: str, width: int,
+                  budget: Optional[float] = None) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Run a ShowTechMetricsStore series (one sample per capture) through the batch window functions.
+
+    Returns:
+        Tuple: (capture timestamps at each full window's end, {"sums", "means", "maxes", "over_budget"}).
+    """
+    timestamps, values = store.column(device, metric)
+    result = {
+        "sums": sliding_sums(values, width),
+        "means": sliding_means(values, width),
+        "maxes": sliding_maxes(values, width),
+        "over_budget": count_windows_over(values, width, budget) if budget is not None else None,
+    }
+    return timestamps[width - 1:], result
+
+
+# Example Usage
+if __name__ == "__main__":
+    from showtech_logging import LoggingBufferExtractor
+
+    try:
+        per_minute = SlidingWindow(width=60, budget=3, thresholds=[1_000, 10_000])
+        per_five_minutes = SlidingWindow(width=300)
+        stream = EventRateStream([per_minute, per_five_minutes], predicate=lambda event: event.severity <= 5)
+        extractor = LoggingBufferExtractor(on_event=stream.on_event)
+        extractor.scan_show_tech("693110730-show_tech_Malathi.txt")
+        stream.flush()
+        print("1 minute windows:", per_minute.summary())
+        print("5 minute windows:", per_five_minutes.summary())
+    except Exception as e:
+        print(f"[-] Error: {e}")